@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Capture latency benchmark for UnifyVision
+Compares opening mss per grab (previous behaviour) with a persistent CaptureSession
+
+Run on a 4K virtual display:
+    Xvfb :99 -screen 0 3840x2160x24 &
+    DISPLAY=:99 python -m benchmarks.bench_capture --grabs 100
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+import mss
+
+from src.screen_capture import CaptureSession
+
+
+def measure(grab: Callable[[], object], grabs: int, warmup: int) -> List[float]:
+    """
+    Measures the latency of repeated grabs
+
+    Args:
+        grab: Callable performing one full-screen grab
+        grabs: Number of measured grabs
+        warmup: Number of unmeasured warmup grabs
+
+    Returns:
+        List of latencies in milliseconds
+    """
+    for _ in range(warmup):
+        grab()
+
+    samples = []
+    for _ in range(grabs):
+        start = time.perf_counter()
+        grab()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """
+    Summarizes latency samples
+
+    Args:
+        samples: Latencies in milliseconds
+
+    Returns:
+        Dictionary with mean, p50 and p95 latency
+    """
+    ordered = sorted(samples)
+    return {
+        "mean": statistics.fmean(ordered),
+        "p50": ordered[len(ordered) // 2],
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+    }
+
+
+def main() -> int:
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--grabs", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--monitor", type=int, default=1)
+    args = parser.parse_args()
+
+    def grab_per_call():
+        with mss.mss() as sct:
+            return sct.grab(sct.monitors[args.monitor])
+
+    with CaptureSession(args.monitor) as session:
+        monitor = session.monitor
+        print(
+            f"Display: {monitor['width']}x{monitor['height']} "
+            f"({args.grabs} grabs, {args.warmup} warmup)"
+        )
+
+        results = {
+            "mss per call": summarize(
+                measure(grab_per_call, args.grabs, args.warmup)
+            ),
+            "CaptureSession": summarize(
+                measure(session.grab, args.grabs, args.warmup)
+            ),
+        }
+
+    print(f"{'mode':<16}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    for mode, stats in results.items():
+        print(
+            f"{mode:<16}{stats['mean']:>10.2f}"
+            f"{stats['p50']:>10.2f}{stats['p95']:>10.2f}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Change detection microbenchmark for UnifyVision
+Compares the tile-based ChangeDetector with the previous full-frame
+ImageChops/ImageStat implementation at 1080p, 4K and 5K
+
+Run:
+    python -m benchmarks.bench_change_detection --repeat 10
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+from PIL import Image, ImageChops, ImageStat
+
+from src.change_detection import ChangeDetector
+from src.config import config
+from src.frame import Frame
+
+
+RESOLUTIONS = {
+    "1080p": (1920, 1080),
+    "4K": (3840, 2160),
+    "5K": (5120, 2880),
+}
+
+
+def legacy_detect(img_before: Image.Image, img_after: Image.Image) -> bool:
+    """Previous detect_screen_change: mean RGB difference over every pixel"""
+    diff = ImageChops.difference(img_before, img_after)
+    stat = ImageStat.Stat(diff)
+    total_possible = img_before.size[0] * img_before.size[1] * 255 * 3
+    percentage_change = sum(stat.sum) / total_possible * 100
+    return percentage_change > config.SCREEN_CHANGE_THRESHOLD
+
+
+def make_scenarios(width: int, height: int) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Builds before/after BGRA pixel pairs for one resolution
+
+    Args:
+        width: Frame width
+        height: Frame height
+
+    Returns:
+        Dictionary of scenario name to (before, after) arrays
+    """
+    rng = np.random.default_rng(0)
+    before = rng.integers(0, 256, (height, width, 4), dtype=np.uint8)
+
+    button = before.copy()
+    button[height // 2:height // 2 + 60, width // 2:width // 2 + 200, :3] = 255
+
+    page = before.copy()
+    page[height // 8:, :, :3] = 250
+
+    return {
+        "identical": (before, before.copy()),
+        "button": (before, button),
+        "new page": (before, page),
+    }
+
+
+def time_ms(fn: Callable[[], object], repeat: int) -> List[float]:
+    """
+    Times repeated calls
+
+    Args:
+        fn: Callable to time
+        repeat: Number of calls
+
+    Returns:
+        List of durations in milliseconds
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main() -> int:
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    detector = ChangeDetector()
+
+    print(
+        f"{'resolution':<12}{'scenario':<12}{'legacy ms':>11}"
+        f"{'tiles ms':>10}{'speedup':>9}  result"
+    )
+
+    for name, (width, height) in RESOLUTIONS.items():
+        for scenario, (before, after) in make_scenarios(width, height).items():
+            # Legacy needed both grabs converted to RGB images first
+            legacy = statistics.median(time_ms(
+                lambda: legacy_detect(Frame(before).image, Frame(after).image),
+                args.repeat
+            ))
+
+            # Fresh frames each run so the grayscale views are not memoized
+            results = []
+            tiles = statistics.median(time_ms(
+                lambda: results.append(
+                    detector.compare(Frame(before), Frame(after))
+                ),
+                args.repeat
+            ))
+
+            print(
+                f"{name:<12}{scenario:<12}{legacy:>11.2f}{tiles:>10.2f}"
+                f"{legacy / tiles:>8.1f}x  {results[-1]!r}"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Grid overlay microbenchmark for UnifyVision
+Compares drawing the grid cell by cell with compositing the cached overlay,
+and times a cold overlay render from the glyph atlas
+
+Run:
+    python -m benchmarks.bench_grid --repeat 10
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from src.config import config
+from src.grid_system import GridLayout, _render_overlay, get_grid_overlay
+from src.label_renderer import load_font
+
+
+RESOLUTIONS = {
+    "1080p": (1920, 1080),
+    "1440p": (2560, 1440),
+    "4K": (3840, 2160),
+}
+
+
+def legacy_grid(img: Image.Image) -> Image.Image:
+    """Previous render_grid: rectangles, textbbox and labels per cell"""
+    width, height = img.size
+    cell_width = width // config.GRID_COLS
+    cell_height = height // config.GRID_ROWS
+
+    grid_img = img.copy()
+    draw = ImageDraw.Draw(grid_img)
+    font = load_font(min(cell_height, cell_width) // 4)
+
+    cell_num = 0
+    for row in range(config.GRID_ROWS):
+        for col in range(config.GRID_COLS):
+            x1 = col * cell_width
+            y1 = row * cell_height
+            draw.rectangle(
+                [x1, y1, x1 + cell_width, y1 + cell_height],
+                outline=(255, 0, 0),
+                width=1
+            )
+
+            text = str(cell_num)
+            bbox = draw.textbbox((0, 0), text, font=font)
+            text_width = bbox[2] - bbox[0]
+            text_height = bbox[3] - bbox[1]
+            text_x = x1 + (cell_width - text_width) // 2
+            text_y = y1 + (cell_height - text_height) // 2
+
+            draw.rectangle(
+                [text_x - 5, text_y - 2, text_x + text_width + 5, text_y + text_height + 2],
+                fill=(255, 255, 255)
+            )
+            draw.text((text_x, text_y), text, fill=(0, 0, 0), font=font)
+            cell_num += 1
+
+    return grid_img
+
+
+def composite_grid(img: Image.Image) -> Image.Image:
+    """Current render_grid drawing step: one paste of the cached overlay"""
+    overlay = get_grid_overlay(
+        img.size[0], img.size[1], config.GRID_COLS, config.GRID_ROWS
+    )
+    grid_img = img.copy()
+    grid_img.paste(overlay, (0, 0), overlay)
+    return grid_img
+
+
+def time_ms(fn, repeat: int) -> float:
+    """Median duration of repeated calls in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(
+        f"{'resolution':<12}{'legacy ms':>11}{'overlay ms':>12}"
+        f"{'speedup':>9}{'cold render ms':>16}"
+    )
+
+    for name, (width, height) in RESOLUTIONS.items():
+        pixels = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+        img = Image.fromarray(pixels, "RGB")
+
+        # First call renders the overlay; steady state is what matters
+        composite_grid(img)
+
+        legacy = time_ms(lambda: legacy_grid(img), args.repeat)
+        overlay = time_ms(lambda: composite_grid(img), args.repeat)
+        layout = GridLayout(width, height, config.GRID_COLS, config.GRID_ROWS)
+        cold = time_ms(lambda: _render_overlay(layout), args.repeat)
+        print(
+            f"{name:<12}{legacy:>11.2f}{overlay:>12.2f}"
+            f"{legacy / overlay:>8.1f}x{cold:>16.2f}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
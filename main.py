@@ -59,6 +59,8 @@ def get_user_instruction() -> str:
 
 def main():
     """Main application entry point"""
+    executor = None
+
     try:
         # Print banner and instructions
         print_banner()
@@ -93,17 +95,23 @@ def main():
 
         # Step 2: Show plan to user
         print("\n" + "-" * 60)
-        logger.info("⏳ Starting execution in 3 seconds...")
-        time.sleep(3)
+        logger.info(
+            f"⏳ Starting execution in {config.STARTUP_COUNTDOWN:g} seconds..."
+        )
+        time.sleep(config.STARTUP_COUNTDOWN)
 
         # Wait before first screenshot
         logger.info(
-            "\n⏳ Waiting 5 seconds before capturing screen..."
+            f"\n⏳ Waiting {config.SCREEN_PREPARE_DELAY:g} seconds "
+            "before capturing screen..."
         )
         logger.info(
             "   (Prepare the screen with the correct app/site)"
         )
-        time.sleep(5)
+        time.sleep(config.SCREEN_PREPARE_DELAY)
+
+        # Don't take the first screenshot in the middle of a transition
+        executor.action_executor.wait_for_settle(config.STEP_DELAY)
 
         # Step 3: Execute plan
         print("\n" + "=" * 60)
@@ -128,8 +136,11 @@ def main():
 
     finally:
         # Cleanup
+        if executor is not None:
+            executor.close()
         time.sleep(0.5)
-        PlanExecutor.cleanup_temporary_files()
+        if not config.DEBUG_SAVE_IMAGES:
+            PlanExecutor.cleanup_temporary_files()
         print("\n👋 UnifyVision finished\n")
 
 
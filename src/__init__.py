@@ -15,6 +15,7 @@ from .exceptions import (
     ScreenCaptureError,
     GridSystemError,
     OpenAIClientError,
+    RequestDeadlineError,
     PlanningError,
     ActionExecutionError,
     ElementNotFoundError,
@@ -22,9 +23,33 @@ from .exceptions import (
     ScreenChangeDetectionError
 )
 from .logger import logger, setup_logger
-from .screen_capture import ScreenCapture
-from .grid_system import GridSystem
-from .openai_client import OpenAIClient
+from .frame import Frame
+from .change_detection import ChangeDetector, ChangeResult
+from .display_geometry import CoordinateTransform, DisplayGeometry, DisplayGeometryService
+from .image_encoder import (
+    EncodedImage,
+    ImageEncoder,
+    PNGEncoder,
+    JPEGEncoder,
+    WebPEncoder,
+    ByteBudgetEncoder,
+    create_encoder,
+    EncodeCache,
+    encode_cache
+)
+from .cache import ByteLRUCache
+from .metrics import RequestStats
+from .screen_capture import ScreenCapture, CaptureSession
+from .frame_producer import FrameProducer
+from .settle import ScreenSettler, SettleResult
+from .grid_system import GridLayout, GridSystem
+from .location_cache import CachedLocation, LocationCache
+from .background_loop import BackgroundLoop, run_sync
+from .http_pool import ConnectionTrace
+from .request_policy import AttemptRecord, RequestPolicy
+from .rate_limiter import RateLimiter, TokenBucket, get_rate_limiter
+from .openai_client import AsyncOpenAIClient, OpenAIClient, get_openai_client
+from .plan_cache import PlanCache
 from .planner import Planner, ActionPlan
 from .actions import ActionExecutor
 from .executor import PlanExecutor
@@ -40,6 +65,7 @@ __all__ = [
     "ScreenCaptureError",
     "GridSystemError",
     "OpenAIClientError",
+    "RequestDeadlineError",
     "PlanningError",
     "ActionExecutionError",
     "ElementNotFoundError",
@@ -51,11 +77,46 @@ __all__ = [
     "setup_logger",
 
     # Core components
+    "Frame",
+    "ChangeDetector",
+    "ChangeResult",
+    "DisplayGeometry",
+    "DisplayGeometryService",
+    "CoordinateTransform",
+    "EncodedImage",
+    "ImageEncoder",
+    "PNGEncoder",
+    "JPEGEncoder",
+    "WebPEncoder",
+    "ByteBudgetEncoder",
+    "create_encoder",
+    "EncodeCache",
+    "encode_cache",
+    "ByteLRUCache",
+    "RequestStats",
     "ScreenCapture",
+    "CaptureSession",
+    "FrameProducer",
+    "ScreenSettler",
+    "SettleResult",
     "GridSystem",
+    "GridLayout",
+    "LocationCache",
+    "CachedLocation",
     "OpenAIClient",
+    "AsyncOpenAIClient",
+    "get_openai_client",
+    "ConnectionTrace",
+    "RequestPolicy",
+    "AttemptRecord",
+    "RateLimiter",
+    "TokenBucket",
+    "get_rate_limiter",
+    "BackgroundLoop",
+    "run_sync",
     "Planner",
     "ActionPlan",
+    "PlanCache",
     "ActionExecutor",
     "PlanExecutor",
 ]
@@ -5,17 +5,37 @@ Actions module for UnifyVision
 Handles execution of individual actions (click, type, press, wait)
 """
 
+import asyncio
+import math
 import time
-from typing import Optional, Tuple
-from PIL import Image
+from typing import Dict, List, Optional, Tuple, Union
 import pyautogui
+from PIL import Image
 
 from .config import config
 from .screen_capture import ScreenCapture
-from .grid_system import GridSystem
-from .openai_client import OpenAIClient
+from .display_geometry import CoordinateTransform, DisplayGeometry
+from .frame import Frame, ImageSource, as_image
+from .frame_producer import FrameProducer
+from .settle import ScreenSettler, SettleResult
+from .grid_system import (
+    VISION_RESPONSE_FORMAT,
+    GridLayout,
+    GridSystem,
+    downscale_for_model,
+    infer_size_hint
+)
+from .location_cache import CachedLocation, LocationCache, region_unchanged
+from .openai_client import OpenAIClient, get_openai_client
 from .exceptions import ActionExecutionError, ElementNotFoundError
-from .logger import logger, log_click, log_type, log_wait, log_success
+from .logger import (
+    logger,
+    log_capture,
+    log_click,
+    log_type,
+    log_wait,
+    log_success
+)
 
 
 class ActionExecutor:
@@ -25,7 +45,9 @@ class ActionExecutor:
         self,
         screen_capture: Optional[ScreenCapture] = None,
         grid_system: Optional[GridSystem] = None,
-        openai_client: Optional[OpenAIClient] = None
+        openai_client: Optional[OpenAIClient] = None,
+        frame_producer: Optional[FrameProducer] = None,
+        location_cache: Optional[LocationCache] = None
     ):
         """
         Initialize action executor
@@ -33,22 +55,89 @@ class ActionExecutor:
         Args:
             screen_capture: ScreenCapture instance
             grid_system: GridSystem instance
-            openai_client: OpenAIClient instance
+            openai_client: OpenAIClient instance (defaults to the shared client)
+            frame_producer: Background FrameProducer used for click
+                           verification (started automatically when
+                           config.BACKGROUND_CAPTURE_ENABLED is set)
+            location_cache: Persistent LocationCache consulted before grid
+                           lookups (opened automatically when
+                           config.LOCATION_CACHE_ENABLED is set)
         """
         self.screen_capture = screen_capture or ScreenCapture()
         self.grid_system = grid_system or GridSystem()
-        self.openai_client = openai_client or OpenAIClient()
+        self.openai_client = openai_client or get_openai_client()
+
+        self.frame_producer = frame_producer
+        if self.frame_producer is None and config.BACKGROUND_CAPTURE_ENABLED:
+            self.frame_producer = FrameProducer(self.screen_capture).start()
+
+        self.settler = ScreenSettler(self.screen_capture, self.frame_producer)
+
+        self.location_cache = location_cache
+        if self.location_cache is None and config.LOCATION_CACHE_ENABLED:
+            self.location_cache = LocationCache()
+        self._cached_location: Optional[CachedLocation] = None
+
+        # Prefetched (frame, {target: (coordinates, bounds)}) from prefetch_targets
+        self._batch: Optional[
+            Tuple[Frame, Dict[str, Tuple[Tuple[int, int], Tuple[float, float, float, float]]]]
+        ] = None
 
         # Configure PyAutoGUI
         pyautogui.FAILSAFE = config.FAILSAFE_ENABLED
-        pyautogui.PAUSE = config.PAUSE_BETWEEN_ACTIONS
+        pyautogui.PAUSE = (
+            config.SETTLED_PAUSE_BETWEEN_ACTIONS if config.SETTLE_ENABLED
+            else config.PAUSE_BETWEEN_ACTIONS
+        )
+
+    def close(self) -> None:
+        """Stops background capture and releases screen capture resources"""
+        if self.frame_producer is not None:
+            self.frame_producer.stop()
+        if self.location_cache is not None:
+            self.location_cache.close()
+        self.screen_capture.close()
+
+    def wait_for_settle(
+        self,
+        timeout: float,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        require_change: bool = False
+    ) -> Optional[SettleResult]:
+        """
+        Waits until the screen stops changing, capped by timeout
+        Sleeps for the full timeout when adaptive settling is disabled
+
+        Args:
+            timeout: Maximum seconds to wait
+            region: Optional (left, top, width, height) region to watch
+            require_change: Only stop early once a change was seen
 
-    def execute_click(self, target: str) -> bool:
+        Returns:
+            SettleResult, or None when settling is disabled
+        """
+        if timeout <= 0:
+            return None
+
+        if not config.SETTLE_ENABLED:
+            time.sleep(timeout)
+            return None
+
+        try:
+            return self.settler.wait(timeout, region, require_change=require_change)
+        except Exception as e:
+            logger.debug(f"Settle failed ({e}), sleeping instead")
+            time.sleep(timeout)
+            return None
+
+    def execute_click(self, target: str, size_hint: Optional[str] = None) -> bool:
         """
         Executes a click action
 
         Args:
             target: Visual description of the element to click
+            size_hint: Expected target size ("small", "medium" or "large";
+                      inferred from the description by default)
 
         Returns:
             True if click was successful
@@ -59,44 +148,428 @@ class ActionExecutor:
         log_click(f"Executing click on: {target}")
 
         try:
-            # Capture screen
-            screenshot_path = self.screen_capture.capture_screen()
-
-            # Find element using grid system
-            coordinates = self._find_element_with_grid(screenshot_path, target)
+            # Capture screen in memory (files are only written in debug mode)
+            log_capture("Capturing full screen...")
+            reference = self.screen_capture.capture_frame()
+            if config.DEBUG_SAVE_IMAGES:
+                self.screen_capture.save_image(reference)
+
+            # One transform carries image -> physical -> logical mapping
+            geometry = self.screen_capture.geometry.current()
+            transform = CoordinateTransform(geometry)
+
+            # Reuse a batched location while the screen is unchanged,
+            # otherwise find element using grid system
+            self._cached_location = None
+            coordinates = self._take_batched_location(target, reference)
+            if coordinates is None:
+                coordinates = self._find_element_with_grid(
+                    reference,
+                    target,
+                    size_hint or infer_size_hint(target),
+                    transform
+                )
 
             if not coordinates:
                 raise ElementNotFoundError(target)
 
-            x_image, y_image = coordinates
+            return self._click_located(target, coordinates, transform, geometry)
 
-            # Get display scale
-            scale_x, scale_y = self.screen_capture.get_display_scale()
+        except ElementNotFoundError:
+            raise
+        except Exception as e:
+            raise ActionExecutionError(f"Click execution failed: {e}")
 
-            # Convert to logical coordinates
-            x_logical = int(x_image / scale_x)
-            y_logical = int(y_image / scale_y)
+    async def execute_click_async(
+        self,
+        target: str,
+        size_hint: Optional[str] = None
+    ) -> bool:
+        """
+        Executes a click action without blocking the event loop
 
-            logger.debug(
-                f"Image coords: ({x_image}, {y_image}), "
-                f"Logical coords: ({x_logical}, {y_logical})"
-            )
+        Grabs and input run on worker threads; the vision requests are
+        awaited on the running loop through the async client.
 
-            # Execute multi-click pattern
-            success = self._execute_multi_click_pattern(x_logical, y_logical)
+        Args:
+            target: Visual description of the element to click
+            size_hint: Expected target size ("small", "medium" or "large";
+                      inferred from the description by default)
 
-            if success:
-                log_success(f"Click successful on: {target}")
-            else:
-                logger.warning(f"Click may have failed on: {target}")
+        Returns:
+            True if click was successful
+
+        Raises:
+            ActionExecutionError: If click execution fails
+        """
+        log_click(f"Executing click on: {target}")
 
-            return success
+        try:
+            log_capture("Capturing full screen...")
+            reference = await asyncio.to_thread(self.screen_capture.capture_frame)
+            if config.DEBUG_SAVE_IMAGES:
+                self.screen_capture.save_image(reference)
+
+            geometry = self.screen_capture.geometry.current()
+            transform = CoordinateTransform(geometry)
+
+            self._cached_location = None
+            coordinates = self._take_batched_location(target, reference)
+            if coordinates is None:
+                coordinates = await self._find_element_with_grid_async(
+                    reference,
+                    target,
+                    size_hint or infer_size_hint(target),
+                    transform
+                )
+
+            if not coordinates:
+                raise ElementNotFoundError(target)
+
+            return await asyncio.to_thread(
+                self._click_located,
+                target,
+                coordinates,
+                transform,
+                geometry
+            )
 
         except ElementNotFoundError:
             raise
         except Exception as e:
             raise ActionExecutionError(f"Click execution failed: {e}")
 
+    def _click_located(
+        self,
+        target: str,
+        coordinates: Tuple[int, int],
+        transform: CoordinateTransform,
+        geometry: DisplayGeometry
+    ) -> bool:
+        """
+        Clicks a located element with the multi-click pattern
+
+        Args:
+            target: Visual description of the element
+            coordinates: (x, y) in screenshot pixels
+            transform: Transform of the screenshot
+            geometry: Display geometry of the screenshot
+
+        Returns:
+            True if the click changed the screen
+        """
+        x_image, y_image = coordinates
+        x_logical, y_logical = transform.to_logical(x_image, y_image)
+
+        logger.debug(
+            f"Image coords: ({x_image}, {y_image}), "
+            f"Logical coords: ({x_logical}, {y_logical})"
+        )
+
+        # Execute multi-click pattern
+        success = self._execute_multi_click_pattern(
+            x_logical,
+            y_logical,
+            geometry=geometry
+        )
+
+        if success:
+            log_success(f"Click successful on: {target}")
+        else:
+            logger.warning(f"Click may have failed on: {target}")
+            if self._cached_location is not None:
+                # Don't serve a location that didn't work again
+                self.location_cache.invalidate(self._cached_location.entry_id)
+
+        return success
+
+    def locate_targets(
+        self,
+        targets: List[str],
+        screenshot: Optional[ImageSource] = None
+    ) -> Dict[str, Optional[Tuple[int, int]]]:
+        """
+        Locates several elements with one image and one vision request
+
+        Args:
+            targets: Visual descriptions of the elements
+            screenshot: Image to search (defaults to a fresh capture)
+
+        Returns:
+            Dictionary of target to (x, y) screenshot coordinates, or None
+            for targets that were not found
+
+        Raises:
+            ActionExecutionError: If the lookup fails
+        """
+        located = self._locate_batch(targets, screenshot)
+        return {
+            target: result[0] if result is not None else None
+            for target, result in located.items()
+        }
+
+    def _locate_batch(
+        self,
+        targets: List[str],
+        screenshot: Optional[ImageSource] = None
+    ) -> Dict[str, Optional[Tuple[Tuple[int, int], Tuple[float, float, float, float]]]]:
+        """
+        Locates several elements with one request, keeping their bounds
+
+        Args:
+            targets: Visual descriptions of the elements
+            screenshot: Image to search (defaults to a fresh capture)
+
+        Returns:
+            Dictionary of target to ((x, y), (left, top, right, bottom)) in
+            screenshot pixels, or None for targets that were not found
+
+        Raises:
+            ActionExecutionError: If the lookup fails
+        """
+        if screenshot is None:
+            screenshot = self.screen_capture.capture_frame()
+
+        try:
+            grid_img, layout, stage, prompt, cache_key = \
+                self._batch_request(targets, screenshot)
+            response = self.openai_client.ask_with_image(
+                prompt,
+                grid_img,
+                cache_key=cache_key,
+                label="locate:batch"
+            )
+            logger.debug(f"Batch vision response:\n{response}")
+
+            parsed = self.grid_system.parse_batch_vision_response(
+                response,
+                len(targets)
+            )
+
+        except Exception as e:
+            raise ActionExecutionError(f"Batch locate failed: {e}")
+
+        return self._batch_results(targets, parsed, layout, stage)
+
+    async def _locate_batch_async(
+        self,
+        targets: List[str],
+        screenshot: Frame
+    ) -> Dict[str, Optional[Tuple[Tuple[int, int], Tuple[float, float, float, float]]]]:
+        """
+        Locates several elements with one request awaited on the running loop
+
+        Args:
+            targets: Visual descriptions of the elements
+            screenshot: Image to search
+
+        Returns:
+            Dictionary as _locate_batch
+
+        Raises:
+            ActionExecutionError: If the lookup fails
+        """
+        try:
+            grid_img, layout, stage, prompt, cache_key = \
+                self._batch_request(targets, screenshot)
+            response = await self.openai_client.aio.ask_with_image(
+                prompt,
+                grid_img,
+                cache_key=cache_key,
+                label="locate:batch"
+            )
+            logger.debug(f"Batch vision response:\n{response}")
+
+            parsed = self.grid_system.parse_batch_vision_response(
+                response,
+                len(targets)
+            )
+
+        except Exception as e:
+            raise ActionExecutionError(f"Batch locate failed: {e}")
+
+        return self._batch_results(targets, parsed, layout, stage)
+
+    def _batch_request(
+        self,
+        targets: List[str],
+        screenshot: ImageSource
+    ) -> Tuple[Image.Image, GridLayout, CoordinateTransform, str, Optional[str]]:
+        """
+        Builds the gridded image and prompt of a batch lookup
+
+        Args:
+            targets: Visual descriptions of the elements
+            screenshot: Image to search
+
+        Returns:
+            Tuple of (gridded image, layout, transform of the gridded image
+            to screenshot pixels, prompt, encode cache key)
+        """
+        # The densest grid any of the targets asks for
+        hints = {infer_size_hint(target) for target in targets}
+        size_hint = (
+            "small" if "small" in hints
+            else "large" if hints == {"large"}
+            else None
+        )
+
+        image, scale_x, scale_y = downscale_for_model(screenshot)
+        grid_img, layout = self.grid_system.render_layout(
+            image,
+            size_hint=size_hint
+        )
+        stage = CoordinateTransform().region(0, 0, scale_x, scale_y)
+
+        cache_key = None
+        if isinstance(screenshot, Frame):
+            cache_key = (
+                f"grid:{screenshot.hash}:{image.size[0]}:"
+                f"{layout.cols}x{layout.rows}"
+            )
+
+        prompt = self._create_batch_vision_prompt(
+            targets,
+            layout.cols,
+            layout.rows
+        )
+
+        return grid_img, layout, stage, prompt, cache_key
+
+    def _batch_results(
+        self,
+        targets: List[str],
+        parsed: List[Optional[Dict]],
+        layout: GridLayout,
+        stage: CoordinateTransform
+    ) -> Dict[str, Optional[Tuple[Tuple[int, int], Tuple[float, float, float, float]]]]:
+        """
+        Maps the parsed batch answer to screenshot coordinates and bounds
+
+        Args:
+            targets: Visual descriptions of the elements
+            parsed: Parsed result (or None) per target
+            layout: Grid layout of the batch image
+            stage: Transform of the gridded image to screenshot pixels
+
+        Returns:
+            Dictionary as _locate_batch
+        """
+        results: Dict[str, Optional[Tuple[Tuple[int, int], Tuple[float, float, float, float]]]] = {}
+        for target, result in zip(targets, parsed):
+            if result is None:
+                results[target] = None
+                continue
+
+            x, y = stage.to_physical(*layout.centroid(result["cells"]))
+            bounds = stage.box_to_physical(layout.cells_bounds(result["cells"]))
+            results[target] = ((round(x), round(y)), bounds)
+
+        found = sum(1 for value in results.values() if value is not None)
+        log_success(f"Batch located {found}/{len(targets)} targets in one request")
+
+        return results
+
+    def prefetch_targets(self, targets: List[str]) -> int:
+        """
+        Locates upcoming click targets on the current screen in one request
+        execute_click reuses each result while the pixels around that
+        target are unchanged
+
+        Args:
+            targets: Visual descriptions of the upcoming click targets
+
+        Returns:
+            Number of targets located
+        """
+        try:
+            frame = self.screen_capture.capture_frame()
+            results = self._locate_batch(targets, frame)
+        except Exception as e:
+            logger.warning(f"Prefetch failed, locating targets one by one: {e}")
+            self._batch = None
+            return 0
+
+        return self._keep_batch(frame, results)
+
+    async def prefetch_targets_async(self, targets: List[str]) -> int:
+        """
+        Locates upcoming click targets like prefetch_targets, grabbing on a
+        worker thread and awaiting the request on the running loop
+
+        Args:
+            targets: Visual descriptions of the upcoming click targets
+
+        Returns:
+            Number of targets located
+        """
+        try:
+            frame = await asyncio.to_thread(self.screen_capture.capture_frame)
+            results = await self._locate_batch_async(targets, frame)
+        except Exception as e:
+            logger.warning(f"Prefetch failed, locating targets one by one: {e}")
+            self._batch = None
+            return 0
+
+        return self._keep_batch(frame, results)
+
+    def _keep_batch(
+        self,
+        frame: Frame,
+        results: Dict[str, Optional[Tuple[Tuple[int, int], Tuple[float, float, float, float]]]]
+    ) -> int:
+        """
+        Keeps the located targets of a prefetch for execute_click
+
+        Args:
+            frame: Capture the targets were located on
+            results: Dictionary as _locate_batch
+
+        Returns:
+            Number of targets located
+        """
+        located = {
+            target: result for target, result in results.items()
+            if result is not None
+        }
+        self._batch = (frame, located)
+
+        return len(located)
+
+    def _take_batched_location(
+        self,
+        target: str,
+        frame: Frame
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Returns a prefetched location if the pixels around the target
+        haven't changed since the batch was captured; drops the target
+        once they have. Changes elsewhere (such as the reaction to the
+        previous click) keep the location valid.
+
+        Args:
+            target: Visual description of the element
+            frame: Current full-screen capture
+
+        Returns:
+            Tuple of (x, y) screenshot coordinates or None
+        """
+        if self._batch is None:
+            return None
+
+        batch_frame, located = self._batch
+        if target not in located:
+            return None
+
+        coordinates, bounds = located[target]
+        if not region_unchanged(batch_frame, frame, bounds):
+            logger.debug(f"'{target}' changed since batch lookup, discarding it")
+            del located[target]
+            return None
+
+        logger.debug(f"Using batched location for '{target}'")
+        return coordinates
+
     def execute_type(
         self,
         text: str,
@@ -233,90 +706,700 @@ class ActionExecutor:
 
     def _find_element_with_grid(
         self,
-        screenshot_path: str,
-        element_description: str
+        screenshot: ImageSource,
+        element_description: str,
+        size_hint: Optional[str] = None,
+        transform: Optional[CoordinateTransform] = None
     ) -> Optional[Tuple[int, int]]:
         """
         Finds element using grid system
 
+        The screenshot is downscaled to the model's size before the grid is
+        drawn; cells are mapped back through a CoordinateTransform.
+
+        Args:
+            screenshot: Captured Frame (or PIL image / file path)
+            element_description: Visual description of element
+            size_hint: Expected target size used to pick the grid density
+            transform: Transform of the screenshot (defaults to identity)
+
+        Returns:
+            Tuple of (x, y) coordinates in screenshot pixels or None
+        """
+        logger.debug(f"Finding element with grid: '{element_description}'")
+        transform = transform or CoordinateTransform()
+        self._cached_location = None
+
+        try:
+            cached = self._lookup_cached_location(screenshot, element_description)
+            if cached is not None:
+                log_success(f"Element found in location cache at {cached.coordinates}")
+                self._cached_location = cached
+                return cached.coordinates
+
+            if config.GRID_COARSE_TO_FINE:
+                located = self._find_element_coarse_to_fine(
+                    screenshot,
+                    element_description,
+                    size_hint,
+                    transform
+                )
+            else:
+                image, image_transform, cache_key = \
+                    self._single_pass_input(screenshot, transform)
+                located = self._locate_in_grid(
+                    image,
+                    element_description,
+                    image_transform,
+                    size_hint=size_hint,
+                    cache_key=cache_key
+                )
+
+            return self._resolve_location(
+                screenshot,
+                element_description,
+                located,
+                transform
+            )
+
+        except Exception as e:
+            logger.error(f"Error finding element: {e}")
+            return None
+
+    async def _find_element_with_grid_async(
+        self,
+        screenshot: ImageSource,
+        element_description: str,
+        size_hint: Optional[str] = None,
+        transform: Optional[CoordinateTransform] = None
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Finds element using grid system like _find_element_with_grid,
+        awaiting the vision requests on the running loop
+
         Args:
-            screenshot_path: Path to screenshot
+            screenshot: Captured Frame (or PIL image / file path)
             element_description: Visual description of element
+            size_hint: Expected target size used to pick the grid density
+            transform: Transform of the screenshot (defaults to identity)
 
         Returns:
-            Tuple of (x, y) coordinates or None
+            Tuple of (x, y) coordinates in screenshot pixels or None
         """
         logger.debug(f"Finding element with grid: '{element_description}'")
+        transform = transform or CoordinateTransform()
+        self._cached_location = None
+
+        try:
+            cached = self._lookup_cached_location(screenshot, element_description)
+            if cached is not None:
+                log_success(f"Element found in location cache at {cached.coordinates}")
+                self._cached_location = cached
+                return cached.coordinates
+
+            if config.GRID_COARSE_TO_FINE:
+                located = await self._find_element_coarse_to_fine_async(
+                    screenshot,
+                    element_description,
+                    size_hint,
+                    transform
+                )
+            else:
+                image, image_transform, cache_key = \
+                    self._single_pass_input(screenshot, transform)
+                located = await self._locate_in_grid_async(
+                    image,
+                    element_description,
+                    image_transform,
+                    size_hint=size_hint,
+                    cache_key=cache_key
+                )
+
+            return self._resolve_location(
+                screenshot,
+                element_description,
+                located,
+                transform
+            )
+
+        except Exception as e:
+            logger.error(f"Error finding element: {e}")
+            return None
+
+    def _single_pass_input(
+        self,
+        screenshot: ImageSource,
+        transform: CoordinateTransform
+    ) -> Tuple[Image.Image, CoordinateTransform, Optional[str]]:
+        """
+        Prepares the screenshot for a single-pass lookup
+
+        Args:
+            screenshot: Captured Frame (or PIL image / file path)
+            transform: Transform of the screenshot
+
+        Returns:
+            Tuple of (image at the model's size, its transform, encode
+            cache key or None)
+        """
+        # Downscale first so labels are drawn at the size sent
+        image, scale_x, scale_y = downscale_for_model(screenshot)
+
+        # The gridded image is fully determined by the captured frame, so
+        # its hash identifies the payload
+        cache_key = None
+        if isinstance(screenshot, Frame):
+            cache_key = f"grid:{screenshot.hash}:{image.size[0]}"
+
+        return image, transform.region(0, 0, scale_x, scale_y), cache_key
+
+    def _resolve_location(
+        self,
+        screenshot: ImageSource,
+        element_description: str,
+        located: Optional[Tuple[Tuple[float, float], Tuple[float, float, float, float], Dict]],
+        transform: CoordinateTransform
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Maps a grid lookup back to screenshot pixels and caches it
+
+        Args:
+            screenshot: Captured Frame (or PIL image / file path)
+            element_description: Visual description of element
+            located: Result of _locate_in_grid, or None
+            transform: Transform of the screenshot
+
+        Returns:
+            Tuple of (x, y) coordinates in screenshot pixels or None
+        """
+        if not located:
+            return None
+
+        # Back from the physical monitor frame to screenshot pixels
+        (x_physical, y_physical), bounds, result = located
+        x = round((x_physical - transform.offset_x) / transform.scale_x)
+        y = round((y_physical - transform.offset_y) / transform.scale_y)
+
+        log_success(f"Element found at ({x}, {y})")
+
+        left, top, right, bottom = bounds
+        self._store_location(
+            screenshot,
+            element_description,
+            (x, y),
+            (
+                (left - transform.offset_x) / transform.scale_x,
+                (top - transform.offset_y) / transform.scale_y,
+                (right - transform.offset_x) / transform.scale_x,
+                (bottom - transform.offset_y) / transform.scale_y
+            ),
+            result
+        )
+
+        return x, y
+
+    def _lookup_cached_location(
+        self,
+        screenshot: ImageSource,
+        element_description: str
+    ) -> Optional[CachedLocation]:
+        """
+        Looks a target up in the location cache (if enabled)
+        Cache errors are logged and treated as misses
+
+        Args:
+            screenshot: Captured Frame (or PIL image / file path)
+            element_description: Visual description of element
+
+        Returns:
+            CachedLocation or None
+        """
+        if self.location_cache is None:
+            return None
 
         try:
-            # Draw grid on image
-            grid_path, cell_width, cell_height = \
-                self.grid_system.draw_grid_on_image(screenshot_path)
+            return self.location_cache.lookup(screenshot, element_description)
+        except Exception as e:
+            logger.warning(f"Location cache lookup failed: {e}")
+            return None
+
+    def _store_location(
+        self,
+        screenshot: ImageSource,
+        element_description: str,
+        coordinates: Tuple[int, int],
+        bounds: Tuple[float, float, float, float],
+        result: Dict
+    ) -> None:
+        """
+        Stores a resolved location in the location cache (if enabled)
+
+        Args:
+            screenshot: Captured Frame (or PIL image / file path)
+            element_description: Visual description of element
+            coordinates: (x, y) in screenshot pixels
+            bounds: Element bounds in screenshot pixels
+            result: Parsed vision result with cells and confidence
+        """
+        if self.location_cache is None:
+            return
+
+        try:
+            self.location_cache.store(
+                screenshot,
+                element_description,
+                coordinates,
+                bounds,
+                result.get("cells", []),
+                result.get("confidence", "unknown")
+            )
+        except Exception as e:
+            logger.warning(f"Location cache store failed: {e}")
+
+    def _find_element_coarse_to_fine(
+        self,
+        screenshot: ImageSource,
+        element_description: str,
+        size_hint: Optional[str],
+        transform: CoordinateTransform
+    ) -> Optional[Tuple[Tuple[float, float], Tuple[float, float, float, float], Dict]]:
+        """
+        Two-stage lookup: a coarse grid on a downscaled full screen picks the
+        region, then a fine grid on that region at native resolution
+        pinpoints the element
+
+        Args:
+            screenshot: Captured Frame (or PIL image / file path)
+            element_description: Visual description of element
+            size_hint: Expected target size used to pick the fine grid density
+            transform: Transform of the screenshot
+
+        Returns:
+            Tuple of ((x, y), bounds, result) as _locate_in_grid, or None
+        """
+        if not isinstance(screenshot, Frame):
+            # Frames are cropped in place; other sources are loaded once
+            screenshot = as_image(screenshot)
+
+        # Stage 1: box-filtered downscale with a coarse grid
+        coarse, coarse_transform, coarse_layout, cache_key = \
+            self._coarse_pass_input(screenshot, transform)
+        coarse_located = self._locate_in_grid(
+            coarse,
+            element_description,
+            coarse_transform,
+            layout=coarse_layout,
+            cache_key=cache_key
+        )
+        if not coarse_located:
+            return None
+
+        # Stage 2: the selected cells plus padding, cropped at native size
+        fine, fine_transform, fine_layout = self._fine_pass_input(
+            screenshot,
+            coarse_located,
+            coarse_layout,
+            coarse_transform,
+            transform
+        )
+        located = self._locate_in_grid(
+            fine,
+            element_description,
+            fine_transform,
+            layout=fine_layout,
+            size_hint=size_hint,
+            zoomed=True
+        )
+
+        if not located:
+            # Fall back to the coarse estimate
+            logger.debug("Fine pass missed the element, using coarse estimate")
+            return coarse_located
+
+        return located
+
+    async def _find_element_coarse_to_fine_async(
+        self,
+        screenshot: ImageSource,
+        element_description: str,
+        size_hint: Optional[str],
+        transform: CoordinateTransform
+    ) -> Optional[Tuple[Tuple[float, float], Tuple[float, float, float, float], Dict]]:
+        """
+        Two-stage lookup like _find_element_coarse_to_fine, awaiting both
+        requests on the running loop
+
+        Args:
+            screenshot: Captured Frame (or PIL image / file path)
+            element_description: Visual description of element
+            size_hint: Expected target size used to pick the fine grid density
+            transform: Transform of the screenshot
+
+        Returns:
+            Tuple of ((x, y), bounds, result) as _locate_in_grid, or None
+        """
+        if not isinstance(screenshot, Frame):
+            screenshot = as_image(screenshot)
+
+        coarse, coarse_transform, coarse_layout, cache_key = \
+            self._coarse_pass_input(screenshot, transform)
+        coarse_located = await self._locate_in_grid_async(
+            coarse,
+            element_description,
+            coarse_transform,
+            layout=coarse_layout,
+            cache_key=cache_key
+        )
+        if not coarse_located:
+            return None
+
+        fine, fine_transform, fine_layout = self._fine_pass_input(
+            screenshot,
+            coarse_located,
+            coarse_layout,
+            coarse_transform,
+            transform
+        )
+        located = await self._locate_in_grid_async(
+            fine,
+            element_description,
+            fine_transform,
+            layout=fine_layout,
+            size_hint=size_hint,
+            zoomed=True
+        )
+
+        if not located:
+            logger.debug("Fine pass missed the element, using coarse estimate")
+            return coarse_located
+
+        return located
+
+    def _coarse_pass_input(
+        self,
+        screenshot: Union[Frame, Image.Image],
+        transform: CoordinateTransform
+    ) -> Tuple[Image.Image, CoordinateTransform, GridLayout, Optional[str]]:
+        """
+        Prepares the coarse pass of a coarse-to-fine lookup
 
-            # Get image dimensions
-            img = Image.open(screenshot_path)
-            img_width, img_height = img.size
+        Args:
+            screenshot: Captured Frame or PIL image
+            transform: Transform of the screenshot
 
-            logger.debug(
-                f"Image size: {img_width}x{img_height}, "
-                f"Cell size: {cell_width}x{cell_height}"
+        Returns:
+            Tuple of (downscaled image, its transform, coarse layout,
+            encode cache key or None)
+        """
+        coarse, scale_x, scale_y = downscale_for_model(
+            screenshot,
+            config.GRID_COARSE_MAX_SIZE
+        )
+        cache_key = None
+        if isinstance(screenshot, Frame):
+            cache_key = f"grid:{screenshot.hash}:coarse{coarse.size[0]}"
+
+        coarse_layout = GridLayout(
+            coarse.size[0],
+            coarse.size[1],
+            config.GRID_COARSE_COLS,
+            config.GRID_COARSE_ROWS
+        )
+
+        return (
+            coarse,
+            transform.region(0, 0, scale_x, scale_y),
+            coarse_layout,
+            cache_key
+        )
+
+    def _fine_pass_input(
+        self,
+        screenshot: Union[Frame, Image.Image],
+        coarse_located: Tuple[Tuple[float, float], Tuple[float, float, float, float], Dict],
+        coarse_layout: GridLayout,
+        coarse_transform: CoordinateTransform,
+        transform: CoordinateTransform
+    ) -> Tuple[Image.Image, CoordinateTransform, Optional[GridLayout]]:
+        """
+        Crops the region selected by the coarse pass at native resolution
+
+        Args:
+            screenshot: Captured Frame or PIL image
+            coarse_located: Result of the coarse pass
+            coarse_layout: Layout of the coarse grid
+            coarse_transform: Transform of the coarse image
+            transform: Transform of the screenshot
+
+        Returns:
+            Tuple of (region image at the model's size, its transform, fine
+            layout or None for an adaptive one)
+        """
+        img_width, img_height = screenshot.size
+        scale_x = coarse_transform.scale_x / transform.scale_x
+        scale_y = coarse_transform.scale_y / transform.scale_y
+
+        _, (left, top, right, bottom), _ = coarse_located
+        pad_x = coarse_layout.cell_width * scale_x * config.GRID_FINE_PADDING
+        pad_y = coarse_layout.cell_height * scale_y * config.GRID_FINE_PADDING
+        left = max(0, int((left - transform.offset_x) / transform.scale_x - pad_x))
+        top = max(0, int((top - transform.offset_y) / transform.scale_y - pad_y))
+        right = min(img_width, math.ceil(
+            (right - transform.offset_x) / transform.scale_x + pad_x
+        ))
+        bottom = min(img_height, math.ceil(
+            (bottom - transform.offset_y) / transform.scale_y + pad_y
+        ))
+
+        if isinstance(screenshot, Frame):
+            region = screenshot.crop(left, top, right - left, bottom - top)
+        else:
+            region = screenshot.crop((left, top, right, bottom))
+
+        logger.debug(
+            f"Coarse pass selected region ({left}, {top}, {right}, {bottom})"
+        )
+
+        fine, fine_scale_x, fine_scale_y = downscale_for_model(region)
+        fine_layout = None
+        if not config.GRID_ADAPTIVE:
+            fine_layout = GridLayout(
+                fine.size[0],
+                fine.size[1],
+                config.GRID_FINE_COLS,
+                config.GRID_FINE_ROWS
             )
 
-            # Create vision prompt
-            prompt = self._create_vision_prompt(element_description)
+        return (
+            fine,
+            transform.region(left, top, fine_scale_x, fine_scale_y),
+            fine_layout
+        )
 
-            # Ask vision model
-            response = self.openai_client.ask_with_image(prompt, grid_path)
+    def _locate_in_grid(
+        self,
+        image: ImageSource,
+        element_description: str,
+        transform: CoordinateTransform,
+        layout: Optional[GridLayout] = None,
+        size_hint: Optional[str] = None,
+        cache_key: Optional[str] = None,
+        zoomed: bool = False
+    ) -> Optional[Tuple[Tuple[float, float], Tuple[float, float, float, float], Dict]]:
+        """
+        Runs one grid lookup on an image
+
+        Args:
+            image: Frame, PIL image or file path to grid (already at the
+                  size sent to the model)
+            element_description: Visual description of element
+            transform: Maps image pixels to physical pixels
+            layout: Grid layout (defaults to GridSystem.choose_layout)
+            size_hint: Expected target size used when choosing the layout
+            cache_key: Content key of the image for the encode cache
+                      (the grid shape is appended)
+            zoomed: True if the image is a zoomed-in region of the screen
 
+        Returns:
+            Tuple of ((x, y), (left, top, right, bottom), result): the
+            weighted cell centroid and the bounds of the selected cells in
+            physical pixels, and the parsed vision result (cells,
+            confidence); None if the element was not found
+        """
+        grid_img, layout, prompt, request = self._grid_request(
+            image,
+            element_description,
+            transform,
+            layout,
+            size_hint,
+            cache_key,
+            zoomed
+        )
+
+        if config.VISION_STREAMING:
+            # Act as soon as the cells arrive, without the reasoning
+            parsed = self.grid_system.parse_vision_stream(
+                self.openai_client.stream_with_image(prompt, grid_img, **request)
+            )
+        else:
+            response = self.openai_client.ask_with_image(prompt, grid_img, **request)
             logger.debug(f"Vision response:\n{response}")
 
             # Parse response
             parsed = self.grid_system.parse_vision_response(response)
 
-            # Cleanup temporary files
-            self.grid_system.cleanup_temp_files()
+        return self._grid_location(parsed, layout, transform, element_description)
 
-            if not parsed or not parsed.get("found"):
-                logger.warning(f"Element not found: {element_description}")
-                return None
+    async def _locate_in_grid_async(
+        self,
+        image: ImageSource,
+        element_description: str,
+        transform: CoordinateTransform,
+        layout: Optional[GridLayout] = None,
+        size_hint: Optional[str] = None,
+        cache_key: Optional[str] = None,
+        zoomed: bool = False
+    ) -> Optional[Tuple[Tuple[float, float], Tuple[float, float, float, float], Dict]]:
+        """
+        Runs one grid lookup like _locate_in_grid, awaiting the request on
+        the running loop
 
-            # Calculate coordinates from cells
-            cells = parsed.get("cells", [])
-            confidence = parsed.get("confidence", "unknown")
+        Returns:
+            Tuple of ((x, y), bounds, result) as _locate_in_grid, or None
+        """
+        grid_img, layout, prompt, request = self._grid_request(
+            image,
+            element_description,
+            transform,
+            layout,
+            size_hint,
+            cache_key,
+            zoomed
+        )
+
+        client = self.openai_client.aio
+        if config.VISION_STREAMING:
+            parsed = await self.grid_system.parse_vision_stream_async(
+                client.stream_with_image(prompt, grid_img, **request)
+            )
+        else:
+            response = await client.ask_with_image(prompt, grid_img, **request)
+            logger.debug(f"Vision response:\n{response}")
+            parsed = self.grid_system.parse_vision_response(response)
+
+        return self._grid_location(parsed, layout, transform, element_description)
+
+    def _grid_request(
+        self,
+        image: ImageSource,
+        element_description: str,
+        transform: CoordinateTransform,
+        layout: Optional[GridLayout],
+        size_hint: Optional[str],
+        cache_key: Optional[str],
+        zoomed: bool
+    ) -> Tuple[Image.Image, GridLayout, str, Dict]:
+        """
+        Draws the grid and builds the vision request of one lookup
 
-            logger.debug(f"Detected {len(cells)} cells, confidence: {confidence}")
+        Args:
+            image: Image to grid (already at the size sent to the model)
+            element_description: Visual description of element
+            transform: Maps image pixels to physical pixels
+            layout: Grid layout (defaults to GridSystem.choose_layout)
+            size_hint: Expected target size used when choosing the layout
+            cache_key: Content key of the image for the encode cache
+            zoomed: True if the image is a zoomed-in region of the screen
 
-            x, y = self.grid_system.calculate_coordinates_from_cells(
-                cells,
-                cell_width,
-                cell_height
+        Returns:
+            Tuple of (gridded image, layout, prompt, request arguments)
+        """
+        # Draw grid on image (in memory); the layout maps cells back exactly
+        grid_img, layout = self.grid_system.render_layout(
+            image,
+            layout,
+            size_hint
+        )
+
+        if config.DEBUG_SAVE_IMAGES:
+            grid_img.save(config.SCREENSHOT_GRID_PATH)
+
+        logger.debug(f"Grid layout: {layout!r}, {transform!r}")
+
+        if cache_key is not None:
+            cache_key = f"{cache_key}:{layout.cols}x{layout.rows}"
+
+        # Create vision prompt; the lean mode asks for the cells only,
+        # under a strict schema
+        if config.VISION_RESPONSE_MODE == "lean":
+            prompt = self._create_lean_vision_prompt(
+                element_description,
+                layout.cols,
+                layout.rows,
+                zoomed
+            )
+            request = {
+                "cache_key": cache_key,
+                "response_format": VISION_RESPONSE_FORMAT,
+                "label": "locate:lean",
+            }
+        else:
+            prompt = self._create_vision_prompt(
+                element_description,
+                layout.cols,
+                layout.rows,
+                zoomed
             )
+            request = {"cache_key": cache_key, "label": "locate:verbose"}
 
-            log_success(f"Element found at ({x}, {y})")
+        return grid_img, layout, prompt, request
 
-            return x, y
+    def _grid_location(
+        self,
+        parsed: Optional[Dict],
+        layout: GridLayout,
+        transform: CoordinateTransform,
+        element_description: str
+    ) -> Optional[Tuple[Tuple[float, float], Tuple[float, float, float, float], Dict]]:
+        """
+        Maps a parsed vision answer to physical coordinates and bounds
 
-        except Exception as e:
-            logger.error(f"Error finding element: {e}")
+        Args:
+            parsed: Parsed vision result, or None
+            layout: Layout of the gridded image
+            transform: Maps image pixels to physical pixels
+            element_description: Visual description of element
+
+        Returns:
+            Tuple of ((x, y), bounds, result) as _locate_in_grid, or None
+        """
+        if not parsed or not parsed.get("found"):
+            logger.warning(f"Element not found: {element_description}")
             return None
 
-    def _create_vision_prompt(self, element_description: str) -> str:
+        # Calculate coordinates from cells
+        cells = parsed.get("cells", [])
+        confidence = parsed.get("confidence", "unknown")
+
+        logger.debug(f"Detected {len(cells)} cells, confidence: {confidence}")
+
+        coordinates = transform.to_physical(*layout.centroid(cells))
+        bounds = transform.box_to_physical(layout.cells_bounds(cells))
+
+        return coordinates, bounds, parsed
+
+    def _create_vision_prompt(
+        self,
+        element_description: str,
+        cols: int = None,
+        rows: int = None,
+        zoomed: bool = False
+    ) -> str:
         """
         Creates a vision prompt for element location
 
         Args:
             element_description: Description of element to find
+            cols: Grid columns (defaults to config.GRID_COLS)
+            rows: Grid rows (defaults to config.GRID_ROWS)
+            zoomed: True if the image is a zoomed-in region of the screen
 
         Returns:
             Formatted prompt string
         """
-        return f"""You are analyzing a screenshot with a NUMBERED GRID overlay (red grid with numbers).
+        cols = cols or config.GRID_COLS
+        rows = rows or config.GRID_ROWS
+        subject = (
+            "a zoomed-in region of a screenshot" if zoomed else "a screenshot"
+        )
+
+        return f"""You are analyzing {subject} with a NUMBERED GRID overlay (red grid with numbers).
 
 YOUR TASK: Find the UI element "{element_description}" and identify which GRID CELLS contain it.
 
 GRID INFORMATION:
-- Grid size: {config.GRID_COLS} columns × {config.GRID_ROWS} rows = {config.GRID_COLS * config.GRID_ROWS} cells total
-- Cell numbering: 0 (top-left) to {config.GRID_COLS * config.GRID_ROWS - 1} (bottom-right)
+- Grid size: {cols} columns × {rows} rows = {cols * rows} cells total
+- Cell numbering: 0 (top-left) to {cols * rows - 1} (bottom-right)
 - Each cell has a NUMBER written in it - READ THESE NUMBERS carefully
 
 STEP 1: Briefly describe what you see in the screenshot (1-2 sentences)
@@ -356,10 +1439,99 @@ CRITICAL:
 
 Find "{element_description}" now:"""
 
+    def _create_lean_vision_prompt(
+        self,
+        element_description: str,
+        cols: int,
+        rows: int,
+        zoomed: bool = False
+    ) -> str:
+        """
+        Creates a compact vision prompt for the lean response mode
+        The answer format is enforced by VISION_RESPONSE_FORMAT
+
+        Args:
+            element_description: Description of element to find
+            cols: Grid columns
+            rows: Grid rows
+            zoomed: True if the image is a zoomed-in region of the screen
+
+        Returns:
+            Formatted prompt string
+        """
+        subject = "A zoomed-in screenshot region" if zoomed else "A screenshot"
+
+        return (
+            f"{subject} with a red numbered grid: {cols} columns × {rows} rows, "
+            f"cells 0 (top-left) to {cols * rows - 1} (bottom-right), row by row.\n"
+            f'Find the UI element "{element_description}". Read the numbers '
+            f"printed in the cells and list every cell the element covers, with "
+            f"the percentage of the element inside each cell.\n"
+            f"If it is not visible, answer found=false with no cells."
+        )
+
+    def _create_batch_vision_prompt(
+        self,
+        targets: List[str],
+        cols: int,
+        rows: int
+    ) -> str:
+        """
+        Creates a vision prompt locating several elements at once
+
+        Args:
+            targets: Descriptions of the elements to find
+            cols: Grid columns
+            rows: Grid rows
+
+        Returns:
+            Formatted prompt string
+        """
+        numbered = "\n".join(
+            f"{i}. {target}" for i, target in enumerate(targets, 1)
+        )
+
+        return f"""You are analyzing a screenshot with a NUMBERED GRID overlay (red grid with numbers).
+
+YOUR TASK: Find EACH of these UI elements and identify which GRID CELLS contain it:
+{numbered}
+
+GRID INFORMATION:
+- Grid size: {cols} columns × {rows} rows = {cols * rows} cells total
+- Cell numbering: 0 (top-left) to {cols * rows - 1} (bottom-right)
+- Each cell has a NUMBER written in it - READ THESE NUMBERS carefully
+
+RESPONSE FORMAT (JSON only, one entry per element, in order):
+{{
+  "targets": [
+    {{
+      "target": 1,
+      "found": true,
+      "cells": [
+        {{"cell_number": N, "coverage_percent": XX}}
+      ],
+      "confidence": "high/medium/low"
+    }},
+    {{
+      "target": 2,
+      "found": false,
+      "reasoning": "Why you couldn't find it"
+    }}
+  ]
+}}
+
+CRITICAL:
+- READ the cell numbers from the grid overlay (don't estimate positions)
+- List ALL cells where each element appears
+- Answer for every element, using its number as "target"
+
+Find the elements now:"""
+
     def _execute_multi_click_pattern(
         self,
         x_center: int,
-        y_center: int
+        y_center: int,
+        geometry: Optional[DisplayGeometry] = None
     ) -> bool:
         """
         Executes multi-click pattern (center + 4 cardinal directions)
@@ -367,11 +1539,15 @@ Find "{element_description}" now:"""
         Args:
             x_center: Center X coordinate
             y_center: Center Y coordinate
+            geometry: Display transform used to locate the ROI
+                     (defaults to the cached geometry)
 
         Returns:
             True if any click caused screen change
         """
         radius = config.CLICK_PATTERN_RADIUS
+        use_roi = config.CLICK_VERIFICATION_ROI_ENABLED
+        geometry = geometry or self.screen_capture.geometry.current()
 
         # Click pattern: center + 4 directions
         points = [
@@ -384,27 +1560,51 @@ Find "{element_description}" now:"""
 
         logger.debug("Executing 5-point click pattern (center + 4 directions)")
 
+        # Full-frame reference for inconclusive ROIs, grabbed once per pattern
+        reference = None
+
         for i, (x, y, position) in enumerate(points):
             try:
+                regions = None
+                if use_roi:
+                    regions = self._get_verification_regions(
+                        *geometry.to_physical(x, y)
+                    )
+
                 # Capture before click (in memory)
-                img_before = self.screen_capture.capture_screen_to_memory()
+                frame_before, regions_before = \
+                    self._capture_for_verification(regions)
+                if frame_before is not None:
+                    reference = frame_before
+                elif reference is None:
+                    reference = self.screen_capture.capture_frame()
 
                 logger.debug(f"   {i+1}/5. Trying {position}: ({x}, {y})")
 
                 # Perform click
-                pyautogui.moveTo(x, y, duration=0.2)
-                time.sleep(0.1)
+                self._move_mouse(x, y, regions[0] if regions else None)
                 pyautogui.click()
-                time.sleep(config.CLICK_VERIFICATION_DELAY)
 
-                # Capture after click (in memory)
-                img_after = self.screen_capture.capture_screen_to_memory()
+                # Capture after click (in memory) once the screen settled
+                # or the verification delay has elapsed
+                frame_after, regions_after = self._capture_for_verification(
+                    regions,
+                    wait=config.CLICK_VERIFICATION_DELAY
+                )
 
                 # Check for changes
-                changed = self.screen_capture.detect_screen_change(
-                    img_before,
-                    img_after
-                )
+                if use_roi:
+                    changed = self._verify_regions_changed(
+                        regions_before,
+                        regions_after,
+                        reference,
+                        frame_after
+                    )
+                else:
+                    changed = self.screen_capture.detect_screen_change(
+                        frame_before,
+                        frame_after
+                    )
 
                 if changed:
                     log_success(f"Click successful at {position}!")
@@ -418,3 +1618,166 @@ Find "{element_description}" now:"""
 
         logger.warning("No screen changes detected in any position")
         return False
+
+    def _get_verification_regions(
+        self,
+        x_image: int,
+        y_image: int
+    ) -> List[Tuple[int, int, int, int]]:
+        """
+        Builds the regions compared to verify a click
+
+        Args:
+            x_image: Click X in image (physical) pixels
+            y_image: Click Y in image (physical) pixels
+
+        Returns:
+            List of (left, top, width, height) regions: the window around the
+            click followed by the configured dynamic regions
+        """
+        size = config.CLICK_VERIFICATION_ROI_SIZE
+        half = size // 2
+
+        regions = [(x_image - half, y_image - half, size, size)]
+        regions.extend(
+            tuple(region) for region in config.CLICK_VERIFICATION_DYNAMIC_REGIONS
+        )
+        return regions
+
+    def _move_mouse(
+        self,
+        x: int,
+        y: int,
+        region: Optional[Tuple[int, int, int, int]] = None
+    ) -> None:
+        """
+        Moves the mouse and waits for hover effects before clicking
+        With adaptive settling the move is instant and the hover wait ends
+        as soon as the region is stable
+
+        Args:
+            x: Logical X coordinate
+            y: Logical Y coordinate
+            region: Region watched for hover effects
+        """
+        if config.SETTLE_ENABLED:
+            pyautogui.moveTo(x, y)
+            self.wait_for_settle(
+                config.MOUSE_MOVE_DURATION + config.CLICK_HOVER_DELAY,
+                region
+            )
+        else:
+            pyautogui.moveTo(x, y, duration=config.MOUSE_MOVE_DURATION)
+            time.sleep(config.CLICK_HOVER_DELAY)
+
+    def _capture_for_verification(
+        self,
+        regions: Optional[List[Tuple[int, int, int, int]]],
+        wait: float = 0.0
+    ) -> Tuple[Optional[Frame], List[Frame]]:
+        """
+        Captures what click verification compares
+
+        With a running frame producer the frames come from the background
+        ring (no grab on this thread); otherwise only the regions are grabbed.
+
+        Args:
+            regions: Verification regions, or None for full-frame comparison
+            wait: Delay before capturing after a click; with adaptive
+                 settling it is the upper bound and capture happens once the
+                 first region (or the screen) changed and is stable again
+
+        Returns:
+            Tuple of (full frame or None, region frames)
+        """
+        started = time.monotonic()
+        settled_frame = None
+
+        if wait > 0 and config.SETTLE_ENABLED:
+            # A UI that is slow to react must not pass for "no change"
+            result = self.wait_for_settle(
+                wait,
+                regions[0] if regions else None,
+                require_change=True
+            )
+            settled_frame = result.frame if result is not None else None
+
+        producer = self.frame_producer
+        if producer is not None and producer.running:
+            if settled_frame is not None or wait <= 0:
+                frame = producer.latest() or producer.frame_after(0.0)
+            else:
+                frame = producer.frame_after(started + wait)
+
+            if regions is None:
+                return frame, []
+            return frame, [frame.crop(*region) for region in regions]
+
+        if wait > 0 and settled_frame is None:
+            time.sleep(max(0.0, started + wait - time.monotonic()))
+
+        if regions is None:
+            return settled_frame or self.screen_capture.capture_frame(), []
+        if settled_frame is not None and len(regions) == 1:
+            return None, [settled_frame]
+        return None, self._capture_regions(regions)
+
+    def _capture_regions(
+        self,
+        regions: List[Tuple[int, int, int, int]]
+    ) -> List[Frame]:
+        """
+        Captures each verification region
+
+        Args:
+            regions: List of (left, top, width, height) regions
+
+        Returns:
+            List of captured region frames
+        """
+        return [
+            self.screen_capture.capture_region(*region)
+            for region in regions
+        ]
+
+    def _verify_regions_changed(
+        self,
+        regions_before: List[Frame],
+        regions_after: List[Frame],
+        frame_before: Frame,
+        frame_after: Optional[Frame] = None
+    ) -> bool:
+        """
+        Decides whether a click changed the screen using the ROI
+        Falls back to a full-frame comparison only when the ROI is inconclusive
+
+        Args:
+            regions_before: Region frames captured before the click
+            regions_after: Region frames captured after the click
+            frame_before: Full frame captured before the click pattern
+            frame_after: Full frame after the click, if already available
+
+        Returns:
+            True if a significant change was detected
+        """
+        peak_change = 0.0
+        for before, after in zip(regions_before, regions_after):
+            result = self.screen_capture.detect_screen_change(
+                before,
+                after,
+                threshold=config.ROI_CHANGE_THRESHOLD
+            )
+            if result:
+                logger.debug(f"   ROI change: {result!r}")
+                return True
+            peak_change = max(peak_change, result.changed_percentage)
+
+        logger.debug(f"   ROI change: {peak_change:.2f}% of tiles")
+
+        if peak_change <= config.ROI_NOISE_THRESHOLD:
+            return False
+
+        # Something moved but not enough to decide: compare the full frame
+        logger.debug("   ROI inconclusive, falling back to full-frame comparison")
+        frame_after = frame_after or self.screen_capture.capture_frame()
+        return self.screen_capture.detect_screen_change(frame_before, frame_after)
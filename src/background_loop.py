@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Background loop module for UnifyVision
+Runs coroutines on a shared event loop thread for synchronous callers
+"""
+
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Awaitable, Iterator, Optional, TypeVar
+
+from .logger import logger
+
+
+T = TypeVar("T")
+
+
+# Sentinel returned by _next once an async iterator is exhausted
+_EXHAUSTED = object()
+
+
+class BackgroundLoop:
+    """
+    Event loop running on a daemon thread
+
+    Synchronous wrappers submit their coroutines here, so every blocking
+    call shares one loop (and the connection pools bound to it) instead of
+    starting a new loop per call. The thread starts on first use.
+    """
+
+    def __init__(self, name: str = "unifyvision-loop"):
+        """
+        Initialize background loop
+
+        Args:
+            name: Name of the loop thread
+        """
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The event loop, started on first access"""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def serve():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=serve, name=self.name, daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+                logger.debug(f"Started background event loop ({self.name})")
+
+            return self._loop
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """
+        Runs a coroutine on the loop and waits for its result
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            Result of the coroutine
+
+        Raises:
+            RuntimeError: If called from the loop thread itself (it would deadlock)
+        """
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("BackgroundLoop.run called from its own loop thread")
+
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            # Interrupted or timed out: don't leave the coroutine running
+            future.cancel()
+            raise
+
+    def iterate(self, iterator: AsyncIterator[T]) -> Iterator[T]:
+        """
+        Consumes an async iterator from synchronous code
+        Closing the returned generator closes the async iterator on the loop
+
+        Args:
+            iterator: Async iterator (typically an async generator)
+
+        Yields:
+            Items of the async iterator
+        """
+        try:
+            while True:
+                item = self.run(_next(iterator))
+                if item is _EXHAUSTED:
+                    return
+                yield item
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                self.run(aclose())
+
+    def close(self) -> None:
+        """Stops the loop thread (the next use starts a new one)"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+
+        if loop is None:
+            return
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+async def _next(iterator: AsyncIterator[Any]) -> Any:
+    """Next item of an async iterator, or _EXHAUSTED"""
+    try:
+        return await iterator.__anext__()
+    except StopAsyncIteration:
+        return _EXHAUSTED
+
+
+# Global loop shared by the synchronous wrappers
+background_loop = BackgroundLoop()
+
+
+def run_sync(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """
+    Runs a coroutine on the shared background loop and returns its result
+
+    Args:
+        coro: Coroutine to run
+        timeout: Seconds to wait (None waits indefinitely)
+
+    Returns:
+        Result of the coroutine
+    """
+    return background_loop.run(coro, timeout)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache module for UnifyVision
+Thread-safe LRU cache bounded by the total byte size of its entries
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class ByteLRUCache:
+    """
+    Least-recently-used cache that tracks the bytes it holds
+
+    Entries are evicted oldest-first whenever the total size exceeds the
+    byte limit. Hits, misses and evictions are counted for monitoring.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        sizeof: Optional[Callable[[Any], int]] = None,
+        max_entries: Optional[int] = None
+    ):
+        """
+        Initialize cache
+
+        Args:
+            max_bytes: Maximum total size of cached values (0 disables caching)
+            sizeof: Function returning the size of a value in bytes
+                   (defaults to len(value))
+            max_entries: Optional cap on the number of entries
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.sizeof = sizeof or len
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_held = 0
+
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns a cached value and marks it as recently used
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any, nbytes: Optional[int] = None) -> None:
+        """
+        Stores a value, evicting least-recently-used entries to make room
+        Values larger than the whole cache are not stored
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            nbytes: Size of value in bytes (defaults to sizeof(value))
+        """
+        nbytes = self.sizeof(value) if nbytes is None else nbytes
+        if nbytes > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = value
+            self._sizes[key] = nbytes
+            self.bytes_held += nbytes
+
+            while (
+                self.bytes_held > self.max_bytes or
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        """Removes an entry (lock must be held)"""
+        del self._entries[key]
+        self.bytes_held -= self._sizes.pop(key)
+
+    def clear(self) -> None:
+        """Removes every entry (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.bytes_held = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns cache counters for monitoring
+
+        Returns:
+            Dictionary with entries, bytes, hits, misses, evictions and hit rate
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes_held": self.bytes_held,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hit_rate,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
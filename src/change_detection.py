@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Change detection module for UnifyVision
+Block-based screen change detection on downsampled grayscale tiles
+"""
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+from .config import config
+from .exceptions import ScreenChangeDetectionError
+from .frame import Frame, ImageSource, as_image
+
+
+class ChangeResult:
+    """Outcome of comparing two frames tile by tile"""
+
+    def __init__(
+        self,
+        changed: bool,
+        dirty_tiles: np.ndarray,
+        changed_percentage: float,
+        complete: bool = True
+    ):
+        """
+        Initialize change result
+
+        Args:
+            changed: True if the changed-tile percentage crossed the threshold
+            dirty_tiles: (rows, cols) boolean map of tiles that changed
+            changed_percentage: Percentage of tiles found dirty
+            complete: False if detection stopped early (tiles below the
+                     stopping point were not examined)
+        """
+        self.changed = changed
+        self.dirty_tiles = dirty_tiles
+        self.changed_percentage = changed_percentage
+        self.complete = complete
+
+    @property
+    def dirty_count(self) -> int:
+        """Number of tiles found dirty"""
+        return int(self.dirty_tiles.sum())
+
+    def __bool__(self) -> bool:
+        return self.changed
+
+    def __repr__(self) -> str:
+        return (
+            f"ChangeResult(changed={self.changed}, "
+            f"{self.changed_percentage:.2f}% of {self.dirty_tiles.size} tiles"
+            f"{'' if self.complete else ', early exit'})"
+        )
+
+
+class ChangeDetector:
+    """
+    Detects screen changes by comparing downsampled grayscale tiles
+
+    Both captures are box-downscaled to grayscale, split into square tiles
+    and compared one band of tiles at a time with vectorized NumPy. A tile is
+    dirty when any of its pixels moved by more than the pixel delta, and
+    comparison stops as soon as the dirty fraction crosses the threshold.
+    """
+
+    def __init__(
+        self,
+        downscale: int = None,
+        tile_size: int = None,
+        pixel_delta: int = None
+    ):
+        """
+        Initialize change detector
+
+        Args:
+            downscale: Box-downscale factor (defaults to config.CHANGE_DETECTION_DOWNSCALE)
+            tile_size: Tile side in downscaled pixels
+                      (defaults to config.CHANGE_DETECTION_TILE_SIZE)
+            pixel_delta: Gray-level difference marking a pixel as changed
+                        (defaults to config.CHANGE_DETECTION_PIXEL_DELTA)
+        """
+        self.downscale = downscale or config.CHANGE_DETECTION_DOWNSCALE
+        self.tile_size = tile_size or config.CHANGE_DETECTION_TILE_SIZE
+        self.pixel_delta = (
+            pixel_delta if pixel_delta is not None
+            else config.CHANGE_DETECTION_PIXEL_DELTA
+        )
+
+    def _gray(self, source: ImageSource) -> np.ndarray:
+        """Downscaled grayscale view of a frame or image"""
+        if not isinstance(source, Frame):
+            source = Frame.from_image(as_image(source))
+        return source.gray(self.downscale)
+
+    def tile_grid(self, shape: Tuple[int, int]) -> Tuple[int, int]:
+        """
+        Number of tile rows and columns for a downscaled shape
+
+        Args:
+            shape: (height, width) of the downscaled grayscale view
+
+        Returns:
+            Tuple of (rows, cols)
+        """
+        return (
+            math.ceil(shape[0] / self.tile_size),
+            math.ceil(shape[1] / self.tile_size)
+        )
+
+    def compare(
+        self,
+        before: ImageSource,
+        after: ImageSource,
+        threshold: float = None
+    ) -> ChangeResult:
+        """
+        Compares two captures tile by tile
+
+        Args:
+            before: Frame or image before action
+            after: Frame or image after action
+            threshold: Percentage of dirty tiles that counts as a change
+                      (defaults to config.SCREEN_CHANGE_THRESHOLD)
+
+        Returns:
+            ChangeResult (truthy when the screen changed)
+
+        Raises:
+            ScreenChangeDetectionError: If comparison fails
+        """
+        if threshold is None:
+            threshold = config.SCREEN_CHANGE_THRESHOLD
+
+        try:
+            gray_before = self._gray(before)
+            gray_after = self._gray(after)
+
+            rows, cols = self.tile_grid(gray_before.shape)
+            dirty = np.zeros((rows, cols), dtype=bool)
+
+            # A different resolution means the whole screen changed
+            if gray_before.shape != gray_after.shape:
+                dirty[:] = True
+                return ChangeResult(True, dirty, 100.0)
+
+            total = rows * cols
+            limit = threshold / 100 * total
+            column_starts = np.arange(0, gray_before.shape[1], self.tile_size)
+            dirty_count = 0
+
+            for row in range(rows):
+                y1 = row * self.tile_size
+                y2 = y1 + self.tile_size
+
+                band_before = gray_before[y1:y2].astype(np.int16)
+                band_after = gray_after[y1:y2].astype(np.int16)
+                changed_pixels = (
+                    np.abs(band_after - band_before) > self.pixel_delta
+                )
+
+                # Collapse rows, then OR each tile's columns together
+                changed_columns = changed_pixels.any(axis=0)
+                dirty[row] = np.logical_or.reduceat(
+                    changed_columns,
+                    column_starts
+                )
+                dirty_count += int(dirty[row].sum())
+
+                if dirty_count > limit:
+                    return ChangeResult(
+                        True,
+                        dirty,
+                        dirty_count / total * 100,
+                        complete=row == rows - 1
+                    )
+
+            return ChangeResult(False, dirty, dirty_count / total * 100)
+
+        except Exception as e:
+            raise ScreenChangeDetectionError(
+                f"Failed to detect screen changes: {e}"
+            )
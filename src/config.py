@@ -6,7 +6,7 @@ Centralizes all configuration variables and constants
 """
 
 import os
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 
 class Config:
@@ -17,27 +17,132 @@ class Config:
     PROMPT_ID: str = "pmpt_68f82a9cf29881959623076506862a040abd541da6bc3103"
     PROMPT_VERSION: str = "1"
     MODEL: str = "gpt-4o-mini"
-
-    # File Paths
+    VISION_STREAMING: bool = True  # Stream vision answers and act once cells arrive
+    VISION_RESPONSE_MODE: str = "lean"  # "lean" (strict schema) or "verbose" (with reasoning)
+    VISION_STREAM_DRAIN_TIMEOUT: float = 30.0  # Seconds to read the rest of a stream closed early, for its usage
+
+    # HTTP Connection Pool (shared by all OpenAI requests of a client)
+    HTTP_MAX_CONNECTIONS: int = 10  # Concurrent connections
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10  # Idle connections kept open
+    HTTP_KEEPALIVE_EXPIRY: float = 120.0  # Seconds an idle connection is kept
+    HTTP_HTTP2: bool = True  # Use HTTP/2 when the h2 package is installed
+
+    # Request Policy (deadlines, retries and hedging of API calls)
+    REQUEST_DEADLINE: float = 60.0  # Seconds per request, all attempts included
+    REQUEST_ATTEMPT_TIMEOUT: float = 30.0  # Seconds per attempt
+    REQUEST_MAX_ATTEMPTS: int = 3  # Attempts per request (hedges not counted)
+    REQUEST_BACKOFF_BASE: float = 0.5  # First retry waits up to this many seconds
+    REQUEST_BACKOFF_MAX: float = 8.0  # Cap of the exponential backoff in seconds
+    REQUEST_HEDGE_ENABLED: bool = False  # Send a duplicate when an attempt is slow
+    REQUEST_HEDGE_DELAY: float = 5.0  # Hedge delay until the p95 latency is known
+    REQUEST_HEDGE_MIN_SAMPLES: int = 20  # Latency samples needed to hedge at p95
+
+    # Rate Limiting (client-side budget shared by every client of an API key)
+    RATE_LIMIT_ENABLED: bool = False  # Queue requests over budget instead of hitting 429s
+    RATE_LIMIT_RPM: int = 500  # Requests per minute
+    RATE_LIMIT_TPM: int = 200000  # Tokens per minute (input + output)
+    RATE_LIMIT_IMAGE_TOKENS: int = 1000  # Estimated tokens per screenshot
+    RATE_LIMIT_VISION_OUTPUT_TOKENS: int = 300  # Estimated output tokens of a vision answer
+
+    # File Paths (only written when DEBUG_SAVE_IMAGES is enabled)
     SCREENSHOT_PATH: str = "screen.png"
     SCREENSHOT_GRID_PATH: str = "screen_grid.png"
+    DEBUG_SAVE_IMAGES: bool = False  # Save captures and grids for inspection
+
+    # Screen Capture
+    CAPTURE_MONITOR_INDEX: int = 1  # mss monitor index (1 = main monitor)
+    GEOMETRY_PROBE_INTERVAL: float = 1.0  # Seconds between display layout probes
+    GEOMETRY_WATCH_RANDR: bool = True  # Use X11 RandR events instead of probing
+
+    # Background Capture
+    BACKGROUND_CAPTURE_ENABLED: bool = False  # Grab frames on a background thread
+    BACKGROUND_CAPTURE_FPS: float = 15.0  # Background capture rate
+    BACKGROUND_CAPTURE_RING_SIZE: int = 4  # Frames kept for readers
 
     # Grid System Configuration
     GRID_COLS: int = 32  # Number of columns in the grid
     GRID_ROWS: int = 18  # Number of rows in the grid (32x18 = 576 cells)
+    GRID_ADAPTIVE: bool = False  # Pick grid density per frame and target size
+    GRID_CELL_SIZES: Dict[str, int] = {  # Target cell side (model-visible pixels)
+        "small": 40,
+        "medium": 60,
+        "large": 100,
+    }
+    GRID_MIN_CELL_SIZE: int = 28  # Smallest cell that keeps labels legible
+    GRID_MIN_COLS: int = 8  # Adaptive grid bounds
+    GRID_MAX_COLS: int = 64
+    GRID_MIN_ROWS: int = 6
+    GRID_MAX_ROWS: int = 40
+    GRID_COARSE_TO_FINE: bool = False  # Locate on a coarse grid, then refine on a crop
+    GRID_COARSE_MAX_SIZE: int = 1024  # Longest side of the coarse downscaled screen
+    GRID_COARSE_COLS: int = 16  # Coarse grid columns
+    GRID_COARSE_ROWS: int = 9  # Coarse grid rows
+    GRID_FINE_COLS: int = 12  # Fine grid columns over the selected region
+    GRID_FINE_ROWS: int = 8  # Fine grid rows over the selected region
+    GRID_FINE_PADDING: int = 1  # Coarse cells of context around the selection
+    GRID_CACHE_MAX_BYTES: int = 128 * 1024 * 1024  # Cached gridded images (0 disables)
+    GRID_FONT_PATH: Optional[str] = None  # Label font (discovered automatically if unset)
+    GRID_OVERLAY_CACHE_MAX_BYTES: int = 128 * 1024 * 1024  # Cached RGBA overlay layers
+
+    # Plan Cache (persistent, in front of plan generation)
+    PLAN_CACHE_ENABLED: bool = False  # Replay validated plans for repeated instructions
+    PLAN_CACHE_PATH: str = os.path.join(
+        os.path.expanduser("~"), ".unifyvision", "plans.sqlite3"
+    )
+    PLAN_CACHE_TTL: float = 30 * 24 * 3600.0  # Seconds an unpinned plan stays valid
+    PLAN_CACHE_MAX_ENTRIES: int = 1000  # Least recently used unpinned plans evicted beyond this
+
+    # Location Cache (persistent, in front of grid lookups)
+    LOCATION_CACHE_ENABLED: bool = False  # Reuse locations resolved on matching screens
+    LOCATION_CACHE_PATH: str = os.path.join(
+        os.path.expanduser("~"), ".unifyvision", "locations.sqlite3"
+    )
+    LOCATION_CACHE_TTL: float = 7 * 24 * 3600.0  # Seconds an entry stays valid
+    LOCATION_CACHE_MAX_ENTRIES: int = 5000  # Least recently used entries evicted beyond this
+    LOCATION_CACHE_HASH_SIZE: int = 16  # Perceptual hash side (16 -> 256 bits)
+    LOCATION_CACHE_MAX_DISTANCE: int = 8  # Differing hash bits still matching a screen
+    LOCATION_CACHE_VERIFY: bool = True  # Check the element's pixels before using a hit
+    LOCATION_CACHE_VERIFY_THRESHOLD: float = 10.0  # Percentage of patch tiles tolerated
+    LOCATION_CACHE_PATCH_MARGIN: int = 8  # Pixels kept around the element for verification
 
     # PyAutoGUI Configuration
     FAILSAFE_ENABLED: bool = True  # Move mouse to top-left corner to cancel
     PAUSE_BETWEEN_ACTIONS: float = 0.5  # Pause between actions in seconds
+    SETTLED_PAUSE_BETWEEN_ACTIONS: float = 0.02  # Pause when adaptive settling is on
+    MOUSE_MOVE_DURATION: float = 0.2  # Animated move time (cap on settling when enabled)
+    CLICK_HOVER_DELAY: float = 0.1  # Delay between move and click
 
     # Image Processing
     MAX_IMAGE_SIZE: int = 2000  # Maximum size for image before resizing
 
+    # Image Encoding
+    IMAGE_FORMAT: str = "png"  # "png", "jpeg" or "webp"
+    IMAGE_PNG_OPTIMIZE: bool = True  # Smaller PNGs at a much higher CPU cost
+    IMAGE_QUALITY: int = 85  # JPEG/WebP quality (upper bound in byte-budget mode)
+    IMAGE_WEBP_METHOD: int = 4  # WebP effort 0 (fast) to 6 (small)
+    IMAGE_BYTE_BUDGET: Optional[int] = None  # Target payload bytes; picks quality/resolution
+    IMAGE_MIN_QUALITY: int = 40  # Lowest quality tried in byte-budget mode
+    ENCODE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # Encoded payload cache (0 disables)
+
     # Action Execution
+    BATCH_LOCATE_ENABLED: bool = True  # Locate consecutive click targets in one request
+    BATCH_LOCATE_MAX_TARGETS: int = 5  # Targets per batch request
     STEP_DELAY: float = 0.5  # Delay between plan steps
     CLICK_VERIFICATION_DELAY: float = 0.4  # Delay after click for verification
     TYPE_DELAY: float = 0.1  # Delay after typing
 
+    # Adaptive Settling (fixed delays above become upper bounds)
+    SETTLE_ENABLED: bool = True  # Wait for the screen to stop changing
+    SETTLE_POLL_INTERVAL: float = 0.03  # Seconds between settle samples
+    SETTLE_STABLE_SAMPLES: int = 3  # Consecutive unchanged samples required
+    SETTLE_MIN_WAIT: float = 0.1  # Floor that lets the UI start reacting
+    SETTLE_DOWNSCALE: int = 8  # Box-downscale factor for settle samples
+    SETTLE_CHANGE_THRESHOLD: float = 0.5  # Percentage of tiles tolerated (carets, spinners)
+
+    # Startup
+    STARTUP_COUNTDOWN: float = 3.0  # Seconds before execution starts
+    SCREEN_PREPARE_DELAY: float = 5.0  # Seconds for the user to prepare the screen
+
     # Click Pattern
     CLICK_PATTERN_RADIUS: int = 20  # Radius for multi-click pattern
 
@@ -52,7 +157,18 @@ class Config:
     MAX_TOKENS_PLANNING: int = 1500
 
     # Change Detection
-    SCREEN_CHANGE_THRESHOLD: float = 0.1  # Percentage threshold for screen change detection
+    SCREEN_CHANGE_THRESHOLD: float = 0.1  # Percentage of changed tiles that counts as a change
+    CHANGE_DETECTION_DOWNSCALE: int = 4  # Box-downscale factor before comparing
+    CHANGE_DETECTION_TILE_SIZE: int = 8  # Tile side in downscaled pixels
+    CHANGE_DETECTION_PIXEL_DELTA: int = 24  # Gray-level difference marking a pixel as changed
+
+    # Click Verification (Region of Interest)
+    CLICK_VERIFICATION_ROI_ENABLED: bool = True  # Compare only a window around the click
+    CLICK_VERIFICATION_ROI_SIZE: int = 300  # Side of the square window in physical pixels
+    # Extra (left, top, width, height) regions in physical pixels that react to clicks
+    CLICK_VERIFICATION_DYNAMIC_REGIONS: List[Tuple[int, int, int, int]] = []
+    ROI_CHANGE_THRESHOLD: float = 2.0  # Percentage of ROI tiles that confirms a click
+    ROI_NOISE_THRESHOLD: float = 1.0  # Percentage of ROI tiles treated as no change (caret, hover)
 
     @classmethod
     def validate(cls) -> bool:
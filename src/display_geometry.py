@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Display geometry module for UnifyVision
+Caches monitor scale/offsets and maps between image and logical coordinates
+"""
+
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+import pyautogui
+
+from .config import config
+from .exceptions import ScreenCaptureError
+from .logger import logger
+
+
+class DisplayGeometry:
+    """Snapshot of the captured monitor layout and its coordinate transform"""
+
+    def __init__(
+        self,
+        physical_width: int,
+        physical_height: int,
+        logical_width: int,
+        logical_height: int,
+        offset_x: int = 0,
+        offset_y: int = 0
+    ):
+        """
+        Initialize display geometry
+
+        Args:
+            physical_width: Monitor width in captured (physical) pixels
+            physical_height: Monitor height in captured (physical) pixels
+            logical_width: Screen width reported by pyautogui
+            logical_height: Screen height reported by pyautogui
+            offset_x: Monitor left edge in mss (physical) coordinates
+            offset_y: Monitor top edge in mss (physical) coordinates
+        """
+        self.physical_width = physical_width
+        self.physical_height = physical_height
+        self.logical_width = logical_width
+        self.logical_height = logical_height
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+        self.scale_x = physical_width / logical_width
+        self.scale_y = physical_height / logical_height
+
+    @property
+    def scale(self) -> Tuple[float, float]:
+        """Ratio between physical and logical pixels as (scale_x, scale_y)"""
+        return self.scale_x, self.scale_y
+
+    def to_logical(self, x_image: float, y_image: float) -> Tuple[int, int]:
+        """
+        Converts image (physical, monitor-relative) coordinates to the
+        logical screen coordinates pyautogui expects
+
+        Args:
+            x_image: X in captured image pixels
+            y_image: Y in captured image pixels
+
+        Returns:
+            Tuple of (x, y) logical coordinates
+        """
+        return (
+            int((self.offset_x + x_image) / self.scale_x),
+            int((self.offset_y + y_image) / self.scale_y)
+        )
+
+    def to_physical(self, x_logical: float, y_logical: float) -> Tuple[int, int]:
+        """
+        Converts logical screen coordinates to image (physical,
+        monitor-relative) coordinates
+
+        Args:
+            x_logical: X in logical screen coordinates
+            y_logical: Y in logical screen coordinates
+
+        Returns:
+            Tuple of (x, y) image coordinates
+        """
+        return (
+            int(x_logical * self.scale_x - self.offset_x),
+            int(y_logical * self.scale_y - self.offset_y)
+        )
+
+    def _key(self) -> Tuple[int, ...]:
+        return (
+            self.physical_width,
+            self.physical_height,
+            self.logical_width,
+            self.logical_height,
+            self.offset_x,
+            self.offset_y
+        )
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, DisplayGeometry) and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return (
+            f"DisplayGeometry({self.physical_width}x{self.physical_height} "
+            f"physical, {self.logical_width}x{self.logical_height} logical, "
+            f"scale {self.scale_x:.2f}x{self.scale_y:.2f}, "
+            f"offset ({self.offset_x}, {self.offset_y}))"
+        )
+
+
+class CoordinateTransform:
+    """
+    Maps pixels of a (possibly cropped and downscaled) image of the monitor
+    to physical monitor pixels, and on to logical screen coordinates
+
+    Coordinates stay fractional until the final logical conversion, so the
+    chain image -> grid -> physical -> logical never accumulates rounding.
+    """
+
+    def __init__(
+        self,
+        geometry: Optional[DisplayGeometry] = None,
+        scale_x: float = 1.0,
+        scale_y: float = 1.0,
+        offset_x: float = 0.0,
+        offset_y: float = 0.0
+    ):
+        """
+        Initialize coordinate transform
+
+        Args:
+            geometry: Display geometry for the logical conversion
+            scale_x: Physical pixels per image pixel horizontally
+            scale_y: Physical pixels per image pixel vertically
+            offset_x: Physical X of the image's left edge (monitor-relative)
+            offset_y: Physical Y of the image's top edge (monitor-relative)
+        """
+        self.geometry = geometry
+        self.scale_x = scale_x
+        self.scale_y = scale_y
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+
+    def region(
+        self,
+        left: float,
+        top: float,
+        scale_x: float = 1.0,
+        scale_y: float = None
+    ) -> "CoordinateTransform":
+        """
+        Transform for an image derived from this one by cropping at
+        (left, top) and then downscaling
+
+        Args:
+            left: Crop left edge in this image's pixels
+            top: Crop top edge in this image's pixels
+            scale_x: This image's pixels per derived image pixel horizontally
+            scale_y: Same vertically (defaults to scale_x)
+
+        Returns:
+            CoordinateTransform for the derived image
+        """
+        scale_y = scale_x if scale_y is None else scale_y
+        return CoordinateTransform(
+            self.geometry,
+            self.scale_x * scale_x,
+            self.scale_y * scale_y,
+            self.offset_x + left * self.scale_x,
+            self.offset_y + top * self.scale_y
+        )
+
+    def to_physical(self, x: float, y: float) -> Tuple[float, float]:
+        """
+        Converts image coordinates to physical monitor-relative coordinates
+
+        Args:
+            x: X in image pixels
+            y: Y in image pixels
+
+        Returns:
+            Tuple of (x, y) physical coordinates (fractional)
+        """
+        return self.offset_x + x * self.scale_x, self.offset_y + y * self.scale_y
+
+    def box_to_physical(
+        self,
+        box: Tuple[float, float, float, float]
+    ) -> Tuple[float, float, float, float]:
+        """
+        Converts an image (left, top, right, bottom) box to physical pixels
+
+        Args:
+            box: Box in image pixels
+
+        Returns:
+            Box in physical pixels
+        """
+        left, top = self.to_physical(box[0], box[1])
+        right, bottom = self.to_physical(box[2], box[3])
+        return left, top, right, bottom
+
+    def to_logical(self, x: float, y: float) -> Tuple[int, int]:
+        """
+        Converts image coordinates to logical screen coordinates
+
+        Args:
+            x: X in image pixels
+            y: Y in image pixels
+
+        Returns:
+            Tuple of (x, y) logical coordinates
+
+        Raises:
+            ScreenCaptureError: If the transform has no display geometry
+        """
+        if self.geometry is None:
+            raise ScreenCaptureError("Coordinate transform has no display geometry")
+        return self.geometry.to_logical(*self.to_physical(x, y))
+
+    def __repr__(self) -> str:
+        return (
+            f"CoordinateTransform(scale {self.scale_x:.3f}x{self.scale_y:.3f}, "
+            f"offset ({self.offset_x:.1f}, {self.offset_y:.1f}))"
+        )
+
+
+class _RandRWatcher:
+    """Watches X11 RandR screen-change events on a dedicated connection"""
+
+    def __init__(self):
+        from Xlib import display as xdisplay
+        from Xlib.ext import randr
+
+        self._display = xdisplay.Display()
+        if not self._display.has_extension("RANDR"):
+            self._display.close()
+            raise RuntimeError("RandR extension not available")
+
+        root = self._display.screen().root
+        root.xrandr_select_input(
+            randr.RRScreenChangeNotifyMask | randr.RROutputChangeNotifyMask
+        )
+        self._display.flush()
+
+    def changed(self) -> bool:
+        """Drains pending events; True if any screen change was reported"""
+        changed = False
+        while self._display.pending_events():
+            self._display.next_event()
+            changed = True
+        return changed
+
+    def close(self) -> None:
+        """Closes the X connection"""
+        self._display.close()
+
+
+class DisplayGeometryService:
+    """
+    Computes the display geometry once and serves the cached transform
+
+    The cache is invalidated only when the monitor configuration changes:
+    via RandR events on X11, otherwise by a cheap probe of the logical
+    screen size at most once per probe interval.
+    """
+
+    def __init__(
+        self,
+        session,
+        probe_interval: float = None,
+        watch_randr: bool = None
+    ):
+        """
+        Initialize geometry service
+
+        Args:
+            session: CaptureSession providing the monitor layout
+            probe_interval: Seconds between size probes
+                           (defaults to config.GEOMETRY_PROBE_INTERVAL)
+            watch_randr: Listen for RandR events when available
+                        (defaults to config.GEOMETRY_WATCH_RANDR)
+        """
+        self.session = session
+        self.probe_interval = (
+            probe_interval if probe_interval is not None
+            else config.GEOMETRY_PROBE_INTERVAL
+        )
+        self.watch_randr = (
+            watch_randr if watch_randr is not None
+            else config.GEOMETRY_WATCH_RANDR
+        )
+        self.computations = 0
+
+        self._geometry: Optional[DisplayGeometry] = None
+        self._last_probe = 0.0
+        self._listeners: List[Callable[[DisplayGeometry], None]] = []
+        self._watcher: Optional[_RandRWatcher] = None
+        self._watcher_checked = False
+        self._lock = threading.RLock()
+
+    def add_listener(self, callback: Callable[[DisplayGeometry], None]) -> None:
+        """
+        Registers a callback invoked with the new geometry after a change
+
+        Args:
+            callback: Function receiving the new DisplayGeometry
+        """
+        self._listeners.append(callback)
+
+    def current(self) -> DisplayGeometry:
+        """
+        Returns the cached geometry, recomputing it only after a change
+
+        Returns:
+            DisplayGeometry
+
+        Raises:
+            ScreenCaptureError: If the geometry cannot be determined
+        """
+        with self._lock:
+            if self._geometry is None:
+                # Subscribe first: RandR only reports changes made afterwards
+                self._get_watcher()
+                self._geometry = self._compute()
+            elif self._configuration_changed():
+                previous = self._geometry
+                self.session.refresh()
+                self._geometry = self._compute()
+
+                if self._geometry != previous:
+                    logger.info(f"Display configuration changed: {self._geometry!r}")
+                    for callback in self._listeners:
+                        callback(self._geometry)
+
+            return self._geometry
+
+    def invalidate(self) -> None:
+        """Forces the geometry to be recomputed on next access"""
+        with self._lock:
+            self._geometry = None
+            self.session.refresh()
+
+    def close(self) -> None:
+        """Stops watching for display changes"""
+        with self._lock:
+            if self._watcher is not None:
+                self._watcher.close()
+                self._watcher = None
+            self._watcher_checked = False
+
+    def _compute(self) -> DisplayGeometry:
+        """Queries the monitor layout and logical screen size"""
+        try:
+            monitor = self.session.monitor
+            logical_size = pyautogui.size()
+
+            geometry = DisplayGeometry(
+                monitor["width"],
+                monitor["height"],
+                logical_size.width,
+                logical_size.height,
+                monitor.get("left", 0),
+                monitor.get("top", 0)
+            )
+
+            self.computations += 1
+            self._last_probe = time.monotonic()
+            logger.debug(f"Display geometry computed: {geometry!r}")
+
+            return geometry
+
+        except Exception as e:
+            raise ScreenCaptureError(f"Failed to detect display geometry: {e}")
+
+    def _configuration_changed(self) -> bool:
+        """Cheap check for a monitor configuration change"""
+        watcher = self._get_watcher()
+        if watcher is not None:
+            return watcher.changed()
+
+        now = time.monotonic()
+        if now - self._last_probe < self.probe_interval:
+            return False
+
+        self._last_probe = now
+        logical_size = pyautogui.size()
+        return (
+            logical_size.width != self._geometry.logical_width or
+            logical_size.height != self._geometry.logical_height
+        )
+
+    def _get_watcher(self) -> Optional[_RandRWatcher]:
+        """Starts the RandR watcher on first use if enabled and available"""
+        if not self._watcher_checked:
+            self._watcher_checked = True
+            if self.watch_randr:
+                try:
+                    self._watcher = _RandRWatcher()
+                    logger.debug("Watching RandR for display changes")
+                except Exception as e:
+                    logger.debug(f"RandR unavailable, probing size instead: {e}")
+        return self._watcher
@@ -31,6 +31,13 @@ class OpenAIClientError(UnifyVisionError):
     pass
 
 
+class RequestDeadlineError(OpenAIClientError):
+    """Raised when a request runs out of time across its attempts"""
+    def __init__(self, message: str, attempts: list = None):
+        self.attempts = attempts or []
+        super().__init__(message)
+
+
 class PlanningError(UnifyVisionError):
     """Raised when plan generation fails"""
     pass
@@ -5,15 +5,21 @@ Executor module for UnifyVision
 Handles execution of complete action plans
 """
 
-import time
+import asyncio
 import glob
 import os
-from typing import Optional
+from typing import Dict, List, Optional
 
 from .planner import ActionPlan
 from .actions import ActionExecutor
 from .config import config
 from .exceptions import ActionExecutionError, ElementNotFoundError
+from .http_pool import ConnectionTrace
+from .location_cache import LocationCache
+from .metrics import RequestStats
+from .openai_client import OpenAIClient
+from .rate_limiter import RateLimiter
+from .request_policy import RequestPolicy
 from .logger import logger, log_execute, log_success, log_cleanup
 
 
@@ -31,6 +37,10 @@ class PlanExecutor:
         self.successful_steps = 0
         self.failed_steps = 0
 
+    def close(self) -> None:
+        """Releases resources held by the action executor"""
+        self.action_executor.close()
+
     def execute_plan(self, plan: ActionPlan) -> bool:
         """
         Executes a complete action plan
@@ -41,28 +51,20 @@ class PlanExecutor:
         Returns:
             True if all steps succeeded, False otherwise
         """
-        log_execute(f"Starting plan execution ({len(plan)} steps)")
-        logger.info("Press Cmd+C to cancel execution")
-        logger.info("=" * 60)
-
-        self.successful_steps = 0
-        self.failed_steps = 0
+        self._start_plan(plan)
 
         try:
             for i, step in enumerate(plan, 1):
                 logger.info(f"\n--- Step {i}/{len(plan)} ---")
 
-                success = self._execute_step(step, i)
+                self._prefetch_click_targets(plan, i - 1)
 
-                if success:
-                    self.successful_steps += 1
-                else:
-                    self.failed_steps += 1
-                    logger.warning(f"Step {i} failed, but continuing...")
+                success = self._execute_step(step, i)
+                self._count_step(success, i)
 
-                # Delay between steps
+                # Delay between steps (ends early once the screen settles)
                 if i < len(plan):  # Don't wait after last step
-                    time.sleep(config.STEP_DELAY)
+                    self.action_executor.wait_for_settle(config.STEP_DELAY)
 
         except KeyboardInterrupt:
             logger.info("\n\nExecution interrupted by user")
@@ -75,10 +77,193 @@ class PlanExecutor:
             return False
 
         finally:
+            self._wait_for_streams()
             self._print_summary(len(plan))
 
         return self.failed_steps == 0
 
+    async def execute_plan_async(self, plan: ActionPlan) -> bool:
+        """
+        Executes a complete action plan on the running event loop
+
+        Vision requests are awaited on the loop; grabs, input and waits run
+        on worker threads, so other tasks on the loop keep running. While a
+        wait step runs (it leaves the screen alone), the click run that
+        follows it is already batch-located; locations whose pixels change
+        by the time they are used are dropped as usual. Cancelling the task
+        stops the plan; input already running on its thread still completes.
+
+        Args:
+            plan: ActionPlan to execute
+
+        Returns:
+            True if all steps succeeded, False otherwise
+
+        Raises:
+            asyncio.CancelledError: If the task is cancelled
+        """
+        self._start_plan(plan)
+
+        # Prefetches started ahead of time, by index of their run's first step
+        prefetches: Dict[int, asyncio.Task] = {}
+
+        try:
+            for i, step in enumerate(plan, 1):
+                logger.info(f"\n--- Step {i}/{len(plan)} ---")
+
+                prefetch = prefetches.pop(i - 1, None)
+                if prefetch is not None:
+                    await prefetch
+                else:
+                    targets = self._click_run(plan, i - 1)
+                    if targets:
+                        await self.action_executor.prefetch_targets_async(targets)
+
+                if step.get("action") == "wait":
+                    self._prefetch_after_wait(plan, i - 1, prefetches)
+
+                success = await self._execute_step_async(step, i)
+                self._count_step(success, i)
+
+                # Delay between steps (ends early once the screen settles)
+                if i < len(plan):  # Don't wait after last step
+                    await asyncio.to_thread(
+                        self.action_executor.wait_for_settle,
+                        config.STEP_DELAY
+                    )
+
+        except asyncio.CancelledError:
+            logger.info("\n\nExecution cancelled")
+            raise
+
+        except Exception as e:
+            logger.error(f"Unexpected error during execution: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+
+        finally:
+            for prefetch in prefetches.values():
+                prefetch.cancel()
+            await asyncio.gather(*prefetches.values(), return_exceptions=True)
+
+            await self._wait_for_streams_async()
+            self._print_summary(len(plan))
+
+        return self.failed_steps == 0
+
+    def _prefetch_after_wait(
+        self,
+        plan: ActionPlan,
+        index: int,
+        prefetches: Dict[int, asyncio.Task]
+    ) -> None:
+        """
+        Starts batch-locating the click run that follows a wait step
+
+        Args:
+            plan: ActionPlan being executed
+            index: 0-based index of the wait step
+            prefetches: Prefetch tasks by index of their run's first step
+        """
+        start = index + 1
+        while start < len(plan) and plan.steps[start].get("action") == "wait":
+            start += 1
+
+        if start in prefetches:
+            return
+
+        targets = self._click_run(plan, start)
+        if targets:
+            prefetches[start] = asyncio.get_running_loop().create_task(
+                self.action_executor.prefetch_targets_async(targets)
+            )
+
+    async def _execute_step_async(self, step: dict, step_number: int) -> bool:
+        """
+        Executes a single step without blocking the event loop
+        Clicks await their vision requests on the loop; other steps run on
+        a worker thread
+
+        Args:
+            step: Step dictionary
+            step_number: Step number (for logging)
+
+        Returns:
+            True if step succeeded
+        """
+        if step.get("action") != "click" or not step.get("target"):
+            return await asyncio.to_thread(self._execute_step, step, step_number)
+
+        try:
+            return await self.action_executor.execute_click_async(
+                step["target"],
+                step.get("size_hint")
+            )
+
+        except Exception as e:
+            return self._step_failed(e, step_number)
+
+    def _start_plan(self, plan: ActionPlan) -> None:
+        """Logs the start of a plan and resets the step counters"""
+        log_execute(f"Starting plan execution ({len(plan)} steps)")
+        logger.info("Press Cmd+C to cancel execution")
+        logger.info("=" * 60)
+
+        self.successful_steps = 0
+        self.failed_steps = 0
+
+    def _count_step(self, success: bool, step_number: int) -> None:
+        """Counts a finished step"""
+        if success:
+            self.successful_steps += 1
+        else:
+            self.failed_steps += 1
+            logger.warning(f"Step {step_number} failed, but continuing...")
+
+    def _prefetch_click_targets(self, plan: ActionPlan, index: int) -> None:
+        """
+        Batch-locates a run of consecutive click steps starting at index,
+        so clicks that leave the screen unchanged skip their own lookup
+
+        Args:
+            plan: ActionPlan being executed
+            index: 0-based index of the step about to run
+        """
+        targets = self._click_run(plan, index)
+        if targets:
+            self.action_executor.prefetch_targets(targets)
+
+    def _click_run(self, plan: ActionPlan, index: int) -> List[str]:
+        """
+        Targets of the run of consecutive click steps starting at index
+
+        Args:
+            plan: ActionPlan being executed
+            index: 0-based index of a step
+
+        Returns:
+            Distinct targets worth batch-locating (empty unless batching is
+            enabled and the step starts a run of at least two clicks)
+        """
+        if not config.BATCH_LOCATE_ENABLED:
+            return []
+
+        steps = plan.steps
+        if index > 0 and steps[index - 1].get("action") == "click":
+            return []  # Inside a run that was already prefetched
+
+        targets: List[str] = []
+        for step in steps[index:]:
+            if step.get("action") != "click" or not step.get("target"):
+                break
+            if step["target"] not in targets:
+                targets.append(step["target"])
+            if len(targets) >= config.BATCH_LOCATE_MAX_TARGETS:
+                break
+
+        return targets if len(targets) > 1 else []
+
     def _execute_step(self, step: dict, step_number: int) -> bool:
         """
         Executes a single step
@@ -99,7 +284,10 @@ class PlanExecutor:
                     logger.warning(f"Step {step_number} missing target, skipping")
                     return False
 
-                return self.action_executor.execute_click(target)
+                return self.action_executor.execute_click(
+                    target,
+                    step.get("size_hint")
+                )
 
             elif action == "type":
                 text = step.get("text")
@@ -134,17 +322,39 @@ class PlanExecutor:
                 logger.warning(f"Unknown action: {action}")
                 return False
 
-        except ElementNotFoundError as e:
-            logger.error(f"Element not found: {e.element_description}")
-            return False
+        except Exception as e:
+            return self._step_failed(e, step_number)
 
-        except ActionExecutionError as e:
-            logger.error(f"Action execution error: {e}")
-            return False
+    def _step_failed(self, error: Exception, step_number: int) -> bool:
+        """
+        Logs the error that failed a step
 
-        except Exception as e:
-            logger.error(f"Unexpected error in step {step_number}: {e}")
-            return False
+        Args:
+            error: Exception raised by the step
+            step_number: Step number (for logging)
+
+        Returns:
+            Always False
+        """
+        if isinstance(error, ElementNotFoundError):
+            logger.error(f"Element not found: {error.element_description}")
+        elif isinstance(error, ActionExecutionError):
+            logger.error(f"Action execution error: {error}")
+        else:
+            logger.error(f"Unexpected error in step {step_number}: {error}")
+        return False
+
+    def _wait_for_streams(self) -> None:
+        """Lets vision streams closed early report their output tokens"""
+        client = self.action_executor.openai_client
+        if isinstance(client, OpenAIClient):
+            client.drain(config.VISION_STREAM_DRAIN_TIMEOUT)
+
+    async def _wait_for_streams_async(self) -> None:
+        """Lets vision streams closed early on this loop report their output tokens"""
+        client = self.action_executor.openai_client
+        if isinstance(client, OpenAIClient):
+            await client.aio.drain(config.VISION_STREAM_DRAIN_TIMEOUT)
 
     def _print_summary(self, total_steps: int) -> None:
         """
@@ -163,11 +373,70 @@ class PlanExecutor:
             f"Failed steps: {self.failed_steps}/{total_steps}"
         )
 
+        self._log_request_stats()
+
         if self.failed_steps == 0:
             log_success("All steps completed successfully!")
         else:
             logger.warning("Some steps failed during execution")
 
+    def _log_request_stats(self) -> None:
+        """
+        Logs the request statistics of the run
+
+        Covers model latency and output tokens per request kind, retries
+        and hedges, rate limit waits, location cache hits and connection
+        reuse of the OpenAI client.
+        """
+        client = self.action_executor.openai_client
+
+        stats = getattr(client, "stats", None)
+        if isinstance(stats, RequestStats):
+            for label, numbers in sorted(stats.summary().items()):
+                tokens = numbers["mean_output_tokens"]
+                logger.info(
+                    f"{label}: {numbers['requests']} request(s), "
+                    f"p50 {numbers['p50_ms']:.0f}ms, p95 {numbers['p95_ms']:.0f}ms, "
+                    f"output tokens {'n/a' if tokens is None else f'{tokens:.0f}'}"
+                )
+
+        policy = getattr(client, "policy", None)
+        if isinstance(policy, RequestPolicy):
+            for label, outcomes in sorted(policy.stats().items()):
+                logger.info(
+                    f"{label} attempts: "
+                    + ", ".join(f"{outcome} {count}" for outcome, count in sorted(outcomes.items()))
+                )
+
+        rate_limiter = getattr(client, "rate_limiter", None)
+        if isinstance(rate_limiter, RateLimiter):
+            numbers = rate_limiter.stats()
+            logger.info(
+                f"Rate limit: {numbers['waited']} of {numbers['requests']} request(s) "
+                f"queued (peak depth {numbers['max_queue_depth']}), "
+                f"mean wait {numbers['mean_wait_ms']:.0f}ms, max {numbers['max_wait_ms']:.0f}ms"
+            )
+
+        location_cache = getattr(self.action_executor, "location_cache", None)
+        if isinstance(location_cache, LocationCache):
+            numbers = location_cache.stats()
+            logger.info(
+                f"Location cache: {numbers['hits']} hit(s), "
+                f"{numbers['misses']} miss(es) ({numbers['rejected']} failed "
+                f"verification), hit rate {numbers['hit_rate']:.0%}"
+            )
+
+        connections = getattr(client, "connections", None)
+        if isinstance(connections, ConnectionTrace):
+            numbers = connections.stats()
+            logger.info(
+                f"HTTP: {numbers['requests']} request(s) over "
+                f"{numbers['connections']} connection(s), "
+                f"{numbers['tls_handshakes']} TLS handshake(s) "
+                f"({numbers['connect_ms']:.0f}ms), "
+                f"reuse {numbers['reuse_rate']:.0%}, {numbers['http_versions']}"
+            )
+
     @staticmethod
     def cleanup_temporary_files() -> None:
         """Removes all temporary files created during execution"""
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Frame module for UnifyVision
+Wraps raw screen grabs and derives images, grayscale views and hashes lazily
+"""
+
+import time
+import zlib
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+from PIL import Image
+
+
+class Frame:
+    """
+    A captured screen (or region) backed by the raw BGRA buffer
+
+    The pixels are viewed as a (height, width, 4) uint8 NumPy array without
+    copying. Every derived representation (RGB PIL image, grayscale views,
+    downscaled images, content hash) is computed on first use and memoized,
+    so one capture can flow through change detection, gridding and encoding
+    without being converted more than once.
+    """
+
+    def __init__(
+        self,
+        pixels: np.ndarray,
+        left: int = 0,
+        top: int = 0,
+        timestamp: Optional[float] = None
+    ):
+        """
+        Initialize frame
+
+        Args:
+            pixels: (height, width, 4) uint8 array in BGRA order
+            left: X of the frame relative to the captured monitor
+            top: Y of the frame relative to the captured monitor
+            timestamp: time.monotonic() of the grab (defaults to now)
+        """
+        if pixels.ndim != 3 or pixels.shape[2] != 4:
+            raise ValueError(f"Expected BGRA pixels, got shape {pixels.shape}")
+
+        pixels.flags.writeable = False
+        self.pixels = pixels
+        self.left = left
+        self.top = top
+        self.timestamp = timestamp if timestamp is not None else time.monotonic()
+        self._memo: Dict[Any, Any] = {}
+
+    @classmethod
+    def from_screenshot(
+        cls,
+        screenshot,
+        left: int = 0,
+        top: int = 0,
+        timestamp: Optional[float] = None
+    ) -> "Frame":
+        """
+        Wraps an mss ScreenShot without copying its buffer
+
+        Args:
+            screenshot: mss ScreenShot
+            left: X of the grab relative to the captured monitor
+            top: Y of the grab relative to the captured monitor
+            timestamp: time.monotonic() of the grab (defaults to now)
+
+        Returns:
+            Frame instance
+        """
+        width, height = screenshot.size
+        pixels = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(
+            height, width, 4
+        )
+        return cls(pixels, left, top, timestamp)
+
+    @classmethod
+    def from_image(cls, img: Image.Image) -> "Frame":
+        """
+        Builds a frame from a PIL image (copies the pixels)
+
+        Args:
+            img: PIL image in any mode
+
+        Returns:
+            Frame instance
+        """
+        rgba = np.asarray(img.convert("RGBA"))
+        frame = cls(np.ascontiguousarray(rgba[:, :, [2, 1, 0, 3]]))
+        if img.mode == "RGB":
+            frame._memo["image"] = img
+        return frame
+
+    @property
+    def width(self) -> int:
+        """Frame width in pixels"""
+        return self.pixels.shape[1]
+
+    @property
+    def height(self) -> int:
+        """Frame height in pixels"""
+        return self.pixels.shape[0]
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """Frame size as (width, height), like PIL"""
+        return self.width, self.height
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the raw pixel buffer in bytes"""
+        return self.pixels.nbytes
+
+    def _contiguous(self) -> np.ndarray:
+        """Returns the pixels as a C-contiguous array (copies crops only)"""
+        if self.pixels.flags.c_contiguous:
+            return self.pixels
+        if "contiguous" not in self._memo:
+            self._memo["contiguous"] = np.ascontiguousarray(self.pixels)
+        return self._memo["contiguous"]
+
+    @property
+    def image(self) -> Image.Image:
+        """RGB PIL image of the frame (converted once)"""
+        if "image" not in self._memo:
+            self._memo["image"] = Image.frombuffer(
+                "RGB",
+                self.size,
+                self._contiguous(),
+                "raw",
+                "BGRX",
+                0,
+                1
+            )
+        return self._memo["image"]
+
+    def downscaled(self, factor: int) -> Image.Image:
+        """
+        RGB image reduced by an integer factor using box filtering
+
+        Args:
+            factor: Reduction factor (1 returns the full image)
+
+        Returns:
+            PIL image
+        """
+        factor = max(1, int(factor))
+        if factor == 1:
+            return self.image
+
+        key = ("downscaled", factor)
+        if key not in self._memo:
+            self._memo[key] = self.image.reduce(factor)
+        return self._memo[key]
+
+    def _luma(self) -> Image.Image:
+        """
+        Full-resolution intensity image read straight from the BGRA buffer
+
+        The buffer is viewed as RGBA without conversion, so the red and blue
+        luma weights are swapped. That keeps it a single pass over the pixels
+        and is a consistent measure for comparisons and hashing.
+        """
+        if "luma" not in self._memo:
+            rgba_view = Image.frombuffer(
+                "RGBA",
+                self.size,
+                self._contiguous(),
+                "raw",
+                "RGBA",
+                0,
+                1
+            )
+            self._memo["luma"] = rgba_view.convert("L")
+        return self._memo["luma"]
+
+    def gray(self, factor: int = 1) -> np.ndarray:
+        """
+        Grayscale view, optionally box-downscaled by an integer factor
+
+        Args:
+            factor: Reduction factor (1 keeps full resolution)
+
+        Returns:
+            (height // factor, width // factor) uint8 array
+        """
+        factor = max(1, int(factor))
+        key = ("gray", factor)
+        if key not in self._memo:
+            luma = self._luma()
+            if factor > 1:
+                luma = luma.reduce(factor)
+            self._memo[key] = np.asarray(luma)
+        return self._memo[key]
+
+    @property
+    def hash(self) -> str:
+        """Fast non-cryptographic content hash of the pixels"""
+        if "hash" not in self._memo:
+            checksum = zlib.crc32(self._contiguous())
+            self._memo["hash"] = f"{self.width}x{self.height}-{checksum:08x}"
+        return self._memo["hash"]
+
+    def crop(self, left: int, top: int, width: int, height: int) -> "Frame":
+        """
+        Returns a view of a region of this frame (no pixel copy)
+        The region is clipped to the frame bounds
+
+        Args:
+            left: X of the region within this frame
+            top: Y of the region within this frame
+            width: Region width
+            height: Region height
+
+        Returns:
+            Frame positioned relative to the same monitor
+        """
+        x1 = max(0, min(int(left), self.width - 1))
+        y1 = max(0, min(int(top), self.height - 1))
+        x2 = max(x1 + 1, min(int(left + width), self.width))
+        y2 = max(y1 + 1, min(int(top + height), self.height))
+
+        return Frame(
+            self.pixels[y1:y2, x1:x2],
+            self.left + x1,
+            self.top + y1,
+            self.timestamp
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"Frame({self.width}x{self.height} at "
+            f"({self.left}, {self.top}), t={self.timestamp:.3f})"
+        )
+
+
+ImageSource = Union[str, Image.Image, Frame]
+
+
+def as_image(source: ImageSource) -> Image.Image:
+    """
+    Resolves an image source to a PIL image
+
+    Args:
+        source: Path to an image file, PIL image or Frame
+
+    Returns:
+        PIL image
+    """
+    if isinstance(source, Frame):
+        return source.image
+    if isinstance(source, Image.Image):
+        return source
+    return Image.open(source)
+
+
+def content_key(source: ImageSource) -> str:
+    """
+    Fast non-cryptographic content hash identifying an image for caching
+
+    Args:
+        source: Path, PIL image or Frame (frames reuse their memoized hash)
+
+    Returns:
+        Hash string
+    """
+    if isinstance(source, Frame):
+        return source.hash
+
+    img = as_image(source)
+    checksum = zlib.crc32(img.tobytes())
+    return f"{img.mode}:{img.size[0]}x{img.size[1]}-{checksum:08x}"
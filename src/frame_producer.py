@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Frame producer module for UnifyVision
+Captures frames on a background thread so callers never block on a grab
+"""
+
+import collections
+import threading
+import time
+from typing import Deque, Optional
+
+from .config import config
+from .frame import Frame
+from .logger import logger
+
+
+class FrameProducer:
+    """
+    Background capture thread keeping a ring of the most recent frames
+
+    The thread grabs the monitor at a fixed rate into a bounded ring.
+    Readers take the latest frame, or wait for the first frame grabbed after
+    a given time.monotonic() timestamp, without issuing a grab themselves.
+    """
+
+    def __init__(
+        self,
+        screen_capture,
+        fps: float = None,
+        ring_size: int = None
+    ):
+        """
+        Initialize frame producer (call start() to begin capturing)
+
+        Args:
+            screen_capture: ScreenCapture used for grabbing
+            fps: Capture rate (defaults to config.BACKGROUND_CAPTURE_FPS)
+            ring_size: Frames kept in the ring
+                      (defaults to config.BACKGROUND_CAPTURE_RING_SIZE)
+        """
+        self.screen_capture = screen_capture
+        self.fps = fps or config.BACKGROUND_CAPTURE_FPS
+        self.ring_size = ring_size or config.BACKGROUND_CAPTURE_RING_SIZE
+        self.frames_captured = 0
+        self.capture_errors = 0
+
+        self._ring: Deque[Frame] = collections.deque(maxlen=self.ring_size)
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def interval(self) -> float:
+        """Seconds between grabs"""
+        return 1.0 / self.fps
+
+    @property
+    def running(self) -> bool:
+        """True while the capture thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "FrameProducer":
+        """
+        Starts the capture thread
+
+        Returns:
+            self, for chaining
+        """
+        if not self.running:
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                name="UnifyVision-FrameProducer",
+                daemon=True
+            )
+            self._thread.start()
+            logger.debug(f"Frame producer started at {self.fps:g} fps")
+        return self
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """
+        Stops the capture thread and drops buffered frames
+
+        Args:
+            timeout: Seconds to wait for the thread to exit
+        """
+        self._stop_event.set()
+        with self._condition:
+            self._condition.notify_all()
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+            logger.debug(
+                f"Frame producer stopped after {self.frames_captured} frames"
+            )
+
+        with self._condition:
+            self._ring.clear()
+
+    def latest(self) -> Optional[Frame]:
+        """
+        Returns the most recent frame without blocking
+
+        Returns:
+            Latest Frame, or None if nothing was captured yet
+        """
+        with self._condition:
+            return self._ring[-1] if self._ring else None
+
+    def frame_after(self, timestamp: float, timeout: float = None) -> Frame:
+        """
+        Returns the first frame whose grab started at or after timestamp
+        Falls back to a direct grab if none arrives in time
+
+        Args:
+            timestamp: time.monotonic() value the frame must not predate
+            timeout: Seconds to wait (defaults to timestamp lag plus three
+                    capture intervals)
+
+        Returns:
+            Frame
+        """
+        if timeout is None:
+            timeout = max(0.0, timestamp - time.monotonic()) + 3 * self.interval
+        deadline = time.monotonic() + timeout
+
+        with self._condition:
+            while not self._stop_event.is_set():
+                for frame in self._ring:
+                    if frame.timestamp >= timestamp:
+                        return frame
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+        logger.debug("No background frame in time, grabbing directly")
+        return self.screen_capture.capture_frame()
+
+    def _run(self) -> None:
+        """Capture loop"""
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+
+            try:
+                frame = self.screen_capture.capture_frame()
+                # Hash off the caller's path so cache lookups are free
+                frame.hash
+                with self._condition:
+                    self._ring.append(frame)
+                    self.frames_captured += 1
+                    self._condition.notify_all()
+
+            except Exception as e:
+                self.capture_errors += 1
+                logger.warning(f"Background capture failed: {e}")
+
+            elapsed = time.monotonic() - started
+            self._stop_event.wait(max(0.0, self.interval - elapsed))
+
+    def __enter__(self) -> "FrameProducer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -5,63 +5,414 @@ Grid system module for UnifyVision
 Handles grid overlay creation and element location using grid cells
 """
 
-import hashlib
 import json
 import re
 import os
-from typing import Tuple, Optional, Dict, List
-from PIL import Image, ImageDraw, ImageFont
+import time
+from typing import AsyncIterable, Tuple, Optional, Dict, Iterable, List
+from PIL import Image, ImageDraw
 
+from .cache import ByteLRUCache
 from .config import config
 from .exceptions import GridSystemError
+from .frame import Frame, ImageSource, as_image, content_key
+from .json_stream import IncrementalJSONParser
+from .label_renderer import get_atlas
 from .logger import logger, log_grid
 
 
-class GridCache:
-    """Cache for grid operations to avoid redrawing identical grids"""
+class GridLayout:
+    """
+    Grid shape over an image with exact (fractional) cell boundaries
 
-    def __init__(self):
-        self.image_hash: Optional[str] = None
-        self.grid_image: Optional[Image.Image] = None
-        self.cell_width: Optional[int] = None
-        self.cell_height: Optional[int] = None
+    Cell edges are placed at round(i * size / count), so the grid always
+    covers the whole image and cell centers map back without drift at the
+    right and bottom edges.
+    """
+
+    def __init__(self, width: int, height: int, cols: int, rows: int):
+        """
+        Initialize grid layout
+
+        Args:
+            width: Image width
+            height: Image height
+            cols: Grid columns
+            rows: Grid rows
+        """
+        self.width = width
+        self.height = height
+        self.cols = cols
+        self.rows = rows
+        self.cell_width = width / cols
+        self.cell_height = height / rows
+
+    @property
+    def num_cells(self) -> int:
+        """Total number of cells"""
+        return self.cols * self.rows
+
+    @property
+    def key(self) -> Tuple[int, int, int, int]:
+        """(width, height, cols, rows) identifying this layout"""
+        return self.width, self.height, self.cols, self.rows
+
+    def col_edge(self, col: int) -> int:
+        """X of the left edge of a column (col == cols gives the right edge)"""
+        return round(col * self.width / self.cols)
+
+    def row_edge(self, row: int) -> int:
+        """Y of the top edge of a row (row == rows gives the bottom edge)"""
+        return round(row * self.height / self.rows)
+
+    def _position(self, cell_number: int) -> Tuple[int, int]:
+        """(col, row) of a cell number"""
+        if not 0 <= cell_number < self.num_cells:
+            raise GridSystemError(
+                f"Cell {cell_number} outside {self.cols}x{self.rows} grid"
+            )
+        return cell_number % self.cols, cell_number // self.cols
+
+    def cell_box(self, cell_number: int) -> Tuple[int, int, int, int]:
+        """
+        Pixel box of a cell
+
+        Args:
+            cell_number: Cell number (0 is top-left)
 
-    def get(self, current_hash: str) -> Optional[Tuple[Image.Image, int, int]]:
+        Returns:
+            Tuple of (left, top, right, bottom)
+        """
+        col, row = self._position(cell_number)
+        return (
+            self.col_edge(col),
+            self.row_edge(row),
+            self.col_edge(col + 1),
+            self.row_edge(row + 1)
+        )
+
+    def cell_center(self, cell_number: int) -> Tuple[float, float]:
+        """
+        Exact center of a cell
+
+        Args:
+            cell_number: Cell number (0 is top-left)
+
+        Returns:
+            Tuple of (x, y) in image pixels
+        """
+        col, row = self._position(cell_number)
+        return (col + 0.5) * self.cell_width, (row + 0.5) * self.cell_height
+
+    def centroid(self, cells: List[Dict]) -> Tuple[float, float]:
         """
-        Gets cached grid if hash matches
+        Coverage-weighted centroid of cell centers (exact, not rounded)
+
+        Args:
+            cells: List of cell dictionaries with cell_number and coverage_percent
+
+        Returns:
+            Tuple of (x, y) in image pixels
+
+        Raises:
+            GridSystemError: If no cells are given
+        """
+        if not cells:
+            raise GridSystemError("No cells provided")
+
+        total_weight = 0.0
+        x_weighted = 0.0
+        y_weighted = 0.0
+
+        for cell_info in cells:
+            x_center, y_center = self.cell_center(cell_info.get("cell_number"))
+            weight = cell_info.get("coverage_percent", 50) / 100.0
+            x_weighted += x_center * weight
+            y_weighted += y_center * weight
+            total_weight += weight
+
+        if total_weight > 0:
+            return x_weighted / total_weight, y_weighted / total_weight
+
+        # Fallback: use first cell
+        return self.cell_center(cells[0].get("cell_number"))
+
+    def cells_bounds(self, cells: List[Dict]) -> Tuple[int, int, int, int]:
+        """
+        Bounding box of the given cells in pixels
+
+        Args:
+            cells: List of cell dictionaries with cell_number
+
+        Returns:
+            Tuple of (left, top, right, bottom)
+
+        Raises:
+            GridSystemError: If no cells are given
+        """
+        if not cells:
+            raise GridSystemError("No cells provided")
+
+        positions = [self._position(cell["cell_number"]) for cell in cells]
+        col_indices = [col for col, _ in positions]
+        row_indices = [row for _, row in positions]
+
+        return (
+            self.col_edge(min(col_indices)),
+            self.row_edge(min(row_indices)),
+            self.col_edge(max(col_indices) + 1),
+            self.row_edge(max(row_indices) + 1)
+        )
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, GridLayout) and self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __repr__(self) -> str:
+        return (
+            f"GridLayout({self.cols}x{self.rows} over {self.width}x{self.height}, "
+            f"cells {self.cell_width:.1f}x{self.cell_height:.1f})"
+        )
+
+
+class GridCache(ByteLRUCache):
+    """
+    Memory-bounded LRU cache of gridded images to avoid redrawing them
+
+    Keys are cheap content hashes (frames carry one computed once per
+    capture), so a lookup never hashes the pixels again.
+    """
+
+    def __init__(self, max_bytes: int = None):
+        """
+        Initialize grid cache
+
+        Args:
+            max_bytes: Byte limit for cached grid images
+                      (defaults to config.GRID_CACHE_MAX_BYTES)
+        """
+        super().__init__(
+            max_bytes if max_bytes is not None else config.GRID_CACHE_MAX_BYTES,
+            sizeof=lambda entry: len(entry[0].getbands()) * entry[0].width * entry[0].height
+        )
+
+    def get(self, current_hash: str) -> Optional[Tuple[Image.Image, GridLayout]]:
+        """
+        Gets cached grid for an image hash
 
         Args:
             current_hash: Hash of current image
 
         Returns:
-            Tuple of (grid_image, cell_width, cell_height) or None
+            Tuple of (grid_image, layout) or None
         """
-        if (self.image_hash == current_hash and
-                self.grid_image is not None):
+        cached = super().get(current_hash)
+        if cached is not None:
             logger.debug("Using cached grid (avoiding redraw)")
-            return self.grid_image, self.cell_width, self.cell_height
-        return None
+        return cached
 
     def set(
         self,
         img_hash: str,
         grid_img: Image.Image,
-        cell_w: int,
-        cell_h: int
+        layout: GridLayout
     ) -> None:
         """
-        Stores grid in cache
+        Stores grid in cache (the image is shared, not copied)
 
         Args:
             img_hash: Hash of original image
             grid_img: Image with grid overlay
-            cell_w: Cell width
-            cell_h: Cell height
+            layout: Layout the grid was drawn with
         """
-        self.image_hash = img_hash
-        self.grid_image = grid_img.copy()
-        self.cell_width = cell_w
-        self.cell_height = cell_h
+        self.put(img_hash, (grid_img, layout))
+
+
+def _render_overlay(layout: GridLayout) -> Image.Image:
+    """
+    Draws cell borders and numbered labels on a transparent RGBA layer
+
+    Args:
+        layout: Grid layout to draw
+
+    Returns:
+        RGBA overlay (opaque only where lines and labels are drawn)
+    """
+    overlay = Image.new("RGBA", (layout.width, layout.height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    atlas = get_atlas(int(min(layout.cell_height, layout.cell_width)) // 4)
+
+    # Cell borders (thin red lines) along every column and row edge
+    red = (255, 0, 0, 255)
+    for col in range(layout.cols + 1):
+        x = layout.col_edge(col)
+        draw.line([(x, 0), (x, layout.height)], fill=red, width=1)
+    for row in range(layout.rows + 1):
+        y = layout.row_edge(row)
+        draw.line([(0, y), (layout.width, y)], fill=red, width=1)
+
+    # Boxed numbers from the glyph atlas, centered in each cell
+    pad_x, pad_y = atlas.PADDING
+    for cell_num in range(layout.num_cells):
+        x1, y1, x2, y2 = layout.cell_box(cell_num)
+        text = str(cell_num)
+        text_width, text_height = atlas.text_size(text)
+
+        text_x = x1 + (x2 - x1 - text_width) // 2
+        text_y = y1 + (y2 - y1 - text_height) // 2
+        overlay.paste(atlas.label(text), (text_x - pad_x, text_y - pad_y))
+
+    return overlay
+
+
+# Overlays shared by every GridSystem, keyed by (width, height, cols, rows)
+overlay_cache = ByteLRUCache(
+    config.GRID_OVERLAY_CACHE_MAX_BYTES,
+    sizeof=lambda overlay: overlay.width * overlay.height * 4
+)
+
+
+def get_grid_overlay(width: int, height: int, cols: int, rows: int) -> Image.Image:
+    """
+    Returns the grid overlay for a frame size, rendering it on first use
+    The overlay is shared: don't modify it
+
+    Args:
+        width: Image width
+        height: Image height
+        cols: Grid columns
+        rows: Grid rows
+
+    Returns:
+        RGBA overlay layer
+    """
+    key = (width, height, cols, rows)
+    overlay = overlay_cache.get(key)
+    if overlay is None:
+        overlay = _render_overlay(GridLayout(width, height, cols, rows))
+        overlay_cache.put(key, overlay)
+        logger.debug(f"Grid overlay rendered for {width}x{height}")
+    return overlay
+
+
+def downscale_for_model(
+    source: ImageSource,
+    max_size: int = None
+) -> Tuple[Image.Image, float, float]:
+    """
+    Downscales a capture before the grid is drawn, so labels are rendered
+    at the size the model sees and the encoder has nothing left to resize
+
+    Integer factors use Image.reduce (memoized on frames); other factors
+    use a box filter with a reducing gap. Both are far cheaper than the
+    LANCZOS resize of a gridded full-resolution image.
+
+    Args:
+        source: Path, PIL image or Frame
+        max_size: Maximum size of longest side (defaults to config.MAX_IMAGE_SIZE)
+
+    Returns:
+        Tuple of (image, scale_x, scale_y), the scales being source pixels
+        per image pixel
+    """
+    max_size = max_size or config.MAX_IMAGE_SIZE
+
+    img = as_image(source)
+    width, height = img.size
+    factor = max(width, height) / max_size
+    if factor <= 1:
+        return img, 1.0, 1.0
+
+    if factor == int(factor):
+        factor = int(factor)
+        if isinstance(source, Frame):
+            scaled = source.downscaled(factor)
+        else:
+            scaled = img.reduce(factor)
+        return scaled, float(factor), float(factor)
+
+    size = (max(1, round(width / factor)), max(1, round(height / factor)))
+    scaled = img.resize(size, Image.Resampling.BOX, reducing_gap=2.0)
+    logger.debug(f"Downscaled {width}x{height} → {size[0]}x{size[1]} before gridding")
+
+    return scaled, width / size[0], height / size[1]
+
+
+# Strict structured output for the lean vision mode: only the fields the
+# click needs, in the order they are acted on
+VISION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "name": "grid_location",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "found": {"type": "boolean"},
+            "cells": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "cell_number": {"type": "integer"},
+                        "coverage_percent": {"type": "number"}
+                    },
+                    "required": ["cell_number", "coverage_percent"],
+                    "additionalProperties": False
+                }
+            },
+            "confidence": {"type": "string", "enum": ["high", "medium", "low"]}
+        },
+        "required": ["found", "cells", "confidence"],
+        "additionalProperties": False
+    }
+}
+
+
+# Description keywords hinting at the on-screen size of a target (English
+# and Spanish, since the planner writes its targets in Spanish); matched
+# as whole words, plurals included
+SMALL_TARGET_WORDS = (
+    "icon", "checkbox", "check box", "radio", "toggle", "close", "arrow",
+    "dot", "badge", "chevron", "caret", "link", "x button",
+    "ícono", "icono", "casilla", "cerrar", "flecha", "enlace", "vínculo",
+    "interruptor", "botón x"
+)
+LARGE_TARGET_WORDS = (
+    "field", "input", "text box", "textbox", "search bar", "panel",
+    "window", "banner", "card", "area", "editor", "image",
+    "campo", "barra", "ventana", "área", "cuadro de texto", "tarjeta",
+    "imagen"
+)
+
+
+def _keyword_pattern(words: Iterable[str]) -> re.Pattern:
+    """Whole-word pattern matching any of the keywords or their plurals"""
+    alternatives = "|".join(re.escape(word) for word in words)
+    return re.compile(rf"\b(?:{alternatives})(?:e?s)?\b")
+
+
+_SMALL_TARGET_PATTERN = _keyword_pattern(SMALL_TARGET_WORDS)
+_LARGE_TARGET_PATTERN = _keyword_pattern(LARGE_TARGET_WORDS)
+
+
+def infer_size_hint(description: str) -> Optional[str]:
+    """
+    Guesses whether a target description names a small or large element
+
+    Args:
+        description: Visual description of the element
+
+    Returns:
+        "small", "large" or None (medium)
+    """
+    text = " ".join(description.lower().split())
+    if _SMALL_TARGET_PATTERN.search(text):
+        return "small"
+    if _LARGE_TARGET_PATTERN.search(text):
+        return "large"
+    return None
 
 
 class GridSystem:
@@ -72,14 +423,14 @@ class GridSystem:
 
     def draw_grid_on_image(
         self,
-        image_path: str,
+        image_path: ImageSource,
         output_path: str = None
     ) -> Tuple[str, int, int]:
         """
-        Draws a numbered grid overlay on the image
+        Draws a numbered grid overlay on the image and saves it
 
         Args:
-            image_path: Path to input image
+            image_path: Path to input image, PIL image or Frame
             output_path: Path to save grid image (defaults to config.SCREENSHOT_GRID_PATH)
 
         Returns:
@@ -90,109 +441,151 @@ class GridSystem:
         """
         output_path = output_path or config.SCREENSHOT_GRID_PATH
 
+        grid_img, cell_width, cell_height = self.render_grid(image_path)
+
+        try:
+            grid_img.save(output_path)
+        except Exception as e:
+            raise GridSystemError(f"Failed to save grid image: {e}")
+
+        return output_path, cell_width, cell_height
+
+    def choose_layout(
+        self,
+        width: int,
+        height: int,
+        size_hint: Optional[str] = None
+    ) -> GridLayout:
+        """
+        Picks the grid density for an image
+
+        With adaptive grids enabled, cells are sized for the resolution the
+        vision model actually sees (after downscaling to MAX_IMAGE_SIZE) and
+        for the expected target size; otherwise the fixed grid is used.
+
+        Args:
+            width: Image width
+            height: Image height
+            size_hint: Expected target size ("small", "medium" or "large")
+
+        Returns:
+            GridLayout
+        """
+        if not config.GRID_ADAPTIVE:
+            return GridLayout(width, height, config.GRID_COLS, config.GRID_ROWS)
+
+        scale = min(1.0, config.MAX_IMAGE_SIZE / max(width, height))
+        cell_size = config.GRID_CELL_SIZES.get(
+            size_hint or "medium",
+            config.GRID_CELL_SIZES["medium"]
+        )
+        # Labels need a minimum cell size to stay legible
+        cell_size = max(cell_size, config.GRID_MIN_CELL_SIZE)
+
+        cols = round(width * scale / cell_size)
+        rows = round(height * scale / cell_size)
+        cols = max(config.GRID_MIN_COLS, min(config.GRID_MAX_COLS, cols))
+        rows = max(config.GRID_MIN_ROWS, min(config.GRID_MAX_ROWS, rows))
+
+        layout = GridLayout(width, height, cols, rows)
+        logger.debug(f"Adaptive grid for '{size_hint or 'medium'}' target: {layout!r}")
+
+        return layout
+
+    def render_layout(
+        self,
+        source: ImageSource,
+        layout: Optional[GridLayout] = None,
+        size_hint: Optional[str] = None
+    ) -> Tuple[Image.Image, GridLayout]:
+        """
+        Draws a numbered grid overlay in memory (no file I/O)
+        The returned image may be shared with the cache: don't modify it
+
+        Args:
+            source: Path to input image, PIL image or Frame
+            layout: Grid layout (defaults to choose_layout for the image)
+            size_hint: Expected target size used when choosing the layout
+
+        Returns:
+            Tuple of (grid_image, layout); map cells back through the layout
+
+        Raises:
+            GridSystemError: If grid drawing fails
+        """
         try:
             # Open image
-            img = Image.open(image_path)
+            img = as_image(source)
             img_width, img_height = img.size
+            layout = layout or self.choose_layout(img_width, img_height, size_hint)
 
-            # Calculate image hash for cache
-            img_bytes = img.tobytes()
-            img_hash = hashlib.md5(img_bytes).hexdigest()
+            # Cache key: content hash (memoized on frames) plus grid shape
+            img_hash = f"{content_key(source)}:{layout.cols}x{layout.rows}"
 
             # Check cache
             cached = self.cache.get(img_hash)
             if cached:
-                grid_img, cell_width, cell_height = cached
-                grid_img.save(output_path)
-                return output_path, cell_width, cell_height
-
-            # Calculate cell dimensions
-            cell_width = img_width // config.GRID_COLS
-            cell_height = img_height // config.GRID_ROWS
-
-            # Create copy for drawing
-            grid_img = img.copy()
-            draw = ImageDraw.Draw(grid_img)
-
-            # Load font
-            try:
-                font_size = min(cell_height, cell_width) // 4
-                font = ImageFont.truetype(
-                    "/System/Library/Fonts/Helvetica.ttc",
-                    font_size
-                )
-            except Exception:
-                font = ImageFont.load_default()
-
-            # Draw grid and numbers
-            cell_num = 0
-            for row in range(config.GRID_ROWS):
-                for col in range(config.GRID_COLS):
-                    # Calculate cell coordinates
-                    x1 = col * cell_width
-                    y1 = row * cell_height
-                    x2 = x1 + cell_width
-                    y2 = y1 + cell_height
-
-                    # Draw cell border (thin red line)
-                    draw.rectangle(
-                        [x1, y1, x2, y2],
-                        outline=(255, 0, 0),
-                        width=1
-                    )
-
-                    # Draw cell number in center
-                    text = str(cell_num)
-
-                    # Calculate centered text position
-                    try:
-                        bbox = draw.textbbox((0, 0), text, font=font)
-                        text_width = bbox[2] - bbox[0]
-                        text_height = bbox[3] - bbox[1]
-                    except Exception:
-                        text_width = len(text) * 8
-                        text_height = 12
-
-                    text_x = x1 + (cell_width - text_width) // 2
-                    text_y = y1 + (cell_height - text_height) // 2
-
-                    # Draw white background for number
-                    draw.rectangle(
-                        [
-                            text_x - 5,
-                            text_y - 2,
-                            text_x + text_width + 5,
-                            text_y + text_height + 2
-                        ],
-                        fill=(255, 255, 255)
-                    )
-
-                    # Draw number
-                    draw.text((text_x, text_y), text, fill=(0, 0, 0), font=font)
-
-                    cell_num += 1
+                return cached
 
-            # Save to cache
-            self.cache.set(img_hash, grid_img, cell_width, cell_height)
+            # Composite the cached overlay in a single C-level blit
+            overlay = get_grid_overlay(*layout.key)
+            grid_img = img.convert("RGB") if img.mode != "RGB" else img.copy()
+            grid_img.paste(overlay, (0, 0), overlay)
 
-            # Save image
-            grid_img.save(output_path)
+            # Save to cache
+            self.cache.set(img_hash, grid_img, layout)
 
             log_grid(
-                f"Grid drawn: {config.GRID_COLS}x{config.GRID_ROWS} = "
-                f"{config.GRID_COLS * config.GRID_ROWS} cells"
+                f"Grid drawn: {layout.cols}x{layout.rows} = "
+                f"{layout.num_cells} cells"
             )
 
-            return output_path, cell_width, cell_height
+            return grid_img, layout
 
+        except GridSystemError:
+            raise
         except Exception as e:
             raise GridSystemError(f"Failed to draw grid: {e}")
 
+    def render_grid(
+        self,
+        source: ImageSource,
+        cols: int = None,
+        rows: int = None
+    ) -> Tuple[Image.Image, int, int]:
+        """
+        Draws a fixed-shape numbered grid overlay in memory (no file I/O)
+        The returned image may be shared with the cache: don't modify it
+
+        Args:
+            source: Path to input image, PIL image or Frame
+            cols: Grid columns (defaults to config.GRID_COLS)
+            rows: Grid rows (defaults to config.GRID_ROWS)
+
+        Returns:
+            Tuple of (grid_image, cell_width, cell_height) with cell sizes
+            rounded down; use render_layout for exact mapping
+
+        Raises:
+            GridSystemError: If grid drawing fails
+        """
+        img = as_image(source)
+        layout = GridLayout(
+            img.size[0],
+            img.size[1],
+            cols or config.GRID_COLS,
+            rows or config.GRID_ROWS
+        )
+        grid_img, layout = self.render_layout(source, layout)
+
+        return grid_img, int(layout.cell_width), int(layout.cell_height)
+
     def calculate_coordinates_from_cells(
         self,
         cells: List[Dict],
-        cell_width: int,
-        cell_height: int
+        cell_width: float = None,
+        cell_height: float = None,
+        layout: Optional[GridLayout] = None
     ) -> Tuple[int, int]:
         """
         Calculates optimal pixel coordinates from cell information
@@ -200,8 +593,10 @@ class GridSystem:
 
         Args:
             cells: List of cell dictionaries with cell_number and coverage_percent
-            cell_width: Width of each cell in pixels
-            cell_height: Height of each cell in pixels
+            cell_width: Width of each cell in pixels (fixed config grid)
+            cell_height: Height of each cell in pixels (fixed config grid)
+            layout: Grid layout the cells refer to (exact; preferred over
+                   cell_width/cell_height)
 
         Returns:
             Tuple of (x, y) pixel coordinates
@@ -213,6 +608,22 @@ class GridSystem:
             if not cells:
                 raise GridSystemError("No cells provided")
 
+            if layout is not None:
+                x_final, y_final = layout.centroid(cells)
+                logger.debug(
+                    f"Calculated coordinates from {len(cells)} cells: "
+                    f"({x_final:.1f}, {y_final:.1f})"
+                )
+                return int(x_final), int(y_final)
+
+            def center(cell_number):
+                row = cell_number // config.GRID_COLS
+                col = cell_number % config.GRID_COLS
+                return (
+                    (col * cell_width) + (cell_width // 2),
+                    (row * cell_height) + (cell_height // 2)
+                )
+
             total_weight = 0
             x_weighted = 0
             y_weighted = 0
@@ -222,10 +633,7 @@ class GridSystem:
                 coverage = cell_info.get("coverage_percent", 50)
 
                 # Calculate cell center coordinates
-                row = cell_number // config.GRID_COLS
-                col = cell_number % config.GRID_COLS
-                x_center = (col * cell_width) + (cell_width // 2)
-                y_center = (row * cell_height) + (cell_height // 2)
+                x_center, y_center = center(cell_number)
 
                 # Accumulate with coverage weight
                 weight = coverage / 100.0
@@ -239,11 +647,8 @@ class GridSystem:
                 y_final = int(y_weighted / total_weight)
             else:
                 # Fallback: use first cell
-                primary_cell = cells[0].get("cell_number")
-                row = primary_cell // config.GRID_COLS
-                col = primary_cell % config.GRID_COLS
-                x_final = (col * cell_width) + (cell_width // 2)
-                y_final = (row * cell_height) + (cell_height // 2)
+                x_final, y_final = center(cells[0].get("cell_number"))
+                x_final, y_final = int(x_final), int(y_final)
 
             logger.debug(
                 f"Calculated coordinates from {len(cells)} cells: "
@@ -279,35 +684,187 @@ class GridSystem:
 
             data = json.loads(match.group(0))
 
-            # Check if element was found
-            if not data.get("found", False):
-                logger.debug(
-                    f"Element not found. Reason: {data.get('reasoning', 'N/A')}"
-                )
-                return None
+            return self._normalize_result(data)
 
-            # Extract cells information
-            cells = data.get("cells", [])
+        except json.JSONDecodeError as e:
+            raise GridSystemError(f"Failed to parse JSON response: {e}")
+        except Exception as e:
+            raise GridSystemError(f"Failed to parse vision response: {e}")
 
-            # Fallback to old format (single cell)
-            if not cells:
-                cell_number = data.get("primary_cell") or data.get("cell_number")
-                if cell_number is None:
-                    logger.warning("No cell information in response")
-                    return None
-                cells = [{"cell_number": cell_number, "coverage_percent": 100}]
-
-            return {
-                "found": True,
-                "cells": cells,
-                "confidence": data.get("confidence", "unknown"),
-                "reasoning": data.get("reasoning", "")
-            }
+    def parse_vision_stream(self, chunks: Iterable[str]) -> Optional[Dict]:
+        """
+        Parses a streamed vision response, returning as soon as the
+        "found", "cells" and "confidence" fields are known (the free-text
+        reasoning that follows them in the verbose mode is not waited for)
+
+        Args:
+            chunks: Text deltas of the response; closed early if possible
+
+        Returns:
+            Dictionary with found status, cells, and confidence
+
+        Raises:
+            GridSystemError: If parsing fails
+        """
+        parser = IncrementalJSONParser()
+        started = time.perf_counter()
+
+        try:
+            for chunk in chunks:
+                parser.feed(chunk)
+                if self._stream_decided(parser, started):
+                    break
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+
+        return self._stream_result(parser)
+
+    async def parse_vision_stream_async(
+        self,
+        chunks: AsyncIterable[str]
+    ) -> Optional[Dict]:
+        """
+        Parses a streamed vision response like parse_vision_stream, reading
+        the deltas from an async iterator
+
+        Args:
+            chunks: Async text deltas of the response; closed early if possible
+
+        Returns:
+            Dictionary with found status, cells, and confidence
+
+        Raises:
+            GridSystemError: If parsing fails
+        """
+        parser = IncrementalJSONParser()
+        started = time.perf_counter()
+
+        try:
+            async for chunk in chunks:
+                parser.feed(chunk)
+                if self._stream_decided(parser, started):
+                    break
+        finally:
+            aclose = getattr(chunks, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+        return self._stream_result(parser)
+
+    @staticmethod
+    def _stream_decided(parser: IncrementalJSONParser, started: float) -> bool:
+        """
+        Checks whether a streamed answer is usable
+
+        Args:
+            parser: Parser fed with the deltas so far
+            started: time.perf_counter() when the stream was opened
+
+        Returns:
+            True once the rest of the stream isn't needed
+        """
+        # Field order isn't guaranteed: cells alone don't decide until
+        # "found" has arrived too. The confidence is only a few tokens and
+        # is cached with the location, so wait for it.
+        decided = (
+            ("found" in parser and not parser.get("found")) or
+            all(name in parser for name in ("found", "cells", "confidence")) or
+            parser.complete
+        )
+        if decided:
+            logger.debug(
+                f"Vision answer usable after "
+                f"{(time.perf_counter() - started) * 1000:.0f}ms "
+                f"({len(parser.text)} chars)"
+            )
+        return decided
+
+    def _stream_result(self, parser: IncrementalJSONParser) -> Optional[Dict]:
+        """
+        Normalizes the fields of a streamed answer
+
+        Args:
+            parser: Parser fed with the streamed deltas
+
+        Returns:
+            Dictionary with found status, cells, and confidence
+        """
+        if parser.fields:
+            return self._normalize_result(parser.fields)
+
+        # Not a plain JSON object: fall back to scanning the whole text
+        return self.parse_vision_response(parser.text)
+
+    def parse_batch_vision_response(
+        self,
+        response: str,
+        count: int
+    ) -> List[Optional[Dict]]:
+        """
+        Parses a batch vision response locating several targets
+
+        Args:
+            response: JSON response with a "targets" list (one entry per
+                     target, identified by its 1-based "target" index)
+            count: Number of targets requested
+
+        Returns:
+            List with one parsed result (as parse_vision_response) or None
+            per target, in request order
+
+        Raises:
+            GridSystemError: If parsing fails
+        """
+        try:
+            match = re.search(r'\{.*\}', response, re.DOTALL)
+            if not match:
+                logger.warning("No JSON found in batch vision response")
+                return [None] * count
+
+            data = json.loads(match.group(0))
+            results: List[Optional[Dict]] = [None] * count
+
+            for position, entry in enumerate(data.get("targets", [])):
+                index = entry.get("target", position + 1) - 1
+                if 0 <= index < count:
+                    results[index] = self._normalize_result(entry)
+
+            return results
 
         except json.JSONDecodeError as e:
             raise GridSystemError(f"Failed to parse JSON response: {e}")
         except Exception as e:
-            raise GridSystemError(f"Failed to parse vision response: {e}")
+            raise GridSystemError(f"Failed to parse batch vision response: {e}")
+
+    @staticmethod
+    def _normalize_result(data: Dict) -> Optional[Dict]:
+        """Validates one located element, returning None if not found"""
+        # Check if element was found
+        if not data.get("found", False):
+            logger.debug(
+                f"Element not found. Reason: {data.get('reasoning', 'N/A')}"
+            )
+            return None
+
+        # Extract cells information
+        cells = data.get("cells", [])
+
+        # Fallback to old format (single cell)
+        if not cells:
+            cell_number = data.get("primary_cell") or data.get("cell_number")
+            if cell_number is None:
+                logger.warning("No cell information in response")
+                return None
+            cells = [{"cell_number": cell_number, "coverage_percent": 100}]
+
+        return {
+            "found": True,
+            "cells": cells,
+            "confidence": data.get("confidence", "unknown"),
+            "reasoning": data.get("reasoning", "")
+        }
 
     def cleanup_temp_files(self) -> None:
         """Removes temporary grid files"""
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP pool module for UnifyVision
+Keep-alive connection pool for the OpenAI SDK with connection tracing
+"""
+
+import importlib.util
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict
+
+import httpx
+from openai import DefaultAsyncHttpxClient
+
+from .config import config
+from .logger import logger
+
+
+def http2_available() -> bool:
+    """True if the optional h2 package needed for HTTP/2 is installed"""
+    return importlib.util.find_spec("h2") is not None
+
+
+class ConnectionTrace:
+    """
+    Counts requests, new connections and TLS handshakes on a transport
+
+    Requests that open no connection reused a pooled one, so after the
+    first call the handshake counts should stop growing.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.connections = 0
+        self.tls_handshakes = 0
+        self.connect_time = 0.0
+        self.http_versions: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def tracer(self):
+        """
+        Returns an httpcore trace callback for one request
+
+        Returns:
+            Async callback receiving (event name, info)
+        """
+        started: Dict[str, float] = {}
+
+        async def trace(name: str, info: Dict[str, Any]) -> None:
+            step, _, phase = name.rpartition(".")
+            if step not in ("connection.connect_tcp", "connection.start_tls"):
+                return
+
+            if phase == "started":
+                started[step] = time.perf_counter()
+            elif phase == "complete":
+                elapsed = time.perf_counter() - started.pop(step, time.perf_counter())
+                with self._lock:
+                    self.connect_time += elapsed
+                    if step == "connection.connect_tcp":
+                        self.connections += 1
+                    else:
+                        self.tls_handshakes += 1
+
+        return trace
+
+    def record_response(self, response: httpx.Response) -> None:
+        """Counts a completed request and its HTTP version"""
+        version = response.extensions.get("http_version", b"unknown")
+        with self._lock:
+            self.requests += 1
+            self.http_versions[version.decode("ascii", "replace")] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns connection counters for monitoring
+
+        Returns:
+            Dictionary with requests, new connections, TLS handshakes,
+            reused requests, reuse rate, handshake time and HTTP versions
+        """
+        with self._lock:
+            reused = max(0, self.requests - self.connections)
+            return {
+                "requests": self.requests,
+                "connections": self.connections,
+                "tls_handshakes": self.tls_handshakes,
+                "reused": reused,
+                "reuse_rate": reused / self.requests if self.requests else 0.0,
+                "connect_ms": self.connect_time * 1000,
+                "http_versions": dict(self.http_versions),
+            }
+
+
+class TracingTransport(httpx.AsyncBaseTransport):
+    """Async transport that reports connection events to a ConnectionTrace"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, trace: ConnectionTrace):
+        """
+        Initialize transport
+
+        Args:
+            transport: Transport that sends the requests
+            trace: Receives the connection events
+        """
+        self.transport = transport
+        self.trace = trace
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.extensions = {**request.extensions, "trace": self.trace.tracer()}
+        response = await self.transport.handle_async_request(request)
+        self.trace.record_response(response)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def create_http_client(trace: ConnectionTrace) -> httpx.AsyncClient:
+    """
+    Builds the HTTP client for an async OpenAI SDK client
+
+    The pool is sized by config.HTTP_MAX_CONNECTIONS and keeps idle
+    connections for config.HTTP_KEEPALIVE_EXPIRY seconds, so the pauses
+    between plan steps don't close the connection. HTTP/2 is used when
+    enabled and h2 is installed.
+
+    Args:
+        trace: Receives the connection events
+
+    Returns:
+        httpx.AsyncClient with the SDK's default timeout and redirects
+    """
+    http2 = config.HTTP_HTTP2 and http2_available()
+    if config.HTTP_HTTP2 and not http2:
+        logger.debug("h2 not installed, OpenAI requests use HTTP/1.1")
+
+    # The pool lives in the transport (httpx ignores client-level limits
+    # and http2 once a transport is given)
+    transport = httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(
+            max_connections=config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY
+        ),
+        http2=http2
+    )
+
+    return DefaultAsyncHttpxClient(transport=TracingTransport(transport, trace))
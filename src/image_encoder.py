@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Image encoder module for UnifyVision
+Pluggable PNG/JPEG/WebP encoding with byte-budget targeting
+"""
+
+import base64
+import io
+import time
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+from PIL import Image
+
+from .cache import ByteLRUCache
+from .config import config
+from .exceptions import ScreenCaptureError
+from .frame import ImageSource, as_image
+from .logger import logger
+
+
+class EncodedImage:
+    """Encoded image payload with the cost of producing it"""
+
+    def __init__(
+        self,
+        data: bytes,
+        format: str,
+        size: Tuple[int, int],
+        encode_seconds: float,
+        quality: Optional[int] = None
+    ):
+        """
+        Initialize encoded image
+
+        Args:
+            data: Encoded file bytes
+            format: Image format ("png", "jpeg" or "webp")
+            size: Encoded (width, height)
+            encode_seconds: Time spent resizing and encoding
+            quality: Quality used for lossy formats
+        """
+        self.data = data
+        self.format = format
+        self.size = size
+        self.encode_seconds = encode_seconds
+        self.quality = quality
+        self._base64: Optional[str] = None
+
+    @property
+    def mime_type(self) -> str:
+        """MIME type of the payload"""
+        return f"image/{self.format}"
+
+    @property
+    def nbytes(self) -> int:
+        """Encoded size in bytes"""
+        return len(self.data)
+
+    @property
+    def base64(self) -> str:
+        """Base64 text of the payload"""
+        if self._base64 is None:
+            self._base64 = base64.b64encode(self.data).decode("utf-8")
+        return self._base64
+
+    @property
+    def data_url(self) -> str:
+        """data: URL ready for the vision API"""
+        return f"data:{self.mime_type};base64,{self.base64}"
+
+    def __repr__(self) -> str:
+        quality = f" q{self.quality}" if self.quality is not None else ""
+        return (
+            f"EncodedImage({self.format}{quality} {self.size[0]}x{self.size[1]}, "
+            f"{self.nbytes / 1024:.1f} KB in {self.encode_seconds * 1000:.1f} ms)"
+        )
+
+
+class ImageEncoder(ABC):
+    """Base encoder: resizes to the maximum size and encodes one format"""
+
+    format: str  # Format name set by each concrete encoder
+
+    def __init__(self, max_size: int = None):
+        """
+        Initialize encoder
+
+        Args:
+            max_size: Maximum size of longest side (defaults to config.MAX_IMAGE_SIZE)
+        """
+        self.max_size = max_size or config.MAX_IMAGE_SIZE
+
+    @property
+    def quality(self) -> Optional[int]:
+        """Quality setting for lossy formats"""
+        return None
+
+    @property
+    def settings_key(self) -> str:
+        """Identifies the output of this encoder for caching"""
+        return f"{self.format}:{self.quality}:{self.max_size}"
+
+    def encode(self, source: ImageSource) -> EncodedImage:
+        """
+        Encodes an image, resizing it if it's too large
+
+        Args:
+            source: Path, PIL image or Frame
+
+        Returns:
+            EncodedImage
+
+        Raises:
+            ScreenCaptureError: If encoding fails
+        """
+        try:
+            start = time.perf_counter()
+            img = self._fit(as_image(source), self.max_size)
+            data = self._encode_bytes(img, self.quality)
+            return EncodedImage(
+                data,
+                self.format,
+                img.size,
+                time.perf_counter() - start,
+                self.quality
+            )
+
+        except Exception as e:
+            raise ScreenCaptureError(f"Failed to encode image: {e}")
+
+    @staticmethod
+    def _fit(img: Image.Image, max_size: int) -> Image.Image:
+        """Resizes img so its longest side is at most max_size"""
+        width, height = img.size
+        if max(width, height) <= max_size:
+            return img
+
+        ratio = max_size / max(width, height)
+        new_width = int(width * ratio)
+        new_height = int(height * ratio)
+        logger.debug(
+            f"Image resized: {width}x{height} → {new_width}x{new_height}"
+        )
+        return img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+
+    @abstractmethod
+    def _encode_bytes(self, img: Image.Image, quality: Optional[int]) -> bytes:
+        """Encodes img with this encoder's format"""
+
+
+class PNGEncoder(ImageEncoder):
+    """Lossless PNG (optimize trades CPU time for a smaller file)"""
+
+    format = "png"
+
+    def __init__(self, optimize: bool = None, max_size: int = None):
+        super().__init__(max_size)
+        self.optimize = (
+            optimize if optimize is not None else config.IMAGE_PNG_OPTIMIZE
+        )
+
+    @property
+    def settings_key(self) -> str:
+        return f"png:optimize={self.optimize}:{self.max_size}"
+
+    def _encode_bytes(self, img: Image.Image, quality: Optional[int]) -> bytes:
+        buffer = io.BytesIO()
+        img.save(buffer, format="PNG", optimize=self.optimize)
+        return buffer.getvalue()
+
+
+class JPEGEncoder(ImageEncoder):
+    """Lossy JPEG, fastest to encode"""
+
+    format = "jpeg"
+
+    def __init__(self, quality: int = None, max_size: int = None):
+        super().__init__(max_size)
+        self._quality = quality or config.IMAGE_QUALITY
+
+    @property
+    def quality(self) -> Optional[int]:
+        return self._quality
+
+    def _encode_bytes(self, img: Image.Image, quality: Optional[int]) -> bytes:
+        buffer = io.BytesIO()
+        img.convert("RGB").save(buffer, format="JPEG", quality=quality)
+        return buffer.getvalue()
+
+
+class WebPEncoder(ImageEncoder):
+    """Lossy WebP, smallest payload for screenshots"""
+
+    format = "webp"
+
+    def __init__(self, quality: int = None, max_size: int = None):
+        super().__init__(max_size)
+        self._quality = quality or config.IMAGE_QUALITY
+
+    @property
+    def quality(self) -> Optional[int]:
+        return self._quality
+
+    def _encode_bytes(self, img: Image.Image, quality: Optional[int]) -> bytes:
+        buffer = io.BytesIO()
+        img.save(buffer, format="WEBP", quality=quality, method=config.IMAGE_WEBP_METHOD)
+        return buffer.getvalue()
+
+
+class ByteBudgetEncoder(ImageEncoder):
+    """
+    Picks quality and resolution so the payload fits a byte budget
+
+    Quality is binary-searched between the minimum and the configured
+    quality; if even the minimum quality is too large the image is scaled
+    down and the search repeated. Lossless PNG only scales.
+    """
+
+    SCALE_STEP = 0.75
+    MIN_SIDE = 512
+
+    def __init__(
+        self,
+        base: ImageEncoder,
+        byte_budget: int = None,
+        min_quality: int = None
+    ):
+        """
+        Initialize byte-budget encoder
+
+        Args:
+            base: Encoder providing the format and maximum quality
+            byte_budget: Target payload size in bytes (defaults to config.IMAGE_BYTE_BUDGET)
+            min_quality: Lowest quality to try (defaults to config.IMAGE_MIN_QUALITY)
+        """
+        super().__init__(base.max_size)
+        self.base = base
+        self.format = base.format
+        self.byte_budget = byte_budget or config.IMAGE_BYTE_BUDGET
+        self.min_quality = min_quality or config.IMAGE_MIN_QUALITY
+
+    @property
+    def settings_key(self) -> str:
+        return (
+            f"{self.base.settings_key}:budget={self.byte_budget}:"
+            f"min={self.min_quality}"
+        )
+
+    def encode(self, source: ImageSource) -> EncodedImage:
+        try:
+            start = time.perf_counter()
+            img = self._fit(as_image(source), self.max_size)
+
+            while True:
+                data, quality = self._search_quality(img)
+                if len(data) <= self.byte_budget:
+                    break
+
+                if max(img.size) * self.SCALE_STEP < self.MIN_SIDE:
+                    logger.warning(
+                        f"Image exceeds byte budget: {len(data)} > "
+                        f"{self.byte_budget} bytes at {img.size[0]}x{img.size[1]}"
+                    )
+                    break
+
+                img = img.resize(
+                    (
+                        int(img.size[0] * self.SCALE_STEP),
+                        int(img.size[1] * self.SCALE_STEP)
+                    ),
+                    Image.Resampling.LANCZOS
+                )
+
+            return EncodedImage(
+                data,
+                self.format,
+                img.size,
+                time.perf_counter() - start,
+                quality
+            )
+
+        except Exception as e:
+            raise ScreenCaptureError(f"Failed to encode image: {e}")
+
+    def _search_quality(self, img: Image.Image) -> Tuple[bytes, Optional[int]]:
+        """
+        Finds the highest quality fitting the budget at this resolution
+
+        Returns:
+            Tuple of (data, quality); the minimum-quality encoding if none fits
+        """
+        high = self.base.quality
+        if high is None:
+            return self.base._encode_bytes(img, None), None
+
+        data = self.base._encode_bytes(img, high)
+        if len(data) <= self.byte_budget:
+            return data, high
+
+        low = min(self.min_quality, high)
+        best_data = self.base._encode_bytes(img, low)
+        best_quality = low
+        if len(best_data) > self.byte_budget:
+            return best_data, low
+
+        # Invariant: `best_quality` fits, everything above `high` does not
+        high -= 1
+        while low < high:
+            mid = (low + high + 1) // 2
+            candidate = self.base._encode_bytes(img, mid)
+            if len(candidate) <= self.byte_budget:
+                best_data, best_quality = candidate, mid
+                low = mid
+            else:
+                high = mid - 1
+
+        return best_data, best_quality
+
+    def _encode_bytes(self, img: Image.Image, quality: Optional[int]) -> bytes:
+        return self.base._encode_bytes(img, quality)
+
+
+def create_encoder(
+    format: str = None,
+    quality: int = None,
+    byte_budget: int = None,
+    max_size: int = None
+) -> ImageEncoder:
+    """
+    Builds the encoder described by the arguments or the configuration
+
+    Args:
+        format: "png", "jpeg" or "webp" (defaults to config.IMAGE_FORMAT)
+        quality: Quality for lossy formats (defaults to config.IMAGE_QUALITY)
+        byte_budget: Target payload size in bytes (defaults to config.IMAGE_BYTE_BUDGET)
+        max_size: Maximum size of longest side (defaults to config.MAX_IMAGE_SIZE)
+
+    Returns:
+        ImageEncoder instance
+
+    Raises:
+        ScreenCaptureError: If the format is unknown
+    """
+    format = (format or config.IMAGE_FORMAT).lower()
+    byte_budget = byte_budget or config.IMAGE_BYTE_BUDGET
+
+    if format == "png":
+        encoder = PNGEncoder(max_size=max_size)
+    elif format in ("jpeg", "jpg"):
+        encoder = JPEGEncoder(quality, max_size)
+    elif format == "webp":
+        encoder = WebPEncoder(quality, max_size)
+    else:
+        raise ScreenCaptureError(f"Unknown image format: {format}")
+
+    if byte_budget:
+        return ByteBudgetEncoder(encoder, byte_budget)
+    return encoder
+
+
+class EncodeCache(ByteLRUCache):
+    """
+    LRU cache of encoded payloads keyed by content hash and encoder settings
+
+    An unchanged screen encoded with the same settings is served from here
+    without resizing, re-encoding or re-base64ing it.
+    """
+
+    def __init__(self, max_bytes: int = None):
+        """
+        Initialize encode cache
+
+        Args:
+            max_bytes: Byte limit for cached payloads
+                      (defaults to config.ENCODE_CACHE_MAX_BYTES)
+        """
+        super().__init__(
+            max_bytes if max_bytes is not None else config.ENCODE_CACHE_MAX_BYTES,
+            sizeof=lambda encoded: encoded.nbytes + len(encoded.base64)
+        )
+
+    @staticmethod
+    def make_key(content: str, encoder: ImageEncoder) -> str:
+        """
+        Builds the cache key for a content hash and encoder
+
+        Args:
+            content: Content hash (see content_key)
+            encoder: Encoder whose settings produced the payload
+
+        Returns:
+            Cache key
+        """
+        return f"{content}|{encoder.settings_key}"
+
+
+# Global encode cache shared by every ScreenCapture / OpenAIClient
+encode_cache = EncodeCache()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON stream module for UnifyVision
+Incremental parser exposing top-level JSON fields as soon as they complete
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+
+class IncrementalJSONParser:
+    """
+    Parses a streamed JSON object one chunk at a time
+
+    Each top-level field of the first object in the text becomes available
+    in `fields` as soon as its value is complete, so callers can act on
+    early fields while later ones are still being generated. Any text
+    before the opening brace (prose, code fences) is skipped.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.fields: Dict[str, Any] = {}
+        self.complete = False
+
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expect = "start"
+        self._key: Optional[str] = None
+        self._token_start = 0
+
+    def feed(self, chunk: str) -> List[str]:
+        """
+        Consumes the next chunk of text
+
+        Args:
+            chunk: Text delta from the stream
+
+        Returns:
+            Names of the fields completed by this chunk
+        """
+        self.text += chunk
+        completed: List[str] = []
+
+        text = self.text
+        while self._pos < len(text) and not self.complete:
+            char = text[self._pos]
+            self._step(char, self._pos, completed)
+            self._pos += 1
+
+        return completed
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Returns a completed field or default"""
+        return self.fields.get(name, default)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.fields
+
+    def _step(self, char: str, index: int, completed: List[str]) -> None:
+        """Advances the scanner by one character"""
+        if self._expect == "start":
+            if char == "{":
+                self._depth = 1
+                self._expect = "key"
+            return
+
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+                if self._depth == 1 and self._expect == "key_string":
+                    self._key = self._load(self._token_start, index + 1)
+                    self._expect = "colon"
+                elif self._depth == 1 and self._expect == "value_string":
+                    self._record(index + 1, completed)
+            return
+
+        if char == '"':
+            self._in_string = True
+            if self._depth == 1 and self._expect == "key":
+                self._token_start = index
+                self._expect = "key_string"
+            elif self._depth == 1 and self._expect == "value":
+                self._token_start = index
+                self._expect = "value_string"
+
+        elif char in "{[":
+            if self._depth == 1 and self._expect == "value":
+                self._token_start = index
+                self._expect = "value_nested"
+            self._depth += 1
+
+        elif char in "}]":
+            self._depth -= 1
+            if self._depth == 1 and self._expect == "value_nested":
+                self._record(index + 1, completed)
+            elif self._depth == 0:
+                if self._expect == "value_scalar":
+                    self._record(index, completed)
+                self.complete = True
+
+        elif self._depth == 1:
+            if char == ":" and self._expect == "colon":
+                self._expect = "value"
+            elif char == ",":
+                if self._expect == "value_scalar":
+                    self._record(index, completed)
+                self._expect = "key"
+            elif not char.isspace() and self._expect == "value":
+                self._token_start = index
+                self._expect = "value_scalar"
+
+    def _record(self, end: int, completed: List[str]) -> None:
+        """Stores the value ending at end under the current key"""
+        self._expect = "after_value"
+        try:
+            value = self._load(self._token_start, end)
+        except ValueError:
+            return
+
+        self.fields[self._key] = value
+        completed.append(self._key)
+
+    def _load(self, start: int, end: int) -> Any:
+        """Decodes a JSON fragment of the buffered text"""
+        return json.loads(self.text[start:end].strip())
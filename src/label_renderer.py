@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Label renderer module for UnifyVision
+Font discovery, a per-size font cache and a digit glyph atlas for grid labels
+"""
+
+import os
+import shutil
+import subprocess
+import threading
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+from .config import config
+from .logger import logger
+
+
+# Sans-serif fonts tried in order (macOS, common Linux distributions, Windows)
+FONT_CANDIDATES = (
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/TTF/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+    "/usr/share/fonts/liberation/LiberationSans-Regular.ttf",
+    "/usr/share/fonts/noto/NotoSans-Regular.ttf",
+    "C:\\Windows\\Fonts\\arial.ttf",
+)
+
+DIGITS = "0123456789"
+
+
+@lru_cache(maxsize=1)
+def find_font_path() -> Optional[str]:
+    """
+    Locates a TrueType font for grid labels (looked up once per process)
+
+    Tries config.GRID_FONT_PATH, then well-known paths, then fontconfig.
+
+    Returns:
+        Font file path, or None to use Pillow's built-in font
+    """
+    if config.GRID_FONT_PATH:
+        if os.path.exists(config.GRID_FONT_PATH):
+            return config.GRID_FONT_PATH
+        logger.warning(f"Configured grid font not found: {config.GRID_FONT_PATH}")
+
+    for path in FONT_CANDIDATES:
+        if os.path.exists(path):
+            return path
+
+    fc_match = shutil.which("fc-match")
+    if fc_match:
+        try:
+            result = subprocess.run(
+                [fc_match, "--format=%{file}", "sans-serif"],
+                capture_output=True,
+                text=True,
+                timeout=2.0
+            )
+            path = result.stdout.strip()
+            if path and os.path.exists(path):
+                return path
+        except Exception as e:
+            logger.debug(f"fc-match failed: {e}")
+
+    logger.warning("No TrueType font found, grid labels use the default font")
+    return None
+
+
+@lru_cache(maxsize=32)
+def load_font(size: int) -> ImageFont.ImageFont:
+    """
+    Loads the label font at a size (each size is loaded once)
+
+    Args:
+        size: Font size in pixels
+
+    Returns:
+        Font (Pillow's default font if no TrueType font is available)
+    """
+    size = max(1, size)
+    path = find_font_path()
+    if path:
+        try:
+            return ImageFont.truetype(path, size)
+        except Exception as e:
+            logger.debug(f"Failed to load font {path}: {e}")
+
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:
+        # Pillow < 10.1 has no sized default font
+        return ImageFont.load_default()
+
+
+class GlyphAtlas:
+    """
+    Digit glyphs rasterized once for a font size
+
+    Labels are composed by pasting glyph bitmaps side by side instead of
+    rasterizing and measuring every label string through FreeType.
+    """
+
+    # Padding of the white label box around the digits (x, y)
+    PADDING = (5, 2)
+
+    def __init__(self, font: ImageFont.ImageFont):
+        """
+        Initialize atlas
+
+        Args:
+            font: Font to rasterize the digits with
+        """
+        self.font = font
+        self._labels: Dict[str, Image.Image] = {}
+        self._lock = threading.Lock()
+
+        # Shared vertical extent so every label has the same height
+        boxes = [font.getbbox(digit) for digit in DIGITS]
+        top = min(box[1] for box in boxes)
+        bottom = max(box[3] for box in boxes)
+        self.glyph_height = max(1, bottom - top)
+
+        self.glyphs: Dict[str, Image.Image] = {}
+        for digit in DIGITS:
+            advance = max(1, round(font.getlength(digit)))
+            mask = Image.new("L", (advance, self.glyph_height), 0)
+            ImageDraw.Draw(mask).text((0, -top), digit, fill=255, font=font)
+            self.glyphs[digit] = mask
+
+    def text_size(self, text: str) -> Tuple[int, int]:
+        """
+        Size of the digits of a label (without the box padding)
+
+        Args:
+            text: Digit string
+
+        Returns:
+            Tuple of (width, height)
+        """
+        return sum(self.glyphs[ch].width for ch in text), self.glyph_height
+
+    def label(self, text: str) -> Image.Image:
+        """
+        Returns the boxed label for a digit string (black on white, RGBA)
+        Labels are memoized: don't modify the result
+
+        Args:
+            text: Digit string
+
+        Returns:
+            Opaque RGBA label tile including the box padding
+        """
+        with self._lock:
+            tile = self._labels.get(text)
+            if tile is not None:
+                return tile
+
+            text_width, text_height = self.text_size(text)
+            pad_x, pad_y = self.PADDING
+
+            mask = Image.new("L", (text_width, text_height), 0)
+            x = 0
+            for ch in text:
+                glyph = self.glyphs[ch]
+                mask.paste(glyph, (x, 0))
+                x += glyph.width
+
+            tile = Image.new(
+                "RGBA",
+                (text_width + 2 * pad_x + 1, text_height + 2 * pad_y + 1),
+                (255, 255, 255, 255)
+            )
+            tile.paste((0, 0, 0, 255), (pad_x, pad_y), mask)
+
+            self._labels[text] = tile
+            return tile
+
+
+@lru_cache(maxsize=32)
+def get_atlas(size: int) -> GlyphAtlas:
+    """
+    Returns the glyph atlas for a font size, building it on first use
+
+    Args:
+        size: Font size in pixels
+
+    Returns:
+        GlyphAtlas
+    """
+    return GlyphAtlas(load_font(size))
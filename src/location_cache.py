@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Location cache module for UnifyVision
+Persistent SQLite cache of resolved element locations per screen and target
+"""
+
+import io
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from .change_detection import ChangeDetector
+from .config import config
+from .frame import Frame, ImageSource, as_image
+from .logger import logger
+
+
+def perceptual_hash(source: ImageSource, hash_size: int = None) -> str:
+    """
+    Difference hash (dHash) of a frame or image
+
+    The screen is box-averaged down to (hash_size + 1) x hash_size gray
+    cells and each bit records whether a cell is brighter than its right
+    neighbour. A clock or the cursor moves a handful of pixels, which
+    rarely flips a bit; a different screen flips many.
+
+    Args:
+        source: Frame, PIL image or file path
+        hash_size: Hash side in cells (defaults to config.LOCATION_CACHE_HASH_SIZE)
+
+    Returns:
+        Hex string of the hash_size * hash_size bits
+    """
+    hash_size = hash_size or config.LOCATION_CACHE_HASH_SIZE
+
+    if isinstance(source, Frame):
+        gray = Image.fromarray(source.gray(4))
+    else:
+        gray = as_image(source).convert("L")
+
+    small = np.asarray(gray.resize((hash_size + 1, hash_size), Image.Resampling.BOX))
+    bits = small[:, :-1] > small[:, 1:]
+
+    return np.packbits(bits).tobytes().hex()
+
+
+def hash_distance(first: str, second: str) -> int:
+    """Number of differing bits between two hex hashes"""
+    return bin(int(first, 16) ^ int(second, 16)).count("1")
+
+
+def normalize_target(target: str) -> str:
+    """
+    Normalizes a target description for lookups
+    Case, punctuation and repeated whitespace are ignored
+
+    Args:
+        target: Visual description of the element
+
+    Returns:
+        Normalized description
+    """
+    return " ".join(re.sub(r"[^\w\s]", " ", target.lower()).split())
+
+
+class CachedLocation:
+    """A location served from the cache"""
+
+    def __init__(
+        self,
+        entry_id: int,
+        coordinates: Tuple[int, int],
+        cells: List[Dict],
+        confidence: str,
+        distance: int
+    ):
+        """
+        Initialize cached location
+
+        Args:
+            entry_id: Row id (for invalidation)
+            coordinates: (x, y) in screenshot pixels
+            cells: Grid cells the location was resolved from
+            confidence: Confidence reported by the model
+            distance: Hash distance between the cached and current screen
+        """
+        self.entry_id = entry_id
+        self.coordinates = coordinates
+        self.cells = cells
+        self.confidence = confidence
+        self.distance = distance
+
+    def __repr__(self) -> str:
+        return (
+            f"CachedLocation(#{self.entry_id} at {self.coordinates}, "
+            f"confidence={self.confidence}, distance={self.distance})"
+        )
+
+
+class LocationCache:
+    """
+    On-disk cache of element locations keyed by screen hash and target
+
+    Entries are matched by normalized target text, screen size and a
+    perceptual hash within config.LOCATION_CACHE_MAX_DISTANCE bits. Each
+    entry keeps the pixels around the element, so a hit can be verified
+    with the change detector before it is trusted. Entries expire after
+    the TTL and the least recently used ones are evicted beyond the entry
+    limit. Safe to share between threads.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS locations (
+            id INTEGER PRIMARY KEY,
+            target TEXT NOT NULL,
+            width INTEGER NOT NULL,
+            height INTEGER NOT NULL,
+            screen_hash TEXT NOT NULL,
+            x INTEGER NOT NULL,
+            y INTEGER NOT NULL,
+            cells TEXT NOT NULL,
+            confidence TEXT NOT NULL,
+            patch_box TEXT NOT NULL,
+            patch BLOB NOT NULL,
+            created REAL NOT NULL,
+            last_used REAL NOT NULL,
+            hits INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS locations_lookup
+            ON locations (target, width, height);
+        CREATE INDEX IF NOT EXISTS locations_last_used
+            ON locations (last_used);
+    """
+
+    def __init__(
+        self,
+        path: str = None,
+        ttl: float = None,
+        max_entries: int = None,
+        verify: bool = None
+    ):
+        """
+        Initialize location cache
+
+        Args:
+            path: SQLite file (defaults to config.LOCATION_CACHE_PATH;
+                 ":memory:" keeps the cache in memory)
+            ttl: Seconds an entry stays valid (defaults to config.LOCATION_CACHE_TTL)
+            max_entries: Entries kept (defaults to config.LOCATION_CACHE_MAX_ENTRIES)
+            verify: Check the element's pixels on every hit
+                   (defaults to config.LOCATION_CACHE_VERIFY)
+        """
+        self.path = path or config.LOCATION_CACHE_PATH
+        self.ttl = ttl if ttl is not None else config.LOCATION_CACHE_TTL
+        self.max_entries = max_entries or config.LOCATION_CACHE_MAX_ENTRIES
+        self.verify = verify if verify is not None else config.LOCATION_CACHE_VERIFY
+
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+        self.stores = 0
+        self.evictions = 0
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.executescript(self.SCHEMA)
+        self._detector = ChangeDetector(downscale=1)
+
+    def close(self) -> None:
+        """Closes the database"""
+        with self._lock:
+            self._db.close()
+
+    def lookup(self, screenshot: ImageSource, target: str) -> Optional[CachedLocation]:
+        """
+        Returns the cached location of a target on a screen
+
+        Args:
+            screenshot: Current full-screen Frame (or PIL image / file path)
+            target: Visual description of the element
+
+        Returns:
+            CachedLocation, or None on a miss or a failed verification
+        """
+        width, height = _size(screenshot)
+        screen_hash = perceptual_hash(screenshot)
+        now = time.time()
+
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, screen_hash, x, y, cells, confidence, patch_box, patch "
+                "FROM locations WHERE target = ? AND width = ? AND height = ? "
+                "AND created >= ?",
+                (normalize_target(target), width, height, now - self.ttl)
+            ).fetchall()
+
+        best = None
+        for row in rows:
+            distance = hash_distance(screen_hash, row[1])
+            if distance <= config.LOCATION_CACHE_MAX_DISTANCE:
+                if best is None or distance < best[0]:
+                    best = (distance, row)
+
+        if best is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        distance, (entry_id, _, x, y, cells, confidence, patch_box, patch) = best
+
+        if self.verify and not self._patch_unchanged(screenshot, json.loads(patch_box), patch):
+            logger.debug(f"Cached location of '{target}' failed verification")
+            self.invalidate(entry_id)
+            with self._lock:
+                self.rejected += 1
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+            self._db.execute(
+                "UPDATE locations SET last_used = ?, hits = hits + 1 WHERE id = ?",
+                (now, entry_id)
+            )
+            self._db.commit()
+
+        return CachedLocation(entry_id, (x, y), json.loads(cells), confidence, distance)
+
+    def store(
+        self,
+        screenshot: ImageSource,
+        target: str,
+        coordinates: Tuple[int, int],
+        bounds: Tuple[float, float, float, float],
+        cells: List[Dict],
+        confidence: str
+    ) -> None:
+        """
+        Stores a resolved location
+
+        Args:
+            screenshot: Full-screen Frame (or PIL image / file path) it was found on
+            target: Visual description of the element
+            coordinates: (x, y) in screenshot pixels
+            bounds: (left, top, right, bottom) of the element in screenshot pixels
+            cells: Grid cells the location was resolved from
+            confidence: Confidence reported by the model
+        """
+        width, height = _size(screenshot)
+        patch_box = _patch_box(bounds, width, height)
+        buffer = io.BytesIO()
+        _crop(screenshot, patch_box).save(buffer, format="PNG")
+        now = time.time()
+
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO locations (target, width, height, screen_hash, x, y, "
+                "cells, confidence, patch_box, patch, created, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    normalize_target(target),
+                    width,
+                    height,
+                    perceptual_hash(screenshot),
+                    int(coordinates[0]),
+                    int(coordinates[1]),
+                    json.dumps(cells),
+                    str(confidence),
+                    json.dumps(patch_box),
+                    buffer.getvalue(),
+                    now,
+                    now
+                )
+            )
+            self.stores += 1
+            self._evict(now)
+            self._db.commit()
+
+    def invalidate(self, entry_id: int) -> None:
+        """
+        Removes an entry (for example after a click through it failed)
+
+        Args:
+            entry_id: CachedLocation.entry_id
+        """
+        with self._lock:
+            self._db.execute("DELETE FROM locations WHERE id = ?", (entry_id,))
+            self._db.commit()
+
+    def clear(self) -> None:
+        """Removes every entry (counters are kept)"""
+        with self._lock:
+            self._db.execute("DELETE FROM locations")
+            self._db.commit()
+
+    def _evict(self, now: float) -> None:
+        """
+        Drops expired entries and the least recently used beyond the limit
+
+        The lock must be held.
+
+        Args:
+            now: Current time.time()
+        """
+        expired = self._db.execute(
+            "DELETE FROM locations WHERE created < ?",
+            (now - self.ttl,)
+        ).rowcount
+        overflow = self._db.execute(
+            "DELETE FROM locations WHERE id IN ("
+            "SELECT id FROM locations ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        ).rowcount
+        self.evictions += expired + overflow
+
+    def _patch_unchanged(
+        self,
+        screenshot: ImageSource,
+        patch_box: List[int],
+        patch: bytes
+    ) -> bool:
+        """True if the element's pixels still match the stored patch"""
+        try:
+            stored = Image.open(io.BytesIO(patch))
+            result = self._detector.compare(
+                stored,
+                _crop(screenshot, patch_box),
+                config.LOCATION_CACHE_VERIFY_THRESHOLD
+            )
+            return not result.changed
+        except Exception as e:
+            logger.debug(f"Cached location verification failed: {e}")
+            return False
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns cache counters for monitoring
+
+        Returns:
+            Dictionary with entries, hits, misses, rejected hits, stores,
+            evictions and hit rate
+        """
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM locations").fetchone()[0]
+            return {
+                "entries": entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "rejected": self.rejected,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "hit_rate": self.hit_rate,
+            }
+
+    def __len__(self) -> int:
+        return self.stats()["entries"]
+
+
+def region_unchanged(
+    before: ImageSource,
+    after: ImageSource,
+    bounds: Tuple[float, float, float, float],
+    threshold: float = None
+) -> bool:
+    """
+    True if the pixels around an element match on two screens
+    Changes elsewhere on the screen are ignored
+
+    Args:
+        before: Full-screen Frame (or PIL image / file path) the element was found on
+        after: Current full-screen Frame (or PIL image / file path)
+        bounds: (left, top, right, bottom) of the element in screenshot pixels
+        threshold: Percentage of changed tiles tolerated
+                  (defaults to config.LOCATION_CACHE_VERIFY_THRESHOLD)
+
+    Returns:
+        True if both screens have the same size and the region is unchanged
+    """
+    width, height = _size(before)
+    if _size(after) != (width, height):
+        return False
+
+    box = _patch_box(bounds, width, height)
+    result = ChangeDetector(downscale=1).compare(
+        _crop(before, box),
+        _crop(after, box),
+        threshold if threshold is not None else config.LOCATION_CACHE_VERIFY_THRESHOLD
+    )
+    return not result.changed
+
+
+def _size(screenshot: ImageSource) -> Tuple[int, int]:
+    """Size of a frame or image"""
+    if isinstance(screenshot, Frame):
+        return screenshot.size
+    return as_image(screenshot).size
+
+
+def _patch_box(
+    bounds: Tuple[float, float, float, float],
+    width: int,
+    height: int
+) -> List[int]:
+    """Region around an element kept for verification, clipped to the screen"""
+    margin = config.LOCATION_CACHE_PATCH_MARGIN
+    left = max(0, int(bounds[0]) - margin)
+    top = max(0, int(bounds[1]) - margin)
+    right = min(width, int(round(bounds[2])) + margin)
+    bottom = min(height, int(round(bounds[3])) + margin)
+    return [left, top, max(left + 1, right), max(top + 1, bottom)]
+
+
+def _crop(screenshot: ImageSource, box: List[int]) -> Image.Image:
+    """RGB pixels of a region of a frame or image"""
+    left, top, right, bottom = box
+    if isinstance(screenshot, Frame):
+        return screenshot.crop(left, top, right - left, bottom - top).image
+    return as_image(screenshot).crop((left, top, right, bottom)).convert("RGB")
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Metrics module for UnifyVision
+Thread-safe recorder of request latency and output tokens per label
+"""
+
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+
+class RequestStats:
+    """
+    Latency and output-token samples grouped by a request label
+
+    Labels name the kind of request (for example "locate:lean" and
+    "locate:verbose"), so variants can be compared side by side. Only the
+    most recent samples of each label are kept.
+    """
+
+    def __init__(self, max_samples: int = 1000):
+        """
+        Initialize recorder
+
+        Args:
+            max_samples: Samples kept per label
+        """
+        self.max_samples = max_samples
+        self._samples: Dict[str, Deque[Tuple[float, Optional[int]]]] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        label: str,
+        latency: float,
+        output_tokens: Optional[int] = None
+    ) -> None:
+        """
+        Records one request
+
+        Args:
+            label: Request kind
+            latency: End-to-end latency in seconds
+            output_tokens: Output tokens billed, or None if not reported
+                          (for example when a stream was closed early)
+        """
+        with self._lock:
+            samples = self._samples.get(label)
+            if samples is None:
+                samples = deque(maxlen=self.max_samples)
+                self._samples[label] = samples
+            samples.append((latency, output_tokens))
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns aggregate numbers per label
+
+        Returns:
+            Dictionary mapping each label to its request count, mean, p50
+            and p95 latency in milliseconds, and mean output tokens over
+            the requests that reported them (None if none did)
+        """
+        with self._lock:
+            snapshot = {label: list(samples) for label, samples in self._samples.items()}
+
+        summary: Dict[str, Dict[str, Any]] = {}
+        for label, samples in snapshot.items():
+            latencies = sorted(latency * 1000 for latency, _ in samples)
+            tokens = [count for _, count in samples if count is not None]
+
+            summary[label] = {
+                "requests": len(samples),
+                "mean_ms": sum(latencies) / len(latencies),
+                "p50_ms": _percentile(latencies, 0.50),
+                "p95_ms": _percentile(latencies, 0.95),
+                "tokens_reported": len(tokens),
+                "mean_output_tokens": sum(tokens) / len(tokens) if tokens else None,
+            }
+
+        return summary
+
+    def percentile(
+        self,
+        label: str,
+        fraction: float,
+        min_samples: int = 1
+    ) -> Optional[float]:
+        """
+        Returns a latency percentile of a label
+
+        Args:
+            label: Request kind
+            fraction: Percentile as a fraction (0.95 for p95)
+            min_samples: Samples required for a meaningful answer
+
+        Returns:
+            Latency in seconds, or None with fewer than min_samples samples
+        """
+        with self._lock:
+            samples = self._samples.get(label, ())
+            if len(samples) < max(1, min_samples):
+                return None
+            latencies = sorted(latency for latency, _ in samples)
+
+        return _percentile(latencies, fraction)
+
+    def reset(self) -> None:
+        """Discards every sample"""
+        with self._lock:
+            self._samples.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(samples) for samples in self._samples.values())
+
+
+def _percentile(ordered: list, fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
@@ -5,24 +5,60 @@ OpenAI client module for UnifyVision
 Handles all interactions with OpenAI API (Responses API and Chat Completions)
 """
 
-from typing import Optional
-from openai import OpenAI
-
+import asyncio
+import hashlib
+import threading
+import time
+import weakref
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, Set, TypeVar
+from openai import AsyncOpenAI
+
+from .background_loop import BackgroundLoop, background_loop
 from .config import config
-from .exceptions import OpenAIClientError
+from .exceptions import OpenAIClientError, RequestDeadlineError
+from .frame import ImageSource
+from .http_pool import ConnectionTrace, create_http_client
 from .logger import logger
+from .metrics import RequestStats
+from .rate_limiter import RateLimiter, estimate_tokens, get_rate_limiter
+from .request_policy import RequestPolicy
 from .screen_capture import ScreenCapture
 
 
-class OpenAIClient:
-    """Wrapper for OpenAI API interactions"""
+T = TypeVar("T")
+
+
+class AsyncOpenAIClient:
+    """
+    Asynchronous wrapper for OpenAI API interactions
+
+    Image encoding runs on a worker thread, so captures, encodes and API
+    calls of concurrent requests overlap on one event loop. Each event
+    loop gets its own SDK client, since connection pools are bound to the
+    loop that opened them; all of them report to the same ConnectionTrace.
+    Deadlines, retries and hedging are left to a RequestPolicy (the SDK's
+    own retries are disabled so attempts aren't multiplied), and requests
+    over the key's per-minute budget wait in a RateLimiter queue. Streams
+    closed early are read to the end on the loop for their usage.
+    """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        policy: Optional[RequestPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
         """
         Initialize OpenAI client
 
         Args:
             api_key: OpenAI API key (defaults to config.OPENAI_API_KEY)
+            base_url: API base URL (defaults to the SDK's, or OPENAI_BASE_URL)
+            policy: Deadline, retry and hedging policy of the calls
+                   (defaults to one driven by config.REQUEST_*)
+            rate_limiter: Request and token budget (defaults to the key's
+                         shared limiter when config.RATE_LIMIT_ENABLED)
 
         Raises:
             OpenAIClientError: If API key is not provided
@@ -34,70 +70,355 @@ class OpenAIClient:
                 "Set OPENAI_API_KEY environment variable."
             )
 
-        self.client = OpenAI(api_key=api_key)
+        self.api_key = api_key
+        self.base_url = base_url
         self.screen_capture = ScreenCapture()
+        self.stats = RequestStats()
+        self.policy = policy or RequestPolicy()
+        self.rate_limiter = rate_limiter or get_rate_limiter(api_key)
+        self.connections = ConnectionTrace()
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._drains: Set[asyncio.Task] = set()
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        """SDK client bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                max_retries=0,
+                http_client=create_http_client(self.connections)
+            )
+            self._clients[loop] = client
+        return client
+
+    async def close(self) -> None:
+        """Closes the SDK client of the running event loop"""
+        await self.drain()
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """
+        Waits for the streams closed early on the running event loop to
+        finish reporting their usage
 
-    def ask_with_image(
+        Args:
+            timeout: Seconds to wait (None waits until they finish)
+        """
+        loop = asyncio.get_running_loop()
+        tasks = [task for task in self._drains if task.get_loop() is loop]
+        if tasks:
+            await asyncio.wait(tasks, timeout=timeout)
+
+    async def ask_with_image(
         self,
         prompt: str,
-        image_path: str,
+        image: ImageSource,
         prompt_id: str = None,
-        prompt_version: str = None
+        prompt_version: str = None,
+        cache_key: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        label: str = "vision"
     ) -> str:
         """
         Sends a question with image using Responses API
 
         Args:
             prompt: The question text
-            image_path: Path to image to analyze
+            image: Image to analyze (file path, PIL image or Frame)
             prompt_id: Prompt ID (defaults to config.PROMPT_ID)
             prompt_version: Prompt version (defaults to config.PROMPT_VERSION)
+            cache_key: Content key identifying the image in the encode cache
+            response_format: Structured output format (e.g. a strict
+                            json_schema) constraining the answer
+            label: Request kind under which latency and tokens are recorded
 
         Returns:
             Response text from the model
 
         Raises:
+            RequestDeadlineError: If no attempt answered before the deadline
             OpenAIClientError: If API call fails
         """
-        prompt_id = prompt_id or config.PROMPT_ID
-        prompt_version = prompt_version or config.PROMPT_VERSION
+        started = time.perf_counter()
 
         try:
-            # Encode image to base64
-            image_base64 = self.screen_capture.encode_image_to_base64(image_path)
+            request = await self._vision_request(
+                prompt,
+                image,
+                prompt_id,
+                prompt_version,
+                cache_key,
+                response_format
+            )
 
             logger.debug("Sending request to Responses API...")
 
             # Use Responses API with saved prompt
-            response = self.client.responses.create(
-                prompt={
-                    "id": prompt_id,
-                    "version": prompt_version
-                },
-                input=[
-                    {"role": "user", "content": prompt},
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "input_image",
-                                "image_url": f"data:image/png;base64,{image_base64}"
-                            }
-                        ]
-                    }
-                ]
+            tokens = _vision_tokens(prompt)
+            response = await self._call(
+                lambda: self.client.responses.create(**request),
+                label,
+                tokens
             )
+            self._settle(tokens, response)
 
             # Extract response
             response_text = response.output_text
             logger.debug("Response received from Responses API")
 
+            self.stats.record(
+                label,
+                time.perf_counter() - started,
+                _output_tokens(response)
+            )
+
             return response_text
 
+        except RequestDeadlineError:
+            raise
         except Exception as e:
             raise OpenAIClientError(f"Responses API call failed: {e}")
 
-    def generate_plan(
+    async def stream_with_image(
+        self,
+        prompt: str,
+        image: ImageSource,
+        prompt_id: str = None,
+        prompt_version: str = None,
+        cache_key: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        label: str = "vision"
+    ) -> AsyncIterator[str]:
+        """
+        Sends a question with image and yields the answer as it streams in
+        Closing the generator early records the latency at that point; the
+        rest of the response is read on the loop for its output token count
+        (see drain)
+
+        Args:
+            prompt: The question text
+            image: Image to analyze (file path, PIL image or Frame)
+            prompt_id: Prompt ID (defaults to config.PROMPT_ID)
+            prompt_version: Prompt version (defaults to config.PROMPT_VERSION)
+            cache_key: Content key identifying the image in the encode cache
+            response_format: Structured output format (e.g. a strict
+                            json_schema) constraining the answer
+            label: Request kind under which latency and tokens are recorded
+
+        Yields:
+            Text deltas of the response
+
+        Raises:
+            RequestDeadlineError: If no attempt answered before the deadline
+            OpenAIClientError: If API call fails
+        """
+        started = time.perf_counter()
+
+        try:
+            request = await self._vision_request(
+                prompt,
+                image,
+                prompt_id,
+                prompt_version,
+                cache_key,
+                response_format
+            )
+
+            logger.debug("Streaming request to Responses API...")
+
+            # Only opening the stream is retried; a stream is never hedged
+            tokens = _vision_tokens(prompt)
+            stream = await self._call(
+                lambda: self.client.responses.create(stream=True, **request),
+                label,
+                tokens,
+                hedge=False
+            )
+        except RequestDeadlineError:
+            raise
+        except Exception as e:
+            raise OpenAIClientError(f"Responses API call failed: {e}")
+
+        output_tokens = None
+        streamed = 0
+        closed_early = False
+        try:
+            async for event in stream:
+                if event.type == "response.output_text.delta":
+                    streamed += len(event.delta)
+                    try:
+                        yield event.delta
+                    except GeneratorExit:
+                        closed_early = True
+                        raise
+                elif event.type == "response.completed":
+                    output_tokens = _output_tokens(event.response)
+                    self._settle(tokens, event.response)
+                elif event.type in ("response.failed", "error"):
+                    raise OpenAIClientError(f"Responses API stream failed: {event}")
+
+        except OpenAIClientError:
+            raise
+        except Exception as e:
+            raise OpenAIClientError(f"Responses API stream failed: {e}")
+
+        finally:
+            latency = time.perf_counter() - started
+            if closed_early:
+                # The caller has its answer; the usage arrives at the end
+                task = asyncio.get_running_loop().create_task(
+                    self._drain_stream(stream, label, latency, tokens, streamed)
+                )
+                self._drains.add(task)
+                task.add_done_callback(self._drains.discard)
+            else:
+                await stream.close()
+                if output_tokens is None:
+                    self._settle_streamed(tokens, streamed)
+                self.stats.record(label, latency, output_tokens)
+
+    async def _drain_stream(
+        self,
+        stream: Any,
+        label: str,
+        latency: float,
+        tokens: int,
+        streamed: int
+    ) -> None:
+        """
+        Reads the rest of a stream closed early, records its usage and
+        settles its token reservation
+
+        Args:
+            stream: Responses API event stream
+            label: Request kind of the stream
+            latency: Seconds until the caller closed the stream
+            tokens: Tokens reserved for the request
+            streamed: Characters of output the caller received
+        """
+        async def completed() -> Any:
+            nonlocal streamed
+            async for event in stream:
+                if event.type == "response.output_text.delta":
+                    streamed += len(event.delta)
+                elif event.type == "response.completed":
+                    return event.response
+            return None
+
+        response = None
+        try:
+            response = await asyncio.wait_for(
+                completed(),
+                config.VISION_STREAM_DRAIN_TIMEOUT
+            )
+        except Exception as e:
+            logger.debug(f"{label} stream ended without usage: {e}")
+        finally:
+            await stream.close()
+            if response is not None:
+                self._settle(tokens, response)
+            else:
+                self._settle_streamed(tokens, streamed)
+            self.stats.record(label, latency, _output_tokens(response))
+
+    async def _call(
+        self,
+        create: Callable[[], Awaitable[T]],
+        label: str,
+        tokens: int,
+        hedge: Optional[bool] = None
+    ) -> T:
+        """
+        Runs an API call under the rate limiter and the request policy
+        The first attempt queues before the deadline starts; retries and
+        hedges queue inside their attempt
+        """
+        limiter = self.rate_limiter
+        if limiter is None:
+            return await self.policy.run(create, label=label, hedge=hedge)
+
+        await limiter.acquire_async(tokens)
+        reserved = True
+
+        async def attempt() -> T:
+            nonlocal reserved
+            if reserved:
+                reserved = False
+            else:
+                await limiter.acquire_async(tokens)
+            return await create()
+
+        return await self.policy.run(attempt, label=label, hedge=hedge)
+
+    def _settle(self, tokens: int, response: Any) -> None:
+        """Corrects the rate limiter's token estimate with the reported usage"""
+        if self.rate_limiter is not None:
+            usage = getattr(response, "usage", None)
+            self.rate_limiter.settle(tokens, getattr(usage, "total_tokens", None))
+
+    def _settle_streamed(self, tokens: int, streamed: int) -> None:
+        """
+        Corrects a vision reservation that got no reported usage
+        The output actually streamed is charged instead of the estimated
+        answer length
+
+        Args:
+            tokens: Tokens reserved for the request
+            streamed: Characters of output received
+        """
+        if self.rate_limiter is not None:
+            actual = tokens - config.RATE_LIMIT_VISION_OUTPUT_TOKENS + streamed // 4
+            self.rate_limiter.settle(tokens, actual)
+
+    async def _vision_request(
+        self,
+        prompt: str,
+        image: ImageSource,
+        prompt_id: Optional[str],
+        prompt_version: Optional[str],
+        cache_key: Optional[str],
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Builds the Responses API arguments for a question with image"""
+        # Encode image (format, quality and size per configuration) off the loop
+        encoded = await asyncio.to_thread(
+            self.screen_capture.encode_image,
+            image,
+            cache_key=cache_key
+        )
+
+        request = {
+            "prompt": {
+                "id": prompt_id or config.PROMPT_ID,
+                "version": prompt_version or config.PROMPT_VERSION
+            },
+            "input": [
+                {"role": "user", "content": prompt},
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "input_image",
+                            "image_url": encoded.data_url
+                        }
+                    ]
+                }
+            ]
+        }
+        if response_format is not None:
+            request["text"] = {"format": response_format}
+
+        return request
+
+    async def generate_plan(
         self,
         user_instruction: str,
         model: str = None,
@@ -117,13 +438,209 @@ class OpenAIClient:
             Raw response text containing the plan
 
         Raises:
+            RequestDeadlineError: If no attempt answered before the deadline
             OpenAIClientError: If API call fails
         """
         model = model or config.MODEL
         temperature = temperature or config.PLANNING_TEMPERATURE
         max_tokens = max_tokens or config.MAX_TOKENS_PLANNING
 
-        prompt = f"""Sos un agente experto en automatización de interfaces gráficas. El usuario quiere realizar esta tarea:
+        started = time.perf_counter()
+
+        try:
+            logger.debug(f"Generating plan with {model}...")
+
+            prompt = _plan_prompt(user_instruction)
+            tokens = estimate_tokens(prompt, output_tokens=max_tokens)
+            response = await self._call(
+                lambda: self.client.chat.completions.create(
+                    model=model,
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ],
+                    max_tokens=max_tokens,
+                    temperature=temperature
+                ),
+                "plan",
+                tokens
+            )
+            self._settle(tokens, response)
+
+            response_text = response.choices[0].message.content.strip()
+            logger.debug("Plan generated successfully")
+
+            usage = getattr(response, "usage", None)
+            self.stats.record(
+                "plan",
+                time.perf_counter() - started,
+                getattr(usage, "completion_tokens", None)
+            )
+
+            return response_text
+
+        except RequestDeadlineError:
+            raise
+        except Exception as e:
+            raise OpenAIClientError(f"Plan generation failed: {e}")
+
+
+class OpenAIClient:
+    """
+    Wrapper for OpenAI API interactions
+
+    Blocking facade over AsyncOpenAIClient: every call runs on a shared
+    background event loop, so synchronous callers keep one connection pool.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        loop: Optional[BackgroundLoop] = None,
+        base_url: Optional[str] = None,
+        policy: Optional[RequestPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
+        """
+        Initialize OpenAI client
+
+        Args:
+            api_key: OpenAI API key (defaults to config.OPENAI_API_KEY)
+            loop: Background loop the calls run on (defaults to the shared one)
+            base_url: API base URL (defaults to the SDK's, or OPENAI_BASE_URL)
+            policy: Deadline, retry and hedging policy of the calls
+            rate_limiter: Request and token budget (defaults to the key's shared one)
+
+        Raises:
+            OpenAIClientError: If API key is not provided
+        """
+        self.aio = AsyncOpenAIClient(
+            api_key,
+            base_url=base_url,
+            policy=policy,
+            rate_limiter=rate_limiter
+        )
+        self.loop = loop or background_loop
+
+    @property
+    def screen_capture(self) -> ScreenCapture:
+        return self.aio.screen_capture
+
+    @property
+    def stats(self) -> RequestStats:
+        return self.aio.stats
+
+    @property
+    def connections(self) -> ConnectionTrace:
+        return self.aio.connections
+
+    @property
+    def policy(self) -> RequestPolicy:
+        return self.aio.policy
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        return self.aio.rate_limiter
+
+    def close(self) -> None:
+        """Closes the SDK client used by the background loop"""
+        self.loop.run(self.aio.close())
+
+    def drain(self, timeout: Optional[float] = None) -> None:
+        """
+        Waits for streams closed early to finish reporting their usage
+
+        Args:
+            timeout: Seconds to wait (None waits until they finish)
+        """
+        self.loop.run(self.aio.drain(timeout))
+
+    def ask_with_image(self, prompt: str, image: ImageSource, **kwargs) -> str:
+        """
+        Sends a question with image using Responses API
+        Takes the arguments of AsyncOpenAIClient.ask_with_image
+
+        Returns:
+            Response text from the model
+
+        Raises:
+            OpenAIClientError: If API call fails
+        """
+        return self.loop.run(self.aio.ask_with_image(prompt, image, **kwargs))
+
+    def stream_with_image(self, prompt: str, image: ImageSource, **kwargs) -> Iterator[str]:
+        """
+        Sends a question with image and yields the answer as it streams in
+        Takes the arguments of AsyncOpenAIClient.stream_with_image; closing
+        the generator early aborts the rest of the response
+
+        Yields:
+            Text deltas of the response
+
+        Raises:
+            OpenAIClientError: If API call fails
+        """
+        return self.loop.iterate(self.aio.stream_with_image(prompt, image, **kwargs))
+
+    def generate_plan(self, user_instruction: str, **kwargs) -> str:
+        """
+        Generates an action plan using Chat Completions API
+        Takes the arguments of AsyncOpenAIClient.generate_plan
+
+        Returns:
+            Raw response text containing the plan
+
+        Raises:
+            OpenAIClientError: If API call fails
+        """
+        return self.loop.run(self.aio.generate_plan(user_instruction, **kwargs))
+
+
+_shared_clients: Dict[str, OpenAIClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_openai_client(api_key: Optional[str] = None) -> OpenAIClient:
+    """
+    Returns the process-wide client for an API key, creating it on first use
+    Components share it by default, so a run pays for one connection pool
+
+    Args:
+        api_key: OpenAI API key (defaults to config.OPENAI_API_KEY)
+
+    Returns:
+        Shared OpenAIClient
+
+    Raises:
+        OpenAIClientError: If API key is not provided
+    """
+    api_key = api_key or config.OPENAI_API_KEY
+    with _shared_clients_lock:
+        client = _shared_clients.get(api_key)
+        if client is None:
+            client = OpenAIClient(api_key)
+            _shared_clients[api_key] = client
+        return client
+
+
+def plan_prompt_version() -> str:
+    """
+    Fingerprint of the planning prompt template
+    Changes whenever the prompt text does, so cached plans built from an
+    older prompt stop matching
+
+    Returns:
+        Short hex digest
+    """
+    template = _plan_prompt("{user_instruction}")
+    return hashlib.sha256(template.encode("utf-8")).hexdigest()[:12]
+
+
+def _plan_prompt(user_instruction: str) -> str:
+    """Planning prompt for a user instruction"""
+    return f"""Sos un agente experto en automatización de interfaces gráficas. El usuario quiere realizar esta tarea:
 
 "{user_instruction}"
 
@@ -176,25 +693,17 @@ REGLAS IMPORTANTES:
 
 Generá el plan ahora siguiendo el patrón correspondiente:"""
 
-        try:
-            logger.debug(f"Generating plan with {model}...")
-
-            response = self.client.chat.completions.create(
-                model=model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=max_tokens,
-                temperature=temperature
-            )
 
-            response_text = response.choices[0].message.content.strip()
-            logger.debug("Plan generated successfully")
+def _vision_tokens(prompt: str) -> int:
+    """Estimated tokens of a question with one screenshot"""
+    return estimate_tokens(
+        prompt,
+        images=1,
+        output_tokens=config.RATE_LIMIT_VISION_OUTPUT_TOKENS
+    )
 
-            return response_text
 
-        except Exception as e:
-            raise OpenAIClientError(f"Plan generation failed: {e}")
+def _output_tokens(response: Any) -> Optional[int]:
+    """Output token count of a Responses API response, if reported"""
+    usage = getattr(response, "usage", None)
+    return getattr(usage, "output_tokens", None)
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Plan cache module for UnifyVision
+Persistent SQLite cache of validated plans per instruction, model and prompt
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Any, Dict, List, Optional
+
+from .config import config
+from .logger import logger
+
+
+def normalize_instruction(instruction: str) -> str:
+    """
+    Normalizes an instruction for lookups
+
+    Unicode forms and whitespace are normalized. Case and punctuation are
+    kept: instructions carry text to type ("write 'Hi!'"), and changing
+    it would replay a plan that types something else.
+
+    Args:
+        instruction: User's task description
+
+    Returns:
+        Normalized instruction
+    """
+    return " ".join(unicodedata.normalize("NFC", instruction).split())
+
+
+class PlanCache:
+    """
+    On-disk cache of action plans
+
+    Plans are keyed by the normalized instruction plus the model and the
+    planning prompt version, so a new model or prompt never replays an old
+    plan. Entries expire after the TTL and the least recently used ones are
+    evicted beyond the entry limit; pinned entries are never expired or
+    evicted. Safe to share between threads.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS plans (
+            key TEXT PRIMARY KEY,
+            instruction TEXT NOT NULL,
+            model TEXT NOT NULL,
+            prompt_version TEXT NOT NULL,
+            steps TEXT NOT NULL,
+            pinned INTEGER NOT NULL DEFAULT 0,
+            created REAL NOT NULL,
+            last_used REAL NOT NULL,
+            hits INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS plans_last_used ON plans (last_used);
+    """
+
+    def __init__(
+        self,
+        path: str = None,
+        ttl: float = None,
+        max_entries: int = None
+    ):
+        """
+        Initialize plan cache
+
+        Args:
+            path: SQLite file (defaults to config.PLAN_CACHE_PATH;
+                 ":memory:" keeps the cache in memory)
+            ttl: Seconds an unpinned entry stays valid (defaults to config.PLAN_CACHE_TTL)
+            max_entries: Entries kept (defaults to config.PLAN_CACHE_MAX_ENTRIES)
+        """
+        self.path = path or config.PLAN_CACHE_PATH
+        self.ttl = ttl if ttl is not None else config.PLAN_CACHE_TTL
+        self.max_entries = max_entries or config.PLAN_CACHE_MAX_ENTRIES
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.executescript(self.SCHEMA)
+
+    def close(self) -> None:
+        """Closes the database"""
+        with self._lock:
+            self._db.close()
+
+    @staticmethod
+    def make_key(instruction: str, model: str, prompt_version: str) -> str:
+        """
+        Builds the cache key of an instruction
+
+        Args:
+            instruction: User's task description
+            model: Planning model
+            prompt_version: Planning prompt version
+
+        Returns:
+            Hex digest identifying the entry
+        """
+        material = "\0".join((normalize_instruction(instruction), model, prompt_version))
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(
+        self,
+        instruction: str,
+        model: str,
+        prompt_version: str
+    ) -> Optional[List[Dict]]:
+        """
+        Returns the cached plan steps for an instruction
+
+        Args:
+            instruction: User's task description
+            model: Planning model
+            prompt_version: Planning prompt version
+
+        Returns:
+            List of step dictionaries, or None on a miss
+        """
+        key = self.make_key(instruction, model, prompt_version)
+        now = time.time()
+
+        with self._lock:
+            row = self._db.execute(
+                "SELECT steps FROM plans WHERE key = ? AND (pinned = 1 OR created >= ?)",
+                (key, now - self.ttl)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._db.execute(
+                "UPDATE plans SET last_used = ?, hits = hits + 1 WHERE key = ?",
+                (now, key)
+            )
+            self._db.commit()
+
+        return json.loads(row[0])
+
+    def put(
+        self,
+        instruction: str,
+        model: str,
+        prompt_version: str,
+        steps: List[Dict],
+        pinned: bool = False
+    ) -> None:
+        """
+        Stores the steps of a validated plan
+        Replaces any entry for the same key (keeping its pin)
+
+        Args:
+            instruction: User's task description
+            model: Planning model
+            prompt_version: Planning prompt version
+            steps: Validated plan steps
+            pinned: Keep the entry regardless of TTL and eviction
+        """
+        key = self.make_key(instruction, model, prompt_version)
+        now = time.time()
+
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO plans (key, instruction, model, prompt_version, steps, "
+                "pinned, created, last_used) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET steps = excluded.steps, "
+                "pinned = MAX(pinned, excluded.pinned), created = excluded.created, "
+                "last_used = excluded.last_used",
+                (
+                    key,
+                    normalize_instruction(instruction),
+                    model,
+                    prompt_version,
+                    json.dumps(steps, ensure_ascii=False),
+                    int(pinned),
+                    now,
+                    now
+                )
+            )
+            self._evict(now)
+            self._db.commit()
+
+    def pin(
+        self,
+        instruction: str,
+        model: str,
+        prompt_version: str,
+        pinned: bool = True
+    ) -> bool:
+        """
+        Pins (or unpins) the entry of an instruction
+
+        Args:
+            instruction: User's task description
+            model: Planning model
+            prompt_version: Planning prompt version
+            pinned: New pin state
+
+        Returns:
+            True if the entry exists
+        """
+        key = self.make_key(instruction, model, prompt_version)
+        with self._lock:
+            updated = self._db.execute(
+                "UPDATE plans SET pinned = ? WHERE key = ?",
+                (int(pinned), key)
+            ).rowcount
+            self._db.commit()
+        return updated > 0
+
+    def invalidate(
+        self,
+        instruction: str,
+        model: Optional[str] = None,
+        prompt_version: Optional[str] = None
+    ) -> int:
+        """
+        Removes the entries of an instruction (pinned ones included)
+
+        Args:
+            instruction: User's task description
+            model: Planning model (None matches every model)
+            prompt_version: Planning prompt version (None matches every version)
+
+        Returns:
+            Number of entries removed
+        """
+        query = "DELETE FROM plans WHERE instruction = ?"
+        params: List[Any] = [normalize_instruction(instruction)]
+        if model is not None:
+            query += " AND model = ?"
+            params.append(model)
+        if prompt_version is not None:
+            query += " AND prompt_version = ?"
+            params.append(prompt_version)
+
+        with self._lock:
+            removed = self._db.execute(query, params).rowcount
+            self._db.commit()
+
+        if removed:
+            logger.debug(f"Invalidated {removed} cached plan(s) for '{instruction}'")
+        return removed
+
+    def clear(self, include_pinned: bool = False) -> None:
+        """
+        Removes every entry (counters are kept)
+
+        Args:
+            include_pinned: Also remove pinned entries
+        """
+        with self._lock:
+            if include_pinned:
+                self._db.execute("DELETE FROM plans")
+            else:
+                self._db.execute("DELETE FROM plans WHERE pinned = 0")
+            self._db.commit()
+
+    def _evict(self, now: float) -> None:
+        """
+        Drops expired entries and the least recently used beyond the limit
+
+        Pinned entries are kept. The lock must be held.
+
+        Args:
+            now: Current time.time()
+        """
+        expired = self._db.execute(
+            "DELETE FROM plans WHERE pinned = 0 AND created < ?",
+            (now - self.ttl,)
+        ).rowcount
+        overflow = self._db.execute(
+            "DELETE FROM plans WHERE key IN ("
+            "SELECT key FROM plans WHERE pinned = 0 "
+            "ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        ).rowcount
+        self.evictions += expired + overflow
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns cache counters for monitoring
+
+        Returns:
+            Dictionary with entries, pinned entries, hits, misses,
+            evictions and hit rate
+        """
+        with self._lock:
+            entries, pinned = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(pinned), 0) FROM plans"
+            ).fetchone()
+            return {
+                "entries": entries,
+                "pinned": pinned,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hit_rate,
+            }
+
+    def __len__(self) -> int:
+        return self.stats()["entries"]
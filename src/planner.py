@@ -7,9 +7,17 @@ Generates and validates action plans from user instructions
 
 import json
 import re
-from typing import List, Dict, Optional
-
-from .openai_client import OpenAIClient
+from typing import List, Dict, Optional, Union
+
+from .background_loop import run_sync
+from .config import config
+from .openai_client import (
+    AsyncOpenAIClient,
+    OpenAIClient,
+    get_openai_client,
+    plan_prompt_version
+)
+from .plan_cache import PlanCache
 from .exceptions import PlanningError, InvalidPlanError
 from .logger import logger, log_plan
 
@@ -99,18 +107,38 @@ class ActionPlan:
 class Planner:
     """Generates action plans from user instructions"""
 
-    def __init__(self, openai_client: Optional[OpenAIClient] = None):
+    def __init__(
+        self,
+        openai_client: Optional[Union[OpenAIClient, AsyncOpenAIClient]] = None,
+        plan_cache: Optional[PlanCache] = None
+    ):
         """
         Initialize planner
 
         Args:
-            openai_client: OpenAI client instance (creates new one if not provided)
+            openai_client: OpenAI client instance, blocking or async
+                          (defaults to the shared client)
+            plan_cache: Persistent PlanCache consulted before planning
+                       (opened automatically when config.PLAN_CACHE_ENABLED
+                       is set)
         """
-        self.client = openai_client or OpenAIClient()
+        self.client = openai_client or get_openai_client()
+
+        self.plan_cache = plan_cache
+        if self.plan_cache is None and config.PLAN_CACHE_ENABLED:
+            self.plan_cache = PlanCache()
+
+    @property
+    def async_client(self) -> AsyncOpenAIClient:
+        """Async client behind self.client"""
+        if isinstance(self.client, OpenAIClient):
+            return self.client.aio
+        return self.client
 
     def generate_plan(self, user_instruction: str) -> ActionPlan:
         """
         Generates an action plan from user instruction
+        Blocking wrapper around generate_plan_async
 
         Args:
             user_instruction: The user's task description
@@ -122,11 +150,31 @@ class Planner:
             PlanningError: If plan generation fails
             InvalidPlanError: If generated plan is invalid
         """
+        return run_sync(self.generate_plan_async(user_instruction))
+
+    async def generate_plan_async(self, user_instruction: str) -> ActionPlan:
+        """
+        Generates an action plan from user instruction
+
+        Args:
+            user_instruction: The user's task description
+
+        Returns:
+            ActionPlan instance
+
+        Raises:
+            PlanningError: If plan generation fails
+            InvalidPlanError: If generated plan is invalid
+        """
+        cached = self._cached_plan(user_instruction)
+        if cached is not None:
+            return cached
+
         log_plan(f"Generating plan for: '{user_instruction}'")
 
         try:
             # Get plan from OpenAI
-            response = self.client.generate_plan(user_instruction)
+            response = await self.async_client.generate_plan(user_instruction)
 
             logger.debug(f"Raw plan response:\n{response}")
 
@@ -142,6 +190,8 @@ class Planner:
             log_plan(f"Plan generated with {len(plan)} steps")
             self._log_plan_summary(plan)
 
+            self._store_plan(user_instruction, plan)
+
             return plan
 
         except InvalidPlanError:
@@ -149,6 +199,61 @@ class Planner:
         except Exception as e:
             raise PlanningError(f"Failed to generate plan: {e}")
 
+    def _cached_plan(self, user_instruction: str) -> Optional[ActionPlan]:
+        """
+        Returns the cached plan for an instruction (if the cache is enabled)
+        Entries that no longer validate are dropped; cache errors are
+        logged and treated as misses
+
+        Args:
+            user_instruction: The user's task description
+
+        Returns:
+            ActionPlan or None
+        """
+        if self.plan_cache is None:
+            return None
+
+        prompt_version = plan_prompt_version()
+        try:
+            steps = self.plan_cache.get(user_instruction, config.MODEL, prompt_version)
+            if steps is None:
+                return None
+            plan = ActionPlan(steps)
+
+        except InvalidPlanError as e:
+            logger.warning(f"Discarding invalid cached plan: {e}")
+            self.plan_cache.invalidate(user_instruction, config.MODEL, prompt_version)
+            return None
+        except Exception as e:
+            logger.warning(f"Plan cache lookup failed: {e}")
+            return None
+
+        log_plan(f"Using cached plan for: '{user_instruction}' ({len(plan)} steps)")
+        self._log_plan_summary(plan)
+        return plan
+
+    def _store_plan(self, user_instruction: str, plan: ActionPlan) -> None:
+        """
+        Stores a validated plan in the plan cache (if enabled)
+
+        Args:
+            user_instruction: The user's task description
+            plan: Validated plan
+        """
+        if self.plan_cache is None:
+            return
+
+        try:
+            self.plan_cache.put(
+                user_instruction,
+                config.MODEL,
+                plan_prompt_version(),
+                plan.steps
+            )
+        except Exception as e:
+            logger.warning(f"Plan cache store failed: {e}")
+
     def _extract_json_from_response(self, response: str) -> Optional[List[Dict]]:
         """
         Extracts JSON array from response text
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rate limiter module for UnifyVision
+Client-side request and token budgets shared by threads and event loops
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .config import config
+from .logger import logger
+
+
+def estimate_tokens(text: str, images: int = 0, output_tokens: int = 0) -> int:
+    """
+    Rough token count of a request, charged before it is sent
+
+    Text is counted at about four characters per token and each image at
+    config.RATE_LIMIT_IMAGE_TOKENS. The estimate is corrected with the
+    reported usage once the answer arrives.
+
+    Args:
+        text: Prompt text
+        images: Images attached
+        output_tokens: Output tokens the request may produce
+
+    Returns:
+        Estimated total tokens
+    """
+    return max(1, len(text) // 4 + images * config.RATE_LIMIT_IMAGE_TOKENS + output_tokens)
+
+
+class TokenBucket:
+    """
+    Per-minute budget refilled continuously
+
+    Reservations may take the level below zero: a caller's wait is the
+    time the refill needs to pay the debt back, so callers are served in
+    the order they reserved. Not thread-safe on its own.
+    """
+
+    def __init__(self, per_minute: float):
+        """
+        Initialize bucket
+
+        Args:
+            per_minute: Budget per minute (also the largest burst)
+        """
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """
+        Takes an amount from the budget
+
+        Args:
+            amount: Units to take (capped at the capacity)
+            now: time.monotonic() timestamp
+
+        Returns:
+            Seconds until the reservation is covered
+        """
+        self._refill(now)
+        self.level -= min(amount, self.capacity)
+        return max(0.0, -self.level / self.rate)
+
+    def refund(self, amount: float, now: float) -> None:
+        """Gives units back to the budget (a negative amount charges more)"""
+        self._refill(now)
+        self.level = min(self.capacity, self.level + amount)
+
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute limiter
+
+    Callers over budget are queued (they sleep until their turn) instead of
+    failing with a 429. The budget is shared by threads (acquire) and event
+    loops (acquire_async), so several agents on one API key can use one
+    limiter. Token reservations use an estimate that is corrected with the
+    reported usage through settle().
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = None,
+        tokens_per_minute: float = None
+    ):
+        """
+        Initialize rate limiter
+
+        Args:
+            requests_per_minute: Request budget (defaults to config.RATE_LIMIT_RPM)
+            tokens_per_minute: Token budget (defaults to config.RATE_LIMIT_TPM)
+        """
+        self.requests = TokenBucket(requests_per_minute or config.RATE_LIMIT_RPM)
+        self.tokens = TokenBucket(tokens_per_minute or config.RATE_LIMIT_TPM)
+
+        self.granted = 0
+        self.tokens_charged = 0
+        self.waited = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int = 0) -> float:
+        """
+        Reserves one request and its tokens without waiting
+
+        Args:
+            tokens: Estimated tokens of the request
+
+        Returns:
+            Seconds the caller must wait before sending
+        """
+        with self._lock:
+            now = time.monotonic()
+            delay = max(self.requests.reserve(1, now), self.tokens.reserve(tokens, now))
+            self.granted += 1
+            self.tokens_charged += tokens
+            if delay > 0:
+                self.waited += 1
+                self.queue_depth += 1
+                self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+            return delay
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Waits (blocking the thread) until a request may be sent
+
+        Args:
+            tokens: Estimated tokens of the request
+
+        Returns:
+            Seconds waited
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            logger.debug(f"Rate limit reached, waiting {delay:.2f}s")
+            try:
+                time.sleep(delay)
+            finally:
+                self._dequeue(delay)
+        return delay
+
+    async def acquire_async(self, tokens: int = 0) -> float:
+        """
+        Waits (without blocking the loop) until a request may be sent
+        A cancelled caller gives its reservation back
+
+        Args:
+            tokens: Estimated tokens of the request
+
+        Returns:
+            Seconds waited
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            logger.debug(f"Rate limit reached, waiting {delay:.2f}s")
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self._release(tokens)
+                raise
+            finally:
+                self._dequeue(delay)
+        return delay
+
+    def settle(self, estimated: int, actual: Optional[int]) -> None:
+        """
+        Corrects a token reservation with the usage the API reported
+
+        Args:
+            estimated: Tokens reserved for the request
+            actual: Total tokens reported, or None if unknown
+        """
+        if actual is None:
+            return
+        with self._lock:
+            self.tokens.refund(estimated - actual, time.monotonic())
+            self.tokens_charged += actual - estimated
+
+    def _release(self, tokens: int) -> None:
+        """Gives a reservation back"""
+        with self._lock:
+            now = time.monotonic()
+            self.requests.refund(1, now)
+            self.tokens.refund(tokens, now)
+            self.granted -= 1
+            self.tokens_charged -= tokens
+
+    def _dequeue(self, delay: float) -> None:
+        """Records the end of a wait"""
+        with self._lock:
+            self.queue_depth -= 1
+            self.total_wait += delay
+            self.max_wait = max(self.max_wait, delay)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns limiter counters for sizing concurrency
+
+        Returns:
+            Dictionary with requests granted, tokens charged, requests that
+            waited, current and peak queue depth, and mean and max wait
+            in milliseconds (over the requests that waited)
+        """
+        with self._lock:
+            return {
+                "requests": self.granted,
+                "tokens": self.tokens_charged,
+                "waited": self.waited,
+                "queue_depth": self.queue_depth,
+                "max_queue_depth": self.max_queue_depth,
+                "mean_wait_ms": self.total_wait * 1000 / self.waited if self.waited else 0.0,
+                "max_wait_ms": self.max_wait * 1000,
+            }
+
+
+_shared_limiters: Dict[str, RateLimiter] = {}
+_shared_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(api_key: Optional[str] = None) -> Optional[RateLimiter]:
+    """
+    Returns the process-wide limiter for an API key, creating it on first use
+
+    Args:
+        api_key: OpenAI API key (defaults to config.OPENAI_API_KEY)
+
+    Returns:
+        Shared RateLimiter, or None if config.RATE_LIMIT_ENABLED is off
+    """
+    if not config.RATE_LIMIT_ENABLED:
+        return None
+
+    api_key = api_key or config.OPENAI_API_KEY or ""
+    with _shared_limiters_lock:
+        limiter = _shared_limiters.get(api_key)
+        if limiter is None:
+            limiter = RateLimiter()
+            _shared_limiters[api_key] = limiter
+        return limiter
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Request policy module for UnifyVision
+Deadlines, jittered exponential backoff and hedged requests for API calls
+"""
+
+import asyncio
+import random
+import threading
+from collections import Counter, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, TypeVar
+
+import httpx
+import openai
+
+from .config import config
+from .exceptions import RequestDeadlineError
+from .logger import logger
+from .metrics import RequestStats
+
+
+T = TypeVar("T")
+
+
+# HTTP statuses worth another attempt (timeouts, conflicts, rate limits, server errors)
+RETRYABLE_STATUSES = frozenset({408, 409, 429})
+
+
+class AttemptRecord:
+    """Outcome of one attempt of a request"""
+
+    def __init__(
+        self,
+        label: str,
+        number: int,
+        hedge: bool,
+        started: float,
+        duration: float,
+        outcome: str,
+        error: Optional[str] = None
+    ):
+        """
+        Initialize attempt record
+
+        Args:
+            label: Request kind
+            number: 1-based attempt number within the request
+            hedge: True for a duplicate sent by hedging
+            started: Seconds after the request started
+            duration: Seconds the attempt ran
+            outcome: "ok", "error", "timeout" or "cancelled"
+            error: Error description for failed attempts
+        """
+        self.label = label
+        self.number = number
+        self.hedge = hedge
+        self.started = started
+        self.duration = duration
+        self.outcome = outcome
+        self.error = error
+
+    def __repr__(self) -> str:
+        kind = "hedge" if self.hedge else "attempt"
+        return (
+            f"AttemptRecord({self.label} {kind} {self.number}: {self.outcome} "
+            f"after {self.duration * 1000:.0f}ms"
+            f"{f', {self.error}' if self.error else ''})"
+        )
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    True if a failed attempt may succeed when repeated
+
+    Connection problems, timeouts, 408/409/429 and 5xx responses are
+    retryable; other API errors (bad request, authentication) are not.
+
+    Args:
+        error: Exception raised by the attempt
+
+    Returns:
+        True if the request should be retried
+    """
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code in RETRYABLE_STATUSES or error.status_code >= 500
+    return isinstance(
+        error,
+        (openai.APIConnectionError, httpx.TransportError, TimeoutError, ConnectionError)
+    )
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Seconds the server asked to wait before retrying, if any"""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class RequestPolicy:
+    """
+    Runs API calls under a deadline with retries and optional hedging
+
+    Each request gets config.REQUEST_DEADLINE seconds across all of its
+    attempts, and each attempt at most config.REQUEST_ATTEMPT_TIMEOUT.
+    Retryable failures are retried after a full-jitter exponential backoff
+    (honoring Retry-After). With hedging enabled, a duplicate is sent when
+    an attempt outlives the p95 duration of the label's successful attempts
+    (queueing, retries and backoff excluded) and the first answer wins.
+    Every attempt is recorded. Safe to share between event loops.
+    """
+
+    def __init__(
+        self,
+        deadline: float = None,
+        attempt_timeout: float = None,
+        max_attempts: int = None,
+        backoff_base: float = None,
+        backoff_max: float = None,
+        hedge: bool = None,
+        hedge_delay: float = None,
+        max_records: int = 500
+    ):
+        """
+        Initialize request policy
+
+        Args:
+            deadline: Seconds per request, all attempts included
+                     (defaults to config.REQUEST_DEADLINE)
+            attempt_timeout: Seconds per attempt (defaults to config.REQUEST_ATTEMPT_TIMEOUT)
+            max_attempts: Attempts per request, hedges not counted
+                         (defaults to config.REQUEST_MAX_ATTEMPTS)
+            backoff_base: First backoff cap in seconds (defaults to config.REQUEST_BACKOFF_BASE)
+            backoff_max: Largest backoff cap in seconds (defaults to config.REQUEST_BACKOFF_MAX)
+            hedge: Send hedged duplicates (defaults to config.REQUEST_HEDGE_ENABLED)
+            hedge_delay: Hedge delay in seconds until enough latency samples
+                        exist for a p95 (defaults to config.REQUEST_HEDGE_DELAY)
+            max_records: Attempt records kept
+        """
+        self.deadline = deadline or config.REQUEST_DEADLINE
+        self.attempt_timeout = attempt_timeout or config.REQUEST_ATTEMPT_TIMEOUT
+        self.max_attempts = max_attempts or config.REQUEST_MAX_ATTEMPTS
+        self.backoff_base = (
+            backoff_base if backoff_base is not None else config.REQUEST_BACKOFF_BASE
+        )
+        self.backoff_max = (
+            backoff_max if backoff_max is not None else config.REQUEST_BACKOFF_MAX
+        )
+        self.hedge = hedge if hedge is not None else config.REQUEST_HEDGE_ENABLED
+        self.hedge_delay = hedge_delay or config.REQUEST_HEDGE_DELAY
+
+        # Durations of successful attempts, the basis of the hedge delay
+        self.latencies = RequestStats()
+        self.records: Deque[AttemptRecord] = deque(maxlen=max_records)
+        self._outcomes: Counter = Counter()
+        self._lock = threading.Lock()
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[T]],
+        label: str = "request",
+        hedge: Optional[bool] = None
+    ) -> T:
+        """
+        Runs a call under the policy
+
+        Args:
+            call: Starts one attempt (called again for every retry and hedge)
+            label: Request kind, for records and the hedge delay
+            hedge: Override of the policy's hedging (False for streams)
+
+        Returns:
+            Result of the first successful attempt
+
+        Raises:
+            RequestDeadlineError: If the deadline passes before an answer
+            Exception: The last error once it isn't retryable or attempts run out
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + self.deadline
+        hedge = self.hedge if hedge is None else hedge
+        attempts: List[AttemptRecord] = []
+        number = 0
+
+        while True:
+            number += 1
+            timeout = min(self.attempt_timeout, deadline - loop.time())
+
+            try:
+                return await self._attempt(call, label, number, hedge, timeout, started, attempts)
+
+            except Exception as e:
+                if not is_retryable(e):
+                    raise
+
+                if number >= self.max_attempts:
+                    if loop.time() >= deadline:
+                        raise RequestDeadlineError(
+                            f"{label} exceeded its {self.deadline:g}s deadline",
+                            attempts
+                        ) from e
+                    raise
+
+                delay = self._backoff(number, e)
+                if loop.time() + delay >= deadline:
+                    raise RequestDeadlineError(
+                        f"{label} exceeded its {self.deadline:g}s deadline "
+                        f"after {number} attempt(s): {e}",
+                        attempts
+                    ) from e
+
+                logger.debug(f"{label} attempt {number} failed ({e}), retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+    async def _attempt(
+        self,
+        call: Callable[[], Awaitable[T]],
+        label: str,
+        number: int,
+        hedge: bool,
+        timeout: float,
+        started: float,
+        attempts: List[AttemptRecord]
+    ) -> T:
+        """
+        Runs one attempt, plus a hedged duplicate if it outlives the hedge delay
+
+        Raises:
+            TimeoutError: If no attempt answered within timeout
+            Exception: The first attempt's error if every attempt failed
+        """
+        loop = asyncio.get_running_loop()
+        attempt_started = loop.time()
+        expires = attempt_started + timeout
+
+        tasks = [loop.create_task(
+            self._timed(call, label, number, False, started, expires, attempts)
+        )]
+        hedge_delay = self._hedge_delay(label) if hedge else None
+
+        try:
+            if hedge_delay is not None and hedge_delay < timeout:
+                done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+                if not done:
+                    logger.debug(f"{label} slower than {hedge_delay:.2f}s, sending a hedge")
+                    tasks.append(loop.create_task(
+                        self._timed(call, label, number, True, started, expires, attempts)
+                    ))
+
+            pending = set(tasks)
+            first_error: Optional[BaseException] = None
+            while pending:
+                remaining = expires - loop.time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=remaining,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    first_error = first_error or task.exception()
+
+            if pending:
+                raise TimeoutError(f"{label} attempt {number} timed out after {timeout:.1f}s")
+            raise first_error
+
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _timed(
+        self,
+        call: Callable[[], Awaitable[T]],
+        label: str,
+        number: int,
+        hedge: bool,
+        started: float,
+        expires: float,
+        attempts: List[AttemptRecord]
+    ) -> T:
+        """
+        Runs the call once and records its outcome
+
+        A cancellation past the expiry time is recorded as a timeout.
+
+        Args:
+            call: Starts the attempt
+            label: Request kind
+            number: 1-based attempt number
+            hedge: True for a hedged duplicate
+            started: Loop time the request started
+            expires: Loop time the attempt times out
+            attempts: Records of the request, appended to
+
+        Returns:
+            Result of the call
+        """
+        loop = asyncio.get_running_loop()
+        attempt_started = loop.time()
+        outcome, error = "error", None
+
+        try:
+            result = await call()
+            outcome = "ok"
+            return result
+        except asyncio.CancelledError:
+            outcome = "timeout" if loop.time() >= expires else "cancelled"
+            raise
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            record = AttemptRecord(
+                label,
+                number,
+                hedge,
+                attempt_started - started,
+                loop.time() - attempt_started,
+                outcome,
+                error
+            )
+            attempts.append(record)
+            if outcome == "ok":
+                self.latencies.record(label, record.duration)
+            with self._lock:
+                self.records.append(record)
+                self._outcomes[(label, "hedge" if hedge else "attempt", outcome)] += 1
+
+    def _hedge_delay(self, label: str) -> Optional[float]:
+        """
+        Delay before a hedge is sent
+
+        Args:
+            label: Request kind
+
+        Returns:
+            p95 duration of the label's successful attempts, or the
+            configured delay while there are too few samples
+        """
+        p95 = self.latencies.percentile(label, 0.95, config.REQUEST_HEDGE_MIN_SAMPLES)
+        return p95 if p95 is not None else self.hedge_delay
+
+    def _backoff(self, number: int, error: BaseException) -> float:
+        """Full-jitter exponential backoff before the next attempt"""
+        cap = min(self.backoff_max, self.backoff_base * 2 ** (number - 1))
+        delay = random.uniform(0, cap)
+
+        server_delay = retry_after(error)
+        if server_delay is not None:
+            delay = max(delay, min(server_delay, self.backoff_max))
+
+        return delay
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns attempt outcome counts per label
+
+        Returns:
+            Dictionary mapping each label to counts of attempts and hedges
+            by outcome, e.g. {"attempt_ok": 9, "attempt_error": 1, "hedge_ok": 2}
+        """
+        summary: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for (label, kind, outcome), count in self._outcomes.items():
+                summary.setdefault(label, {})[f"{kind}_{outcome}"] = count
+        return summary
@@ -5,131 +5,332 @@ Screen capture module for UnifyVision
 Handles screen capture operations and display scaling
 """
 
-import base64
-import io
-from typing import Tuple
+import threading
+import time
+from typing import Dict, Optional, Tuple
 from PIL import Image
 import mss
-import pyautogui
 
 from .config import config
-from .exceptions import ScreenCaptureError, ScreenChangeDetectionError
+from .change_detection import ChangeDetector, ChangeResult
+from .display_geometry import DisplayGeometryService
+from .exceptions import ScreenCaptureError
+from .frame import Frame, ImageSource, as_image, content_key
+from .image_encoder import (
+    EncodedImage,
+    ImageEncoder,
+    create_encoder,
+    encode_cache
+)
 from .logger import logger, log_capture
 
 
+class CaptureSession:
+    """
+    Long-lived mss handle shared by every grab of a ScreenCapture
+
+    Opening mss connects to the display server (X11/Quartz/GDI) and sets up
+    its grab buffers, which is far more expensive than the grab itself.
+    The session opens it once, serializes access with a lock and must be
+    closed explicitly on shutdown.
+    """
+
+    def __init__(self, monitor_index: int = None):
+        """
+        Initialize capture session (the mss handle is opened lazily)
+
+        Args:
+            monitor_index: mss monitor index to capture
+                          (defaults to config.CAPTURE_MONITOR_INDEX)
+        """
+        self.monitor_index = (
+            monitor_index if monitor_index is not None
+            else config.CAPTURE_MONITOR_INDEX
+        )
+        self.grab_count = 0
+        self._sct = None
+        self._lock = threading.RLock()
+
+    def _ensure_open(self):
+        """Opens the mss handle on first use"""
+        if self._sct is None:
+            self._sct = mss.mss()
+            logger.debug("Capture session opened")
+        return self._sct
+
+    @property
+    def closed(self) -> bool:
+        """True if the mss handle is not currently open"""
+        return self._sct is None
+
+    @property
+    def monitor(self) -> Dict[str, int]:
+        """
+        Geometry of the captured monitor
+
+        Returns:
+            mss monitor dict (left, top, width, height)
+        """
+        with self._lock:
+            return dict(self._ensure_open().monitors[self.monitor_index])
+
+    def grab(self, region: Optional[Dict[str, int]] = None):
+        """
+        Grabs a region of the screen using the shared mss handle
+
+        Args:
+            region: mss region dict (defaults to the whole monitor)
+
+        Returns:
+            mss ScreenShot
+        """
+        with self._lock:
+            sct = self._ensure_open()
+            screenshot = sct.grab(region or sct.monitors[self.monitor_index])
+            self.grab_count += 1
+            return screenshot
+
+    def refresh(self) -> None:
+        """Drops the mss handle so the monitor layout is re-enumerated"""
+        self.close()
+
+    def close(self) -> None:
+        """Closes the mss handle; the next grab reopens it"""
+        with self._lock:
+            if self._sct is not None:
+                self._sct.close()
+                self._sct = None
+                logger.debug(
+                    f"Capture session closed after {self.grab_count} grabs"
+                )
+
+    def __enter__(self) -> "CaptureSession":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
 class ScreenCapture:
     """Handles all screen capture related operations"""
 
-    @staticmethod
-    def get_display_scale() -> Tuple[float, float]:
+    def __init__(self, session: Optional[CaptureSession] = None):
+        """
+        Initialize screen capture
+
+        Args:
+            session: CaptureSession to grab with (creates new one if not provided)
+        """
+        self.session = session or CaptureSession()
+        self.geometry = DisplayGeometryService(self.session)
+
+    def close(self) -> None:
+        """Releases the capture session and display watchers"""
+        self.geometry.close()
+        self.session.close()
+
+    def get_display_scale(self) -> Tuple[float, float]:
         """
         Detects the display scale factor (for Retina displays)
         Returns the ratio between physical pixels and logical pixels
+        The value is cached until the monitor configuration changes
 
         Returns:
             Tuple of (scale_x, scale_y)
 
+        Raises:
+            ScreenCaptureError: If screen capture fails
+        """
+        return self.geometry.current().scale
+
+    def capture_screen(self, save_path: str = None) -> str:
+        """
+        Captures the entire screen and saves as PNG
+
+        Args:
+            save_path: Path to save the screenshot (defaults to config.SCREENSHOT_PATH)
+
+        Returns:
+            Path to the saved screenshot
+
+        Raises:
+            ScreenCaptureError: If screen capture fails
+        """
+        log_capture("Capturing full screen...")
+        return self.save_image(self.capture_screen_to_memory(), save_path)
+
+    def capture_frame(self) -> Frame:
+        """
+        Captures the whole monitor as a Frame (raw buffer, no conversion)
+
+        Returns:
+            Frame object
+
         Raises:
             ScreenCaptureError: If screen capture fails
         """
         try:
-            with mss.mss() as sct:
-                monitor = sct.monitors[1]
-                real_width = monitor["width"]
-                real_height = monitor["height"]
-
-            # Get logical size (what pyautogui reports)
-            logical_size = pyautogui.size()
-            logical_width = logical_size.width
-            logical_height = logical_size.height
-
-            # Calculate scale factor
-            scale_x = real_width / logical_width
-            scale_y = real_height / logical_height
-
-            logger.debug(
-                f"Display scale detected: {scale_x:.2f}x, {scale_y:.2f}x"
-            )
+            timestamp = time.monotonic()
+            return Frame.from_screenshot(self.session.grab(), timestamp=timestamp)
+
+        except Exception as e:
+            raise ScreenCaptureError(f"Failed to capture screen: {e}")
+
+    def capture_region(
+        self,
+        left: int,
+        top: int,
+        width: int,
+        height: int
+    ) -> Frame:
+        """
+        Captures a rectangular region of the monitor as a Frame
+        The region is clipped to the monitor bounds
+
+        Args:
+            left: X of the region in image (physical) pixels
+            top: Y of the region in image (physical) pixels
+            width: Region width in pixels
+            height: Region height in pixels
+
+        Returns:
+            Frame of the region, positioned relative to the monitor
+
+        Raises:
+            ScreenCaptureError: If screen capture fails
+        """
+        try:
+            monitor = self.session.monitor
+
+            x1 = max(0, min(int(left), monitor["width"] - 1))
+            y1 = max(0, min(int(top), monitor["height"] - 1))
+            x2 = max(x1 + 1, min(int(left + width), monitor["width"]))
+            y2 = max(y1 + 1, min(int(top + height), monitor["height"]))
 
-            return scale_x, scale_y
+            timestamp = time.monotonic()
+            screenshot = self.session.grab({
+                "left": monitor["left"] + x1,
+                "top": monitor["top"] + y1,
+                "width": x2 - x1,
+                "height": y2 - y1,
+            })
+
+            return Frame.from_screenshot(screenshot, x1, y1, timestamp)
 
         except Exception as e:
-            raise ScreenCaptureError(f"Failed to detect display scale: {e}")
+            raise ScreenCaptureError(f"Failed to capture screen region: {e}")
+
+    def capture_screen_to_memory(self) -> Image.Image:
+        """
+        Captures the screen directly to memory (no file I/O)
+
+        Returns:
+            PIL Image object
+
+        Raises:
+            ScreenCaptureError: If screen capture fails
+        """
+        return self.capture_frame().image
+
+    def capture_region_to_memory(
+        self,
+        left: int,
+        top: int,
+        width: int,
+        height: int
+    ) -> Image.Image:
+        """
+        Captures a rectangular region of the monitor to memory
+
+        Args:
+            left: X of the region in image (physical) pixels
+            top: Y of the region in image (physical) pixels
+            width: Region width in pixels
+            height: Region height in pixels
+
+        Returns:
+            PIL Image object of the region
+
+        Raises:
+            ScreenCaptureError: If screen capture fails
+        """
+        return self.capture_region(left, top, width, height).image
 
     @staticmethod
-    def capture_screen(save_path: str = None) -> str:
+    def save_image(img: ImageSource, save_path: str = None) -> str:
         """
-        Captures the entire screen and saves as PNG
+        Saves a captured image as PNG
 
         Args:
+            img: Image or Frame to save
             save_path: Path to save the screenshot (defaults to config.SCREENSHOT_PATH)
 
         Returns:
             Path to the saved screenshot
 
         Raises:
-            ScreenCaptureError: If screen capture fails
+            ScreenCaptureError: If saving fails
         """
         save_path = save_path or config.SCREENSHOT_PATH
 
         try:
-            log_capture("Capturing full screen...")
-
-            with mss.mss() as sct:
-                # On macOS, the main monitor is index 1
-                monitor = sct.monitors[1]
-                screenshot = sct.grab(monitor)
-
-                # Convert to PIL Image and save as PNG
-                img = Image.frombytes(
-                    "RGB",
-                    screenshot.size,
-                    screenshot.bgra,
-                    "raw",
-                    "BGRX"
-                )
-                img.save(save_path)
-
+            as_image(img).save(save_path)
             logger.debug(f"Screenshot saved: {save_path}")
             return save_path
 
         except Exception as e:
-            raise ScreenCaptureError(f"Failed to capture screen: {e}")
+            raise ScreenCaptureError(f"Failed to save screenshot: {e}")
 
     @staticmethod
-    def capture_screen_to_memory() -> Image.Image:
+    def encode_image(
+        image: ImageSource,
+        max_size: int = None,
+        encoder: Optional[ImageEncoder] = None,
+        cache_key: Optional[str] = None
+    ) -> EncodedImage:
         """
-        Captures the screen directly to memory (no file I/O)
+        Encodes an image for sending to OpenAI
+        Resizes the image if it's too large to save tokens and speed
+        Identical content encoded with identical settings is served from
+        the shared encode cache
+
+        Args:
+            image: Path to the image, PIL image or Frame
+            max_size: Maximum size of longest side (defaults to config.MAX_IMAGE_SIZE)
+            encoder: Encoder to use (defaults to the configured format)
+            cache_key: Content key for the cache (defaults to a hash of the
+                      image content; frames reuse their memoized hash)
 
         Returns:
-            PIL Image object
+            EncodedImage with payload, size and encode time
 
         Raises:
-            ScreenCaptureError: If screen capture fails
+            ScreenCaptureError: If image encoding fails
         """
-        try:
-            with mss.mss() as sct:
-                monitor = sct.monitors[1]
-                screenshot = sct.grab(monitor)
-
-                img = Image.frombytes(
-                    "RGB",
-                    screenshot.size,
-                    screenshot.bgra,
-                    "raw",
-                    "BGRX"
-                )
-
-            return img
+        encoder = encoder or create_encoder(max_size=max_size)
 
-        except Exception as e:
-            raise ScreenCaptureError(
-                f"Failed to capture screen to memory: {e}"
+        key = None
+        if encode_cache.max_bytes > 0:
+            key = encode_cache.make_key(
+                cache_key or content_key(image),
+                encoder
             )
+            cached = encode_cache.get(key)
+            if cached is not None:
+                logger.debug(f"Image encode cache hit: {cached!r}")
+                return cached
+
+        encoded = encoder.encode(image)
+        logger.debug(f"Image encoded: {encoded!r}")
+
+        if key is not None:
+            encode_cache.put(key, encoded)
+
+        return encoded
 
     @staticmethod
     def encode_image_to_base64(
-        image_path: str,
+        image_path: ImageSource,
         max_size: int = None
     ) -> str:
         """
@@ -137,91 +338,44 @@ class ScreenCapture:
         Resizes the image if it's too large to save tokens and speed
 
         Args:
-            image_path: Path to the image
+            image_path: Path to the image, PIL image or Frame
             max_size: Maximum size of longest side (defaults to config.MAX_IMAGE_SIZE)
 
         Returns:
-            Base64 encoded string
+            Base64 encoded string (in the configured image format)
 
         Raises:
             ScreenCaptureError: If image encoding fails
         """
-        max_size = max_size or config.MAX_IMAGE_SIZE
-
-        try:
-            img = Image.open(image_path)
-
-            # Resize if too large
-            width, height = img.size
-            if max(width, height) > max_size:
-                ratio = max_size / max(width, height)
-                new_width = int(width * ratio)
-                new_height = int(height * ratio)
-                img = img.resize(
-                    (new_width, new_height),
-                    Image.Resampling.LANCZOS
-                )
-                logger.debug(
-                    f"Image resized: {width}x{height} → {new_width}x{new_height}"
-                )
-
-            # Convert to bytes
-            buffer = io.BytesIO()
-            img.save(buffer, format="PNG", optimize=True)
-            buffer.seek(0)
-
-            return base64.b64encode(buffer.read()).decode('utf-8')
-
-        except Exception as e:
-            raise ScreenCaptureError(f"Failed to encode image: {e}")
+        return ScreenCapture.encode_image(image_path, max_size).base64
 
     @staticmethod
     def detect_screen_change(
-        img_before: Image.Image,
-        img_after: Image.Image,
+        img_before: ImageSource,
+        img_after: ImageSource,
         threshold: float = None
-    ) -> bool:
+    ) -> ChangeResult:
         """
-        Compares two PIL images in memory to detect significant changes
+        Compares two images or frames in memory to detect significant changes
 
         Args:
-            img_before: Image before action
-            img_after: Image after action
-            threshold: Percentage threshold for change detection
+            img_before: Image or Frame before action
+            img_after: Image or Frame after action
+            threshold: Percentage of changed tiles that counts as a change
                       (defaults to config.SCREEN_CHANGE_THRESHOLD)
 
         Returns:
-            True if significant change detected
+            ChangeResult, truthy if significant change detected, with the
+            map of dirty tiles
 
         Raises:
             ScreenChangeDetectionError: If comparison fails
         """
-        threshold = threshold or config.SCREEN_CHANGE_THRESHOLD
-
-        try:
-            from PIL import ImageChops, ImageStat
-
-            # Resize if necessary
-            if img_before.size != img_after.size:
-                img_after = img_after.resize(img_before.size)
+        result = ChangeDetector().compare(img_before, img_after, threshold)
 
-            # Calculate difference
-            diff = ImageChops.difference(img_before, img_after)
+        logger.debug(
+            f"Screen change detected: {result.changed_percentage:.2f}% "
+            f"of tiles"
+        )
 
-            # Calculate change percentage
-            stat = ImageStat.Stat(diff)
-            sum_diff = sum(stat.sum)  # Sum of all RGB channels
-            total_possible = (
-                img_before.size[0] * img_before.size[1] * 255 * 3
-            )
-
-            percentage_change = (sum_diff / total_possible) * 100
-
-            logger.debug(f"Screen change detected: {percentage_change:.2f}%")
-
-            return percentage_change > threshold
-
-        except Exception as e:
-            raise ScreenChangeDetectionError(
-                f"Failed to detect screen changes: {e}"
-            )
+        return result
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Settle module for UnifyVision
+Waits until the screen stops changing instead of sleeping for fixed delays
+"""
+
+import time
+from typing import Optional, Tuple
+
+from .change_detection import ChangeDetector
+from .config import config
+from .frame import Frame
+from .logger import logger
+
+
+class SettleResult:
+    """Outcome of waiting for the screen to settle"""
+
+    def __init__(
+        self,
+        settled: bool,
+        elapsed: float,
+        samples: int,
+        frame: Optional[Frame] = None
+    ):
+        """
+        Initialize settle result
+
+        Args:
+            settled: True if the screen was stable before the timeout
+            elapsed: Seconds spent waiting
+            samples: Number of frames sampled
+            frame: Last sampled frame (the settled screen or region)
+        """
+        self.settled = settled
+        self.elapsed = elapsed
+        self.samples = samples
+        self.frame = frame
+
+    def __bool__(self) -> bool:
+        return self.settled
+
+    def __repr__(self) -> str:
+        state = "settled" if self.settled else "timed out"
+        return (
+            f"SettleResult({state} after {self.elapsed * 1000:.0f}ms, "
+            f"{self.samples} samples)"
+        )
+
+
+class ScreenSettler:
+    """
+    Polls cheap downsampled frames until the screen stops changing
+
+    Returns as soon as N consecutive samples show no change (after a short
+    floor that lets the UI start reacting), capped by a timeout. When a
+    change is expected (after a click) the stable samples only count once
+    a change has been seen, so a slow-to-react UI isn't taken for a static
+    one. Samples come from a running FrameProducer when available,
+    otherwise from direct grabs.
+    """
+
+    def __init__(
+        self,
+        screen_capture,
+        frame_producer=None,
+        stable_samples: int = None,
+        poll_interval: float = None,
+        min_wait: float = None
+    ):
+        """
+        Initialize screen settler
+
+        Args:
+            screen_capture: ScreenCapture used for direct grabs
+            frame_producer: Optional FrameProducer to sample from
+            stable_samples: Consecutive unchanged samples required
+                           (defaults to config.SETTLE_STABLE_SAMPLES)
+            poll_interval: Seconds between samples
+                          (defaults to config.SETTLE_POLL_INTERVAL)
+            min_wait: Seconds before the screen may be declared settled
+                     (defaults to config.SETTLE_MIN_WAIT)
+        """
+        self.screen_capture = screen_capture
+        self.frame_producer = frame_producer
+        self.stable_samples = stable_samples or config.SETTLE_STABLE_SAMPLES
+        self.poll_interval = (
+            poll_interval if poll_interval is not None
+            else config.SETTLE_POLL_INTERVAL
+        )
+        self.min_wait = (
+            min_wait if min_wait is not None else config.SETTLE_MIN_WAIT
+        )
+        self.detector = ChangeDetector(downscale=config.SETTLE_DOWNSCALE)
+
+    def wait(
+        self,
+        timeout: float,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        require_change: bool = False
+    ) -> SettleResult:
+        """
+        Waits until the screen (or a region of it) stops changing
+
+        Args:
+            timeout: Maximum seconds to wait
+            region: Optional (left, top, width, height) region in image
+                   pixels to watch instead of the whole monitor
+            require_change: Only settle after a change was seen; a screen
+                           that never changes waits for the full timeout
+
+        Returns:
+            SettleResult (truthy if the screen settled before the timeout)
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        settle_floor = start + min(self.min_wait, timeout)
+
+        previous = self._sample(region)
+        samples = 1
+        stable = 0
+        seen_change = not require_change
+
+        while True:
+            now = time.monotonic()
+            if now >= deadline:
+                result = SettleResult(False, now - start, samples, previous)
+                break
+
+            time.sleep(min(self.poll_interval, deadline - now))
+
+            current = self._sample(region, previous.timestamp)
+            samples += 1
+
+            changed = self.detector.compare(
+                previous,
+                current,
+                threshold=config.SETTLE_CHANGE_THRESHOLD
+            )
+            stable = 0 if changed else stable + 1
+            seen_change = seen_change or bool(changed)
+            previous = current
+
+            now = time.monotonic()
+            if seen_change and stable >= self.stable_samples and now >= settle_floor:
+                result = SettleResult(True, now - start, samples, previous)
+                break
+
+        logger.debug(f"Screen settle: {result!r}")
+        return result
+
+    def _sample(
+        self,
+        region: Optional[Tuple[int, int, int, int]],
+        after: Optional[float] = None
+    ) -> Frame:
+        """Takes one sample, newer than `after` when given"""
+        producer = self.frame_producer
+        if producer is not None and producer.running:
+            if after is None:
+                frame = producer.latest() or producer.frame_after(0.0)
+            else:
+                frame = producer.frame_after(after + 1e-6)
+            return frame.crop(*region) if region else frame
+
+        if region:
+            return self.screen_capture.capture_region(*region)
+        return self.screen_capture.capture_frame()
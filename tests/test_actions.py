@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for actions module
+"""
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from src.actions import ActionExecutor
+from src.config import config
+from src.display_geometry import DisplayGeometry
+from src.frame import Frame, as_image
+from src.grid_system import VISION_RESPONSE_FORMAT, GridSystem
+from src.location_cache import LocationCache
+from src.screen_capture import CaptureSession, ScreenCapture
+
+
+def found(*cells):
+    """Vision response locating the element in the given cells"""
+    return json.dumps({
+        "found": True,
+        "cells": [{"cell_number": cell, "coverage_percent": 100} for cell in cells],
+        "confidence": "high"
+    })
+
+
+NOT_FOUND = json.dumps({"found": False, "reasoning": "not visible"})
+
+
+class ScriptedVisionClient:
+    """Answers vision requests from a script and records the images sent"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sizes = []
+        self.requests = []
+        self.aio = AsyncScriptedVisionClient(self)
+
+    def ask_with_image(self, prompt, image, **request):
+        self.sizes.append(image.size)
+        self.requests.append(dict(request, prompt=prompt))
+        return self.responses.pop(0)
+
+    def stream_with_image(self, prompt, image, **request):
+        response = self.ask_with_image(prompt, image, **request)
+        for start in range(0, len(response), 7):
+            yield response[start:start + 7]
+
+
+class AsyncScriptedVisionClient:
+    """Async side of ScriptedVisionClient, recording the loop of each request"""
+
+    def __init__(self, owner):
+        self.owner = owner
+        self.loops = []
+
+    async def ask_with_image(self, prompt, image, **request):
+        self.loops.append(asyncio.get_running_loop())
+        return self.owner.ask_with_image(prompt, image, **request)
+
+    async def stream_with_image(self, prompt, image, **request):
+        self.loops.append(asyncio.get_running_loop())
+        for chunk in self.owner.stream_with_image(prompt, image, **request):
+            yield chunk
+
+
+def make_frame(width=1920, height=1080):
+    """Builds a noisy frame"""
+    rng = np.random.default_rng(0)
+    return Frame(rng.integers(0, 256, (height, width, 4), dtype=np.uint8))
+
+
+class TestFindElement(unittest.TestCase):
+    """Tests for grid-based element lookup"""
+
+    def make_executor(self, responses):
+        self.client = ScriptedVisionClient(responses)
+        return ActionExecutor(
+            screen_capture=mock.Mock(),
+            grid_system=GridSystem(),
+            openai_client=self.client
+        )
+
+    def test_single_pass(self):
+        """Test that the full-screen lookup returns the cell center"""
+        executor = self.make_executor([found(0)])
+        frame = make_frame()
+
+        with mock.patch.object(config, "GRID_COARSE_TO_FINE", False):
+            coordinates = executor._find_element_with_grid(frame, "button")
+
+        cell_w = 1920 // config.GRID_COLS
+        cell_h = 1080 // config.GRID_ROWS
+        self.assertEqual(coordinates, (cell_w // 2, cell_h // 2))
+        self.assertEqual(self.client.sizes, [(1920, 1080)])
+
+    @mock.patch.object(config, "GRID_COARSE_TO_FINE", False)
+    def test_downscales_before_gridding(self):
+        """Test that large frames are gridded at the model size and mapped back"""
+        executor = self.make_executor([found(0)])
+
+        with mock.patch.object(config, "MAX_IMAGE_SIZE", 2000):
+            coordinates = executor._find_element_with_grid(
+                make_frame(2560, 1440),
+                "button"
+            )
+
+        # 1.28x box downscale; cell 0 center maps to the native cell center
+        self.assertEqual(self.client.sizes, [(2000, 1125)])
+        self.assertEqual(
+            coordinates,
+            (round(2560 / config.GRID_COLS / 2), round(1440 / config.GRID_ROWS / 2))
+        )
+
+    @mock.patch.object(config, "GRID_COARSE_TO_FINE", True)
+    @mock.patch.object(config, "GRID_COARSE_MAX_SIZE", 960)
+    def test_coarse_to_fine(self):
+        """Test that the fine pass refines within the native-resolution crop"""
+        # Coarse: 960x540 with 60px cells; cell 17 is row 1, col 1.
+        # Region with one cell of padding: (0, 0, 360, 360) in native pixels.
+        executor = self.make_executor([found(17), found(0)])
+        coordinates = executor._find_element_with_grid(make_frame(), "icon")
+
+        fine_w = 360 // config.GRID_FINE_COLS
+        fine_h = 360 // config.GRID_FINE_ROWS
+        self.assertEqual(self.client.sizes, [(960, 540), (360, 360)])
+        self.assertEqual(coordinates, (round(fine_w / 2), round(fine_h / 2)))
+
+    @mock.patch.object(config, "GRID_COARSE_TO_FINE", True)
+    @mock.patch.object(config, "GRID_COARSE_MAX_SIZE", 960)
+    def test_coarse_to_fine_keeps_frames_unconverted(self):
+        """Test that the lookup sizes and crops a Frame without converting it"""
+        executor = self.make_executor([found(17), found(0)])
+
+        with mock.patch("src.actions.as_image", wraps=as_image) as converted:
+            coordinates = executor._find_element_with_grid(make_frame(), "icon")
+
+        self.assertIsNotNone(coordinates)
+        converted.assert_not_called()
+
+    @mock.patch.object(config, "GRID_COARSE_TO_FINE", True)
+    @mock.patch.object(config, "GRID_COARSE_MAX_SIZE", 960)
+    def test_fine_miss_uses_coarse_estimate(self):
+        """Test that a fine miss falls back to the scaled coarse centroid"""
+        executor = self.make_executor([found(17), NOT_FOUND])
+        coordinates = executor._find_element_with_grid(make_frame(), "icon")
+
+        self.assertEqual(coordinates, (180, 180))
+
+    @mock.patch.object(config, "GRID_COARSE_TO_FINE", True)
+    def test_coarse_miss(self):
+        """Test that a coarse miss skips the fine pass"""
+        executor = self.make_executor([NOT_FOUND])
+        coordinates = executor._find_element_with_grid(make_frame(), "icon")
+
+        self.assertIsNone(coordinates)
+        self.assertEqual(len(self.client.sizes), 1)
+
+    @mock.patch.object(config, "GRID_COARSE_TO_FINE", False)
+    def test_lean_mode_requests_strict_schema(self):
+        """Test that the lean mode sends the compact prompt and schema"""
+        executor = self.make_executor([found(0)])
+
+        with mock.patch.object(config, "VISION_RESPONSE_MODE", "lean"):
+            executor._find_element_with_grid(make_frame(), "button")
+
+        request = self.client.requests[0]
+        self.assertEqual(request["response_format"], VISION_RESPONSE_FORMAT)
+        self.assertEqual(request["label"], "locate:lean")
+        self.assertNotIn("reasoning", request["prompt"])
+
+    @mock.patch.object(config, "GRID_COARSE_TO_FINE", False)
+    def test_verbose_mode_keeps_reasoning_prompt(self):
+        """Test that the verbose mode asks for descriptions and reasoning"""
+        executor = self.make_executor([found(0)])
+
+        with mock.patch.object(config, "VISION_RESPONSE_MODE", "verbose"):
+            coordinates = executor._find_element_with_grid(make_frame(), "button")
+
+        request = self.client.requests[0]
+        self.assertNotIn("response_format", request)
+        self.assertEqual(request["label"], "locate:verbose")
+        self.assertIn("reasoning", request["prompt"])
+        self.assertIsNotNone(coordinates)
+
+
+class TestAsyncClick(unittest.TestCase):
+    """Tests for the asyncio click path"""
+
+    @mock.patch.object(config, "GRID_COARSE_TO_FINE", True)
+    @mock.patch.object(config, "GRID_COARSE_MAX_SIZE", 960)
+    def test_lookups_awaited_on_the_running_loop(self):
+        """Test that both passes are awaited on the caller's loop, input on a thread"""
+        client = ScriptedVisionClient([found(17), found(0)])
+        capture = mock.Mock()
+        capture.capture_frame.return_value = make_frame()
+        capture.geometry.current.return_value = DisplayGeometry(1920, 1080, 1920, 1080)
+        executor = ActionExecutor(
+            screen_capture=capture,
+            grid_system=GridSystem(),
+            openai_client=client
+        )
+        clicked = []
+
+        def click_pattern(x, y, geometry=None):
+            clicked.append(((x, y), threading.current_thread()))
+            return True
+
+        async def run():
+            with mock.patch.object(executor, "_execute_multi_click_pattern", click_pattern):
+                success = await executor.execute_click_async("icon")
+            return success, asyncio.get_running_loop()
+
+        success, loop = asyncio.run(run())
+
+        fine_w = 360 // config.GRID_FINE_COLS
+        fine_h = 360 // config.GRID_FINE_ROWS
+        self.assertTrue(success)
+        self.assertEqual(client.aio.loops, [loop, loop])
+        self.assertEqual(client.sizes, [(960, 540), (360, 360)])
+        self.assertEqual(clicked[0][0], (round(fine_w / 2), round(fine_h / 2)))
+        self.assertIsNot(clicked[0][1], threading.main_thread())
+
+
+class TestLocationCacheLookup(unittest.TestCase):
+    """Tests for the persistent location cache in front of grid lookups"""
+
+    @mock.patch.object(config, "GRID_COARSE_TO_FINE", False)
+    def test_second_lookup_served_from_cache(self):
+        """Test that a repeated lookup on the same screen skips the model"""
+        client = ScriptedVisionClient([found(0)])
+        cache = LocationCache(":memory:")
+        executor = ActionExecutor(
+            screen_capture=mock.Mock(),
+            grid_system=GridSystem(),
+            openai_client=client,
+            location_cache=cache
+        )
+        frame = make_frame()
+
+        first = executor._find_element_with_grid(frame, "Send button")
+        second = executor._find_element_with_grid(frame, "send button")
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(client.sizes), 1)
+        self.assertEqual(executor._cached_location.cells[0]["cell_number"], 0)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+
+class TestBatchLocate(unittest.TestCase):
+    """Tests for locating several targets in one request"""
+
+    def make_executor(self, responses):
+        self.client = ScriptedVisionClient(responses)
+        self.capture = mock.Mock()
+        self.frame = make_frame()
+        self.capture.capture_frame.return_value = self.frame
+        return ActionExecutor(
+            screen_capture=self.capture,
+            grid_system=GridSystem(),
+            openai_client=self.client
+        )
+
+    def batch_response(self):
+        return json.dumps({"targets": [
+            {"target": 1, "found": True, "cells": [{"cell_number": 0, "coverage_percent": 100}]},
+            {"target": 2, "found": False, "reasoning": "not visible"},
+            {"target": 3, "found": True, "cells": [{"cell_number": 1, "coverage_percent": 100}]},
+        ]})
+
+    def test_locate_targets_one_request(self):
+        """Test that every target is answered from one image"""
+        executor = self.make_executor([self.batch_response()])
+        results = executor.locate_targets(["Reply", "Forward", "Delete"], self.frame)
+
+        cell_w = 1920 / config.GRID_COLS
+        cell_h = 1080 / config.GRID_ROWS
+        self.assertEqual(len(self.client.sizes), 1)
+        self.assertEqual(results["Reply"], (round(cell_w / 2), round(cell_h / 2)))
+        self.assertIsNone(results["Forward"])
+        self.assertEqual(results["Delete"], (round(cell_w * 1.5), round(cell_h / 2)))
+
+    def test_batched_location_reused_while_unchanged(self):
+        """Test that prefetched locations are used until their pixels change"""
+        executor = self.make_executor([self.batch_response()])
+        self.assertEqual(executor.prefetch_targets(["Reply", "Forward", "Delete"]), 2)
+
+        self.assertIsNotNone(executor._take_batched_location("Reply", self.frame))
+        self.assertIsNone(executor._take_batched_location("Forward", self.frame))
+
+        # Cell 1 (around "Delete") is repainted
+        pixels = self.frame.pixels.copy()
+        pixels[0:60, 60:120] = 0
+        self.assertIsNone(executor._take_batched_location("Delete", Frame(pixels)))
+        self.assertNotIn("Delete", executor._batch[1])
+
+    def test_batched_location_survives_changes_elsewhere(self):
+        """Test that a click changing another part of the screen keeps the batch"""
+        executor = self.make_executor([self.batch_response()])
+        executor.prefetch_targets(["Reply", "Forward", "Delete"])
+
+        # First click: "Reply" opens a compose pane on the right half
+        self.assertEqual(executor._take_batched_location("Reply", self.frame), (30, 30))
+        pixels = self.frame.pixels.copy()
+        pixels[200:900, 960:1900] = 255
+
+        # Second click: "Delete" is still served from the batch
+        self.assertEqual(executor._take_batched_location("Delete", Frame(pixels)), (90, 30))
+
+    def test_prefetch_failure_is_not_fatal(self):
+        """Test that a failed batch falls back to individual lookups"""
+        executor = self.make_executor(["not json"])
+
+        self.assertEqual(executor.prefetch_targets(["Reply", "Forward"]), 0)
+
+
+class TestClickVerification(unittest.TestCase):
+    """Tests for deciding whether a click changed the screen"""
+
+    def make_executor(self, capture):
+        return ActionExecutor(
+            screen_capture=capture,
+            grid_system=GridSystem(),
+            openai_client=ScriptedVisionClient([])
+        )
+
+    def test_after_click_capture_waits_for_slow_reaction(self):
+        """Test that a UI reacting 150ms after the click is seen as changed"""
+        changes_at = time.monotonic() + 0.15
+
+        def capture_region(*region):
+            value = 200 if time.monotonic() >= changes_at else 40
+            return Frame(np.full((64, 64, 4), value, dtype=np.uint8))
+
+        capture = mock.Mock()
+        capture.capture_region.side_effect = capture_region
+        executor = self.make_executor(capture)
+
+        with mock.patch.object(config, "SETTLE_ENABLED", True):
+            _, regions = executor._capture_for_verification([(0, 0, 64, 64)], wait=0.6)
+
+        self.assertEqual(regions[0].pixels[0, 0, 0], 200)
+
+    def test_pre_click_capture_grabs_only_the_regions(self):
+        """Test that the capture before a click grabs the regions alone"""
+        capture = mock.Mock()
+        capture.capture_region.side_effect = \
+            lambda *region: Frame(np.zeros((300, 300, 4), dtype=np.uint8))
+        executor = self.make_executor(capture)
+
+        before, regions = executor._capture_for_verification([(100, 200, 300, 300)])
+
+        self.assertIsNone(before)
+        self.assertEqual(len(regions), 1)
+        capture.capture_region.assert_called_once_with(100, 200, 300, 300)
+        capture.capture_frame.assert_not_called()
+
+    @mock.patch.object(config, "SETTLE_ENABLED", False)
+    @mock.patch.object(config, "CLICK_VERIFICATION_DELAY", 0.01)
+    @mock.patch.object(config, "CLICK_HOVER_DELAY", 0.0)
+    @mock.patch.object(config, "MOUSE_MOVE_DURATION", 0.0)
+    @mock.patch.object(config, "CLICK_VERIFICATION_DYNAMIC_REGIONS", [])
+    def test_conclusive_roi_click_moves_few_pixels(self):
+        """Test that a click confirmed by the ROI grabs the window, not the screen"""
+        monitor = {"left": 0, "top": 0, "width": 5120, "height": 2880}
+        clicked = []
+        grabs = []
+
+        def grab(region):
+            grabs.append((region["width"], region["height"]))
+            value = 200 if clicked else 40
+            shot = mock.Mock()
+            shot.size = (region["width"], region["height"])
+            shot.raw = bytes([value]) * (region["width"] * region["height"] * 4)
+            return shot
+
+        with mock.patch("src.screen_capture.mss.mss") as mss_factory:
+            sct = mss_factory.return_value
+            sct.monitors = [monitor, monitor]
+            sct.grab.side_effect = grab
+            session = CaptureSession()
+            executor = self.make_executor(ScreenCapture(session))
+
+            with mock.patch("src.actions.pyautogui.click", side_effect=lambda: clicked.append(1)):
+                success = executor._execute_multi_click_pattern(
+                    1280,
+                    720,
+                    geometry=DisplayGeometry(5120, 2880, 2560, 1440)
+                )
+
+        size = config.CLICK_VERIFICATION_ROI_SIZE
+        self.assertTrue(success)
+        self.assertEqual(len(clicked), 1)
+        # One full reference for the pattern, then the ROI before and after
+        self.assertEqual(session.grab_count, 3)
+        self.assertEqual(grabs, [(size, size), (5120, 2880), (size, size)])
+
+    def test_single_dirty_tile_is_noise(self):
+        """Test that a caret-sized change in the ROI is no change at all"""
+        capture = mock.Mock()
+        capture.detect_screen_change.side_effect = ScreenCapture.detect_screen_change
+        executor = self.make_executor(capture)
+
+        before = make_frame(300, 300)
+        pixels = before.pixels.copy()
+        pixels[0:8, 0:8] = 0
+        after = Frame(pixels)
+
+        self.assertFalse(executor._verify_regions_changed([before], [after], make_frame()))
+        capture.capture_frame.assert_not_called()
+
+    def test_fallback_compares_against_pre_click_frame(self):
+        """Test that an inconclusive ROI is settled against the pre-click frame"""
+        capture = mock.Mock()
+        capture.detect_screen_change.side_effect = ScreenCapture.detect_screen_change
+        executor = self.make_executor(capture)
+
+        roi_before = make_frame(300, 300)
+        pixels = roi_before.pixels.copy()
+        pixels[0:40, 0:40] = 0
+        roi_after = Frame(pixels)
+
+        frame_before = make_frame()
+        changed_elsewhere = frame_before.pixels.copy()
+        changed_elsewhere[:, :200] = 0
+
+        with mock.patch.object(config, "ROI_CHANGE_THRESHOLD", 50.0):
+            # Unchanged since just before the click: not a successful click
+            self.assertFalse(executor._verify_regions_changed(
+                [roi_before], [roi_after], frame_before, make_frame()
+            ))
+            self.assertTrue(executor._verify_regions_changed(
+                [roi_before], [roi_after], frame_before, Frame(changed_elsewhere)
+            ))
+
+
+if __name__ == "__main__":
+    unittest.main()
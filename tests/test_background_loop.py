@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for background loop module
+"""
+
+import asyncio
+import threading
+import unittest
+
+from src.background_loop import BackgroundLoop
+
+
+class TestBackgroundLoop(unittest.TestCase):
+    """Tests for BackgroundLoop"""
+
+    def setUp(self):
+        self.loop = BackgroundLoop(name="test-loop")
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_run_returns_result_from_loop_thread(self):
+        """Test that coroutines run on the loop thread"""
+        async def thread_name():
+            await asyncio.sleep(0)
+            return threading.current_thread().name
+
+        self.assertEqual(self.loop.run(thread_name()), "test-loop")
+
+    def test_run_propagates_exceptions(self):
+        """Test that exceptions reach the caller"""
+        async def fail():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            self.loop.run(fail())
+
+    def test_iterate_consumes_async_generator(self):
+        """Test that an async generator is consumed and closed on the loop"""
+        closed = []
+
+        async def numbers():
+            try:
+                for number in range(5):
+                    yield number
+            finally:
+                closed.append(True)
+
+        iterator = self.loop.iterate(numbers())
+        self.assertEqual([next(iterator), next(iterator)], [0, 1])
+        iterator.close()
+
+        self.assertEqual(closed, [True])
+        self.assertEqual(list(self.loop.iterate(numbers())), [0, 1, 2, 3, 4])
+
+    def test_run_from_loop_thread_is_rejected(self):
+        """Test that nested blocking calls fail instead of deadlocking"""
+        async def nested():
+            async def inner():
+                return 1
+            return self.loop.run(inner())
+
+        with self.assertRaises(RuntimeError):
+            self.loop.run(nested())
+
+    def test_restarts_after_close(self):
+        """Test that the loop starts again after close"""
+        async def answer():
+            return 42
+
+        self.loop.run(answer())
+        self.loop.close()
+
+        self.assertEqual(self.loop.run(answer()), 42)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for cache module
+"""
+
+import unittest
+
+import numpy as np
+from PIL import Image
+
+from src.cache import ByteLRUCache
+from src.frame import Frame, content_key
+from src.image_encoder import EncodeCache, PNGEncoder
+from src import screen_capture as screen_capture_module
+from src.screen_capture import ScreenCapture
+
+
+class TestByteLRUCache(unittest.TestCase):
+    """Tests for ByteLRUCache"""
+
+    def test_get_counts_hits_and_misses(self):
+        """Test hit/miss counters"""
+        cache = ByteLRUCache(100)
+        cache.put("a", b"1234")
+
+        self.assertEqual(cache.get("a"), b"1234")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hit_rate, 0.5)
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        """Test that the oldest unused entry is evicted when over the limit"""
+        cache = ByteLRUCache(10)
+        cache.put("a", b"aaaa")
+        cache.put("b", b"bbbb")
+        cache.get("a")
+        cache.put("c", b"cccc")
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(cache.bytes_held, 8)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_oversized_value_not_stored(self):
+        """Test that values larger than the cache are skipped"""
+        cache = ByteLRUCache(4)
+        cache.put("a", b"too large")
+
+        self.assertEqual(len(cache), 0)
+
+    def test_max_entries(self):
+        """Test the optional entry cap"""
+        cache = ByteLRUCache(1000, max_entries=2)
+        for key in "abc":
+            cache.put(key, b"x")
+
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn("a", cache)
+
+    def test_stats(self):
+        """Test stats snapshot"""
+        cache = ByteLRUCache(100)
+        cache.put("a", b"12")
+        stats = cache.stats()
+
+        self.assertEqual(stats["entries"], 1)
+        self.assertEqual(stats["bytes_held"], 2)
+        self.assertEqual(stats["max_bytes"], 100)
+
+
+class TestEncodeCache(unittest.TestCase):
+    """Tests for the encode cache in the ScreenCapture encode path"""
+
+    def setUp(self):
+        self.original = screen_capture_module.encode_cache
+        self.cache = EncodeCache(max_bytes=10 * 1024 * 1024)
+        screen_capture_module.encode_cache = self.cache
+
+    def tearDown(self):
+        screen_capture_module.encode_cache = self.original
+
+    def test_identical_content_hits(self):
+        """Test that re-encoding identical content is served from the cache"""
+        encoder = PNGEncoder(optimize=False)
+        first = ScreenCapture.encode_image(Image.new("RGB", (64, 64), "red"), encoder=encoder)
+        second = ScreenCapture.encode_image(Image.new("RGB", (64, 64), "red"), encoder=encoder)
+
+        self.assertIs(first, second)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_settings_change_misses(self):
+        """Test that different encoder settings are cached separately"""
+        img = Image.new("RGB", (64, 64), "red")
+        ScreenCapture.encode_image(img, encoder=PNGEncoder(optimize=False))
+        ScreenCapture.encode_image(img, encoder=PNGEncoder(optimize=True))
+
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_explicit_cache_key(self):
+        """Test that an explicit key skips hashing the image"""
+        encoder = PNGEncoder(optimize=False)
+        first = ScreenCapture.encode_image(
+            Image.new("RGB", (8, 8), "red"), encoder=encoder, cache_key="k"
+        )
+        second = ScreenCapture.encode_image(
+            Image.new("RGB", (8, 8), "blue"), encoder=encoder, cache_key="k"
+        )
+
+        self.assertIs(first, second)
+
+    def test_frame_content_key(self):
+        """Test that frames are keyed by their content hash"""
+        pixels = np.zeros((4, 4, 4), dtype=np.uint8)
+        frame = Frame(pixels)
+
+        self.assertEqual(content_key(frame), frame.hash)
+
+
+if __name__ == "__main__":
+    unittest.main()
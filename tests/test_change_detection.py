@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for change detection module
+"""
+
+import unittest
+
+import numpy as np
+from PIL import Image
+
+from src.change_detection import ChangeDetector
+from src.frame import Frame
+
+
+def make_frame(width=256, height=128, value=40):
+    """Builds a uniform BGRA frame"""
+    pixels = np.full((height, width, 4), value, dtype=np.uint8)
+    return Frame(pixels)
+
+
+def paint(frame, left, top, width, height, value=220):
+    """Returns a copy of frame with a filled rectangle"""
+    pixels = frame.pixels.copy()
+    pixels[top:top + height, left:left + width, :3] = value
+    return Frame(pixels)
+
+
+class TestChangeDetector(unittest.TestCase):
+    """Tests for ChangeDetector class"""
+
+    def setUp(self):
+        # 256x128 downscaled by 4 → 64x32 → 8x4 tiles of 8px
+        self.detector = ChangeDetector(downscale=4, tile_size=8, pixel_delta=24)
+
+    def test_identical_frames(self):
+        """Test that identical frames report no change"""
+        frame = make_frame()
+        result = self.detector.compare(frame, make_frame(), threshold=0)
+
+        self.assertFalse(result)
+        self.assertEqual(result.dirty_tiles.shape, (4, 8))
+        self.assertEqual(result.dirty_count, 0)
+        self.assertTrue(result.complete)
+
+    def test_dirty_tile_map(self):
+        """Test that a local change marks only its tile"""
+        before = make_frame()
+        after = paint(before, 40, 40, 16, 16)
+        result = self.detector.compare(before, after, threshold=50)
+
+        self.assertFalse(result)
+        self.assertEqual(result.dirty_count, 1)
+        self.assertTrue(result.dirty_tiles[1, 1])
+
+    def test_small_change_below_threshold(self):
+        """Test that subtle pixel noise is ignored"""
+        before = make_frame()
+        after = paint(before, 0, 0, 256, 128, value=50)
+
+        self.assertFalse(self.detector.compare(before, after, threshold=0))
+
+    def test_early_exit(self):
+        """Test that detection stops once the threshold is crossed"""
+        before = make_frame()
+        after = paint(before, 0, 0, 256, 128)
+        result = self.detector.compare(before, after, threshold=10)
+
+        self.assertTrue(result)
+        self.assertFalse(result.complete)
+        self.assertTrue(result.dirty_tiles[0].all())
+        self.assertFalse(result.dirty_tiles[-1].any())
+
+    def test_accepts_pil_images(self):
+        """Test that PIL images are compared like frames"""
+        before = Image.new("RGB", (256, 128), (40, 40, 40))
+        after = Image.new("RGB", (256, 128), (220, 220, 220))
+
+        self.assertTrue(self.detector.compare(before, after))
+
+    def test_size_mismatch_is_change(self):
+        """Test that differently sized captures count as changed"""
+        result = self.detector.compare(make_frame(), make_frame(128, 128))
+
+        self.assertTrue(result)
+        self.assertEqual(result.changed_percentage, 100.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
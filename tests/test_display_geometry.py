@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for display geometry module
+"""
+
+import unittest
+from collections import namedtuple
+from unittest import mock
+
+from src.display_geometry import (
+    CoordinateTransform,
+    DisplayGeometry,
+    DisplayGeometryService
+)
+from src.exceptions import ScreenCaptureError
+
+
+Size = namedtuple("Size", "width height")
+
+
+class TestDisplayGeometry(unittest.TestCase):
+    """Tests for DisplayGeometry class"""
+
+    def test_retina_transform(self):
+        """Test conversion on a 2x display"""
+        geometry = DisplayGeometry(2880, 1800, 1440, 900)
+
+        self.assertEqual(geometry.scale, (2.0, 2.0))
+        self.assertEqual(geometry.to_logical(1000, 500), (500, 250))
+        self.assertEqual(geometry.to_physical(500, 250), (1000, 500))
+
+    def test_offset_monitor(self):
+        """Test that monitor offsets are applied both ways"""
+        geometry = DisplayGeometry(1920, 1080, 1920, 1080, 1920, 0)
+
+        self.assertEqual(geometry.to_logical(10, 20), (1930, 20))
+        self.assertEqual(geometry.to_physical(1930, 20), (10, 20))
+
+
+class TestCoordinateTransform(unittest.TestCase):
+    """Tests for CoordinateTransform class"""
+
+    def test_downscaled_crop_maps_to_logical(self):
+        """Test a crop at (1000, 400) downscaled 2x on a retina display"""
+        geometry = DisplayGeometry(2880, 1800, 1440, 900)
+        transform = CoordinateTransform(geometry).region(1000, 400, 2.0)
+
+        self.assertEqual(transform.to_physical(10.5, 20.25), (1021.0, 440.5))
+        self.assertEqual(transform.to_logical(10.5, 20.25), (510, 220))
+
+    def test_nested_regions_compose(self):
+        """Test that a region of a region accumulates scale and offset"""
+        outer = CoordinateTransform().region(0, 0, 1.28)
+        inner = outer.region(100, 50, 0.5)
+
+        self.assertAlmostEqual(inner.to_physical(10, 10)[0], (100 + 5) * 1.28)
+        self.assertAlmostEqual(inner.to_physical(10, 10)[1], (50 + 5) * 1.28)
+
+    def test_box_to_physical(self):
+        """Test box conversion"""
+        transform = CoordinateTransform(scale_x=2.0, scale_y=2.0, offset_x=10)
+
+        self.assertEqual(transform.box_to_physical((0, 0, 5, 5)), (10, 0, 20, 10))
+
+    def test_logical_requires_geometry(self):
+        """Test that a geometry-less transform only maps to physical"""
+        with self.assertRaises(ScreenCaptureError):
+            CoordinateTransform().to_logical(1, 1)
+
+
+class TestDisplayGeometryService(unittest.TestCase):
+    """Tests for DisplayGeometryService class"""
+
+    def setUp(self):
+        self.session = mock.Mock()
+        self.session.monitor = {"left": 0, "top": 0, "width": 2880, "height": 1800}
+
+        patcher = mock.patch("src.display_geometry.pyautogui.size")
+        self.size = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.size.return_value = Size(1440, 900)
+
+    def make_service(self, probe_interval=0.0):
+        return DisplayGeometryService(
+            self.session,
+            probe_interval=probe_interval,
+            watch_randr=False
+        )
+
+    def test_computed_once(self):
+        """Test that geometry is cached while the layout is unchanged"""
+        service = self.make_service()
+        first = service.current()
+        for _ in range(10):
+            self.assertIs(service.current(), first)
+
+        self.assertEqual(service.computations, 1)
+        self.session.refresh.assert_not_called()
+
+    def test_probe_interval_limits_size_queries(self):
+        """Test that size probes are rate limited"""
+        service = self.make_service(probe_interval=60.0)
+        for _ in range(10):
+            service.current()
+
+        self.assertEqual(self.size.call_count, 1)
+
+    def test_change_recomputes_and_notifies(self):
+        """Test that a layout change invalidates the cache and notifies"""
+        service = self.make_service()
+        listener = mock.Mock()
+        service.add_listener(listener)
+        service.current()
+
+        self.session.monitor = {"left": 0, "top": 0, "width": 1920, "height": 1080}
+        self.size.return_value = Size(1920, 1080)
+        geometry = service.current()
+
+        self.assertEqual(geometry.scale, (1.0, 1.0))
+        self.session.refresh.assert_called_once()
+        listener.assert_called_once_with(geometry)
+
+    def test_randr_subscribed_before_first_snapshot(self):
+        """Test that a change right after the first compute is not missed"""
+        with mock.patch("src.display_geometry._RandRWatcher") as watcher_factory:
+            subscribed = []
+            self.size.side_effect = lambda: (
+                subscribed.append(watcher_factory.called) or Size(1440, 900)
+            )
+            service = DisplayGeometryService(self.session, watch_randr=True)
+
+            service.current()
+            self.assertEqual(subscribed, [True])
+
+            # The layout changes before the second call
+            watcher_factory.return_value.changed.return_value = True
+            self.session.monitor = {"left": 0, "top": 0, "width": 1920, "height": 1080}
+            self.size.side_effect = None
+            self.size.return_value = Size(1920, 1080)
+
+            self.assertEqual(service.current().scale, (1.0, 1.0))
+            watcher_factory.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
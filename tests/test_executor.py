@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for executor module
+"""
+
+import asyncio
+import time
+import unittest
+from unittest import mock
+
+from src.config import config
+from src.executor import PlanExecutor
+from src.planner import ActionPlan
+
+
+def click(target):
+    return {"action": "click", "target": target}
+
+
+class TestClickPrefetch(unittest.TestCase):
+    """Tests for batching consecutive click targets"""
+
+    def run_plan(self, steps):
+        action_executor = mock.Mock()
+        action_executor.execute_click.return_value = True
+        action_executor.execute_type.return_value = True
+        executor = PlanExecutor(action_executor)
+        executor.execute_plan(ActionPlan(steps))
+        return action_executor
+
+    @mock.patch.object(config, "BATCH_LOCATE_ENABLED", True)
+    def test_consecutive_clicks_prefetched_once(self):
+        """Test that a run of clicks is located in one batch"""
+        action_executor = self.run_plan([
+            click("Select all"),
+            click("Archive"),
+            {"action": "type", "text": "hello"},
+            click("Send"),
+        ])
+
+        action_executor.prefetch_targets.assert_called_once_with(
+            ["Select all", "Archive"]
+        )
+        self.assertEqual(action_executor.execute_click.call_count, 3)
+
+    @mock.patch.object(config, "BATCH_LOCATE_ENABLED", False)
+    def test_disabled(self):
+        """Test that batching can be turned off"""
+        action_executor = self.run_plan([click("A"), click("B")])
+
+        action_executor.prefetch_targets.assert_not_called()
+
+
+class TestExecutePlanAsync(unittest.TestCase):
+    """Tests for the asyncio execution path"""
+
+    def test_runs_steps_off_the_loop(self):
+        """Test that input runs on worker threads and other tasks keep running"""
+        action_executor = mock.Mock()
+        action_executor.execute_click_async = mock.AsyncMock(return_value=True)
+        ticks = []
+
+        def slow_type(text, **kwargs):
+            time.sleep(0.05)
+            return True
+
+        action_executor.execute_type.side_effect = slow_type
+        executor = PlanExecutor(action_executor)
+
+        async def run():
+            async def ticker():
+                while True:
+                    ticks.append(1)
+                    await asyncio.sleep(0.005)
+
+            task = asyncio.create_task(ticker())
+            try:
+                return await executor.execute_plan_async(
+                    ActionPlan([click("OK"), {"action": "type", "text": "hi"}])
+                )
+            finally:
+                task.cancel()
+
+        with mock.patch.object(config, "BATCH_LOCATE_ENABLED", False):
+            self.assertTrue(asyncio.run(run()))
+
+        action_executor.execute_click_async.assert_awaited_once_with("OK", None)
+        action_executor.execute_click.assert_not_called()
+        self.assertEqual(executor.successful_steps, 2)
+        self.assertGreater(len(ticks), 1)
+
+    @mock.patch.object(config, "BATCH_LOCATE_ENABLED", True)
+    def test_prefetch_overlaps_wait(self):
+        """Test that the click run after a wait is located during the wait"""
+        action_executor = mock.Mock()
+        action_executor.execute_click_async = mock.AsyncMock(return_value=True)
+        events = []
+
+        async def prefetch(targets):
+            events.append(("prefetch", targets))
+            await asyncio.sleep(0.05)
+            events.append(("prefetched", targets))
+            return len(targets)
+
+        def wait(seconds):
+            events.append(("wait", seconds))
+            time.sleep(seconds)
+            events.append(("waited", seconds))
+            return True
+
+        action_executor.prefetch_targets_async = mock.AsyncMock(side_effect=prefetch)
+        action_executor.execute_wait.side_effect = wait
+        executor = PlanExecutor(action_executor)
+
+        plan = ActionPlan([
+            click("Compose"),
+            {"action": "wait", "seconds": 0.2},
+            click("To"),
+            click("Subject"),
+        ])
+        self.assertTrue(asyncio.run(executor.execute_plan_async(plan)))
+
+        self.assertEqual(action_executor.prefetch_targets_async.await_count, 1)
+        self.assertLess(
+            events.index(("prefetched", ["To", "Subject"])),
+            events.index(("waited", 0.2))
+        )
+        self.assertEqual(action_executor.execute_click_async.await_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
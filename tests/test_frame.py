@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for frame module
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+from PIL import Image
+
+from src.frame import Frame, as_image
+
+
+def make_screenshot(width, height, bgra=(10, 20, 30, 255)):
+    """Builds an mss-like ScreenShot filled with one BGRA color"""
+    shot = mock.Mock()
+    shot.size = (width, height)
+    shot.raw = bytearray(bytes(bgra) * (width * height))
+    return shot
+
+
+class TestFrame(unittest.TestCase):
+    """Tests for Frame class"""
+
+    def test_wraps_buffer_without_copy(self):
+        """Test that the pixel array shares memory with the grab buffer"""
+        shot = make_screenshot(8, 4)
+        frame = Frame.from_screenshot(shot)
+
+        self.assertEqual(frame.size, (8, 4))
+        self.assertTrue(np.shares_memory(frame.pixels, np.frombuffer(shot.raw, np.uint8)))
+        self.assertFalse(frame.pixels.flags.writeable)
+
+    def test_image_is_rgb_and_memoized(self):
+        """Test BGRA to RGB conversion and memoization"""
+        frame = Frame.from_screenshot(make_screenshot(8, 4))
+
+        img = frame.image
+        self.assertEqual(img.mode, "RGB")
+        self.assertEqual(img.getpixel((0, 0)), (30, 20, 10))
+        self.assertIs(frame.image, img)
+
+    def test_gray_and_downscaled(self):
+        """Test grayscale and downscaled views"""
+        frame = Frame.from_screenshot(make_screenshot(8, 4))
+
+        self.assertEqual(frame.gray().shape, (4, 8))
+        self.assertEqual(frame.gray(2).shape, (2, 4))
+        self.assertEqual(frame.downscaled(2).size, (4, 2))
+        self.assertIs(frame.gray(2), frame.gray(2))
+
+    def test_hash_tracks_content(self):
+        """Test that identical content hashes equal and changes differ"""
+        a = Frame.from_screenshot(make_screenshot(8, 4))
+        b = Frame.from_screenshot(make_screenshot(8, 4))
+        c = Frame.from_screenshot(make_screenshot(8, 4, (0, 0, 0, 255)))
+
+        self.assertEqual(a.hash, b.hash)
+        self.assertNotEqual(a.hash, c.hash)
+
+    def test_crop_is_positioned_view(self):
+        """Test that crops keep their monitor position and are clipped"""
+        frame = Frame.from_screenshot(make_screenshot(8, 4), left=100, top=50)
+        crop = frame.crop(6, 1, 10, 10)
+
+        self.assertEqual(crop.size, (2, 3))
+        self.assertEqual((crop.left, crop.top), (106, 51))
+        self.assertEqual(crop.image.getpixel((0, 0)), (30, 20, 10))
+
+    def test_from_image_round_trip(self):
+        """Test that PIL images can be wrapped as frames"""
+        img = Image.new("RGB", (5, 3), (1, 2, 3))
+        frame = Frame.from_image(img)
+
+        self.assertEqual(frame.size, (5, 3))
+        self.assertEqual(frame.pixels[0, 0].tolist(), [3, 2, 1, 255])
+        self.assertIs(as_image(frame), img)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for frame producer module
+"""
+
+import time
+import unittest
+
+import numpy as np
+
+from src.frame import Frame
+from src.frame_producer import FrameProducer
+
+
+class FakeScreenCapture:
+    """Produces small frames without touching the display"""
+
+    def __init__(self):
+        self.grabs = 0
+
+    def capture_frame(self):
+        self.grabs += 1
+        return Frame(np.zeros((4, 4, 4), dtype=np.uint8))
+
+
+class TestFrameProducer(unittest.TestCase):
+    """Tests for FrameProducer class"""
+
+    def setUp(self):
+        self.capture = FakeScreenCapture()
+        self.producer = FrameProducer(self.capture, fps=200, ring_size=3)
+        self.addCleanup(self.producer.stop)
+
+    def test_latest_before_start(self):
+        """Test that latest is None until a frame is captured"""
+        self.assertIsNone(self.producer.latest())
+        self.assertFalse(self.producer.running)
+
+    def test_frame_after_timestamp(self):
+        """Test waiting for a frame newer than a timestamp"""
+        self.producer.start()
+        mark = time.monotonic()
+        frame = self.producer.frame_after(mark, timeout=1.0)
+
+        self.assertGreaterEqual(frame.timestamp, mark)
+        self.assertIsNotNone(self.producer.latest())
+
+    def test_ring_is_bounded(self):
+        """Test that the ring never holds more than ring_size frames"""
+        self.producer.start()
+        self.producer.frame_after(time.monotonic() + 0.05, timeout=1.0)
+
+        self.assertGreater(self.producer.frames_captured, 3)
+        self.assertLessEqual(len(self.producer._ring), 3)
+
+    def test_falls_back_to_direct_grab(self):
+        """Test that a stopped producer grabs directly instead of blocking"""
+        frame = self.producer.frame_after(time.monotonic(), timeout=0.01)
+
+        self.assertIsInstance(frame, Frame)
+        self.assertEqual(self.capture.grabs, 1)
+
+    def test_stop(self):
+        """Test that stop ends the thread and clears the ring"""
+        self.producer.start()
+        self.producer.frame_after(time.monotonic(), timeout=1.0)
+        self.producer.stop()
+
+        self.assertFalse(self.producer.running)
+        self.assertIsNone(self.producer.latest())
+
+
+if __name__ == "__main__":
+    unittest.main()
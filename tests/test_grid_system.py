@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for grid system module
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+from PIL import Image
+
+from src.config import config
+from src.frame import Frame
+from src.exceptions import GridSystemError
+from src.grid_system import (
+    GridCache,
+    GridLayout,
+    GridSystem,
+    get_grid_overlay,
+    infer_size_hint,
+    overlay_cache
+)
+
+
+def make_image(width=640, height=360, seed=0):
+    """Builds a noisy RGB image"""
+    rng = np.random.default_rng(seed)
+    pixels = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+    return Image.fromarray(pixels, "RGB")
+
+
+class TestGridOverlay(unittest.TestCase):
+    """Tests for the cached grid overlay"""
+
+    def setUp(self):
+        overlay_cache.clear()
+
+    def test_overlay_rendered_once_per_size(self):
+        """Test that frames of the same size share one overlay"""
+        first = get_grid_overlay(640, 360, config.GRID_COLS, config.GRID_ROWS)
+        second = get_grid_overlay(640, 360, config.GRID_COLS, config.GRID_ROWS)
+        other = get_grid_overlay(320, 180, config.GRID_COLS, config.GRID_ROWS)
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(first.mode, "RGBA")
+
+    def test_overlay_is_transparent_inside_cells(self):
+        """Test that only lines and labels are opaque"""
+        overlay = get_grid_overlay(640, 360, config.GRID_COLS, config.GRID_ROWS)
+        alpha = np.asarray(overlay)[..., 3]
+
+        self.assertEqual(alpha[0, 0], 255)
+        self.assertEqual(alpha[1, 1], 0)
+
+    def test_render_grid_composites_overlay(self):
+        """Test that lines are drawn and the rest of the frame is preserved"""
+        img = make_image()
+        grid_img, cell_w, cell_h = GridSystem().render_grid(img)
+
+        self.assertEqual((cell_w, cell_h), (640 // config.GRID_COLS, 360 // config.GRID_ROWS))
+        self.assertEqual(grid_img.size, img.size)
+        self.assertEqual(grid_img.getpixel((cell_w, 1)), (255, 0, 0))
+        self.assertEqual(grid_img.getpixel((1, 1)), img.getpixel((1, 1)))
+
+    def test_render_grid_does_not_modify_source(self):
+        """Test that the source image is left untouched"""
+        img = make_image()
+        before = img.tobytes()
+        GridSystem().render_grid(img)
+
+        self.assertEqual(img.tobytes(), before)
+
+
+class TestGridCache(unittest.TestCase):
+    """Tests for the gridded image cache"""
+
+    def test_repeat_render_hits_cache(self):
+        """Test that identical content is served from the cache"""
+        grid_system = GridSystem()
+        first = grid_system.render_grid(make_image())
+        second = grid_system.render_grid(make_image())
+
+        self.assertIs(first[0], second[0])
+        stats = grid_system.cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["bytes_held"], 640 * 360 * 3)
+
+    def test_keeps_multiple_entries(self):
+        """Test that alternating screens both stay cached"""
+        grid_system = GridSystem()
+        for seed in (0, 1, 0, 1):
+            grid_system.render_grid(make_image(seed=seed))
+
+        self.assertEqual(grid_system.cache.hits, 2)
+        self.assertEqual(len(grid_system.cache), 2)
+
+    def test_evicts_by_bytes(self):
+        """Test that the cache stays within its byte limit"""
+        grid_system = GridSystem()
+        grid_system.cache = GridCache(max_bytes=640 * 360 * 3)
+        for seed in range(3):
+            grid_system.render_grid(make_image(seed=seed))
+
+        self.assertEqual(len(grid_system.cache), 1)
+        self.assertEqual(grid_system.cache.evictions, 2)
+
+    def test_frame_key_uses_memoized_hash(self):
+        """Test that frames are keyed by their capture hash"""
+        pixels = np.zeros((360, 640, 4), dtype=np.uint8)
+        frame = Frame(pixels)
+        grid_system = GridSystem()
+        grid_system.render_grid(frame)
+
+        key = f"{frame.hash}:{config.GRID_COLS}x{config.GRID_ROWS}"
+        self.assertIn(key, grid_system.cache)
+
+
+class TestGridLayout(unittest.TestCase):
+    """Tests for exact grid layouts"""
+
+    def test_edges_cover_whole_image(self):
+        """Test that uneven sizes leave no uncovered strip at the edges"""
+        layout = GridLayout(1000, 700, 32, 18)
+
+        self.assertEqual(layout.cell_box(0)[:2], (0, 0))
+        self.assertEqual(layout.cell_box(layout.num_cells - 1)[2:], (1000, 700))
+
+    def test_last_cell_center_does_not_drift(self):
+        """Test that the bottom-right center is exact"""
+        layout = GridLayout(1000, 700, 32, 18)
+        x, y = layout.cell_center(layout.num_cells - 1)
+
+        self.assertAlmostEqual(x, 1000 - 1000 / 64)
+        self.assertAlmostEqual(y, 700 - 700 / 36)
+
+    def test_cells_bounds(self):
+        """Test the bounding box of several cells"""
+        layout = GridLayout(400, 200, 4, 2)
+        bounds = layout.cells_bounds([{"cell_number": 1}, {"cell_number": 6}])
+
+        self.assertEqual(bounds, (100, 0, 300, 200))
+
+    def test_out_of_range_cell(self):
+        """Test that unknown cell numbers are rejected"""
+        with self.assertRaises(GridSystemError):
+            GridLayout(400, 200, 4, 2).cell_center(8)
+
+    def test_coordinates_use_layout(self):
+        """Test that coordinates are computed from the exact layout"""
+        layout = GridLayout(1000, 700, 32, 18)
+        cells = [{"cell_number": layout.num_cells - 1, "coverage_percent": 100}]
+        x, y = GridSystem().calculate_coordinates_from_cells(cells, layout=layout)
+
+        self.assertEqual((x, y), (984, 680))
+
+
+class TestAdaptiveLayout(unittest.TestCase):
+    """Tests for per-frame grid density"""
+
+    def test_fixed_grid_when_disabled(self):
+        """Test that the configured grid is used by default"""
+        with mock.patch.object(config, "GRID_ADAPTIVE", False):
+            layout = GridSystem().choose_layout(5120, 2880, "small")
+
+        self.assertEqual((layout.cols, layout.rows), (config.GRID_COLS, config.GRID_ROWS))
+
+    @mock.patch.object(config, "GRID_ADAPTIVE", True)
+    def test_density_follows_target_size(self):
+        """Test that small targets get a denser grid than large ones"""
+        grid_system = GridSystem()
+        small = grid_system.choose_layout(1920, 1080, "small")
+        medium = grid_system.choose_layout(1920, 1080)
+        large = grid_system.choose_layout(1920, 1080, "large")
+
+        self.assertGreater(small.num_cells, medium.num_cells)
+        self.assertGreater(medium.num_cells, large.num_cells)
+
+    @mock.patch.object(config, "GRID_ADAPTIVE", True)
+    def test_density_uses_effective_resolution(self):
+        """Test that a 5K screen sent at MAX_IMAGE_SIZE gets the same grid"""
+        grid_system = GridSystem()
+        with mock.patch.object(config, "MAX_IMAGE_SIZE", 1280):
+            hd = grid_system.choose_layout(1280, 720)
+            five_k = grid_system.choose_layout(5120, 2880)
+
+        self.assertEqual((hd.cols, hd.rows), (five_k.cols, five_k.rows))
+
+    @mock.patch.object(config, "GRID_ADAPTIVE", True)
+    def test_render_layout_records_layout(self):
+        """Test that the rendered grid comes with its layout"""
+        grid_img, layout = GridSystem().render_layout(make_image(), size_hint="large")
+
+        self.assertEqual(layout.key[:2], grid_img.size)
+        self.assertGreaterEqual(layout.cols, config.GRID_MIN_COLS)
+
+    def test_infer_size_hint(self):
+        """Test keyword-based size hints"""
+        self.assertEqual(infer_size_hint("Settings gear icon"), "small")
+        self.assertEqual(infer_size_hint("Search input field"), "large")
+        self.assertIsNone(infer_size_hint("Submit button"))
+
+    def test_infer_size_hint_spanish_targets(self):
+        """Test the Spanish descriptions the planner writes"""
+        self.assertEqual(infer_size_hint("ícono de lupa"), "small")
+        self.assertEqual(infer_size_hint("icono de configuración"), "small")
+        self.assertEqual(infer_size_hint("casilla para aceptar términos"), "small")
+        self.assertEqual(infer_size_hint("botón para cerrar la ventana"), "small")
+        self.assertEqual(infer_size_hint("campo de texto para destinatario"), "large")
+        self.assertEqual(infer_size_hint("barra de búsqueda"), "large")
+        self.assertEqual(infer_size_hint("panel lateral"), "large")
+        self.assertIsNone(infer_size_hint("botón para redactar email"))
+
+    def test_infer_size_hint_whole_words(self):
+        """Test that keywords inside other words don't match"""
+        self.assertEqual(infer_size_hint("narrow side panel"), "large")
+        self.assertIsNone(infer_size_hint("closed tickets tab"))
+        self.assertIsNone(infer_size_hint("LinkedIn logo"))
+        self.assertEqual(infer_size_hint("Notification icons"), "small")
+        self.assertEqual(infer_size_hint("Check  boxes"), "small")
+
+
+if __name__ == "__main__":
+    unittest.main()
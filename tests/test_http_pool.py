@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for HTTP pool module
+"""
+
+import asyncio
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from src.config import config
+from src.http_pool import ConnectionTrace, create_http_client
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answers every request over a persistent HTTP/1.1 connection"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestConnectionTrace(unittest.TestCase):
+    """Tests for connection reuse tracing"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}/"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def fetch(self, trace, count):
+        async def run():
+            async with create_http_client(trace) as client:
+                for _ in range(count):
+                    response = await client.get(self.url)
+                    self.assertEqual(response.text, "ok")
+
+        asyncio.run(run())
+
+    def test_connection_reused(self):
+        """Test that sequential requests share one pooled connection"""
+        trace = ConnectionTrace()
+        self.fetch(trace, 3)
+
+        stats = trace.stats()
+        self.assertEqual(stats["requests"], 3)
+        self.assertEqual(stats["connections"], 1)
+        self.assertEqual(stats["tls_handshakes"], 0)
+        self.assertEqual(stats["reused"], 2)
+        self.assertEqual(stats["http_versions"], {"HTTP/1.1": 3})
+
+    @mock.patch.object(config, "HTTP_MAX_KEEPALIVE_CONNECTIONS", 0)
+    def test_no_keepalive_opens_a_connection_per_request(self):
+        """Test that handshakes are counted when connections aren't kept"""
+        trace = ConnectionTrace()
+        self.fetch(trace, 2)
+
+        self.assertEqual(trace.stats()["connections"], 2)
+        self.assertEqual(trace.stats()["reuse_rate"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
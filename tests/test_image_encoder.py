@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for image encoder module
+"""
+
+import base64
+import io
+import unittest
+
+import numpy as np
+from PIL import Image
+
+from src.exceptions import ScreenCaptureError
+from src.image_encoder import (
+    ByteBudgetEncoder,
+    ImageEncoder,
+    JPEGEncoder,
+    PNGEncoder,
+    WebPEncoder,
+    create_encoder
+)
+
+
+def make_image(width=800, height=600):
+    """Builds a noisy RGB image that does not compress trivially"""
+    rng = np.random.default_rng(0)
+    pixels = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+    return Image.fromarray(pixels, "RGB")
+
+
+class TestEncoders(unittest.TestCase):
+    """Tests for format encoders"""
+
+    def test_png_round_trip(self):
+        """Test that PNG output decodes to the same size"""
+        encoded = PNGEncoder(optimize=False).encode(make_image(64, 32))
+
+        self.assertEqual(encoded.mime_type, "image/png")
+        decoded = Image.open(io.BytesIO(encoded.data))
+        self.assertEqual(decoded.size, (64, 32))
+
+    def test_lossy_formats(self):
+        """Test JPEG and WebP encoders report their quality"""
+        for encoder, mime in (
+            (JPEGEncoder(quality=70), "image/jpeg"),
+            (WebPEncoder(quality=70), "image/webp"),
+        ):
+            encoded = encoder.encode(make_image(64, 32))
+            self.assertEqual(encoded.mime_type, mime)
+            self.assertEqual(encoded.quality, 70)
+            self.assertTrue(encoded.data_url.startswith(f"data:{mime};base64,"))
+            self.assertEqual(base64.b64decode(encoded.base64), encoded.data)
+
+    def test_resizes_to_max_size(self):
+        """Test that images are fitted to the maximum size"""
+        encoded = JPEGEncoder(max_size=400).encode(make_image(800, 600))
+
+        self.assertEqual(encoded.size, (400, 300))
+
+    def test_reports_encode_time(self):
+        """Test that encode time is recorded"""
+        encoded = JPEGEncoder().encode(make_image(64, 32))
+
+        self.assertGreaterEqual(encoded.encode_seconds, 0)
+
+    def test_unknown_format(self):
+        """Test that unknown formats are rejected"""
+        with self.assertRaises(ScreenCaptureError):
+            create_encoder(format="bmp")
+
+    def test_base_encoder_is_abstract(self):
+        """Test that the base class can't be used as an encoder"""
+        with self.assertRaises(TypeError):
+            ImageEncoder()
+
+
+class TestByteBudgetEncoder(unittest.TestCase):
+    """Tests for ByteBudgetEncoder class"""
+
+    def test_lowers_quality_to_fit(self):
+        """Test that quality is reduced until the payload fits"""
+        img = make_image(400, 300)
+        full = JPEGEncoder(quality=90).encode(img)
+        budget = full.nbytes // 2
+
+        encoded = ByteBudgetEncoder(
+            JPEGEncoder(quality=90), budget, min_quality=5
+        ).encode(img)
+
+        self.assertLessEqual(encoded.nbytes, budget)
+        self.assertLess(encoded.quality, 90)
+        self.assertEqual(encoded.size, (400, 300))
+
+    def test_scales_down_when_quality_is_not_enough(self):
+        """Test that resolution is reduced when min quality still exceeds budget"""
+        img = make_image(1200, 900)
+        minimum = JPEGEncoder(quality=60).encode(img)
+
+        encoded = ByteBudgetEncoder(
+            JPEGEncoder(quality=90), minimum.nbytes // 2, min_quality=60
+        ).encode(img)
+
+        self.assertLessEqual(encoded.nbytes, minimum.nbytes // 2)
+        self.assertLess(encoded.size[0], 1200)
+
+    def test_keeps_quality_when_within_budget(self):
+        """Test that the base quality is used when it already fits"""
+        encoded = ByteBudgetEncoder(
+            JPEGEncoder(quality=80), 10 * 1024 * 1024
+        ).encode(make_image(64, 32))
+
+        self.assertEqual(encoded.quality, 80)
+
+    def test_factory_wraps_budget(self):
+        """Test that create_encoder applies the byte budget"""
+        encoder = create_encoder(format="webp", quality=80, byte_budget=50000)
+
+        self.assertIsInstance(encoder, ByteBudgetEncoder)
+        self.assertEqual(encoder.format, "webp")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for JSON stream module
+"""
+
+import json
+import unittest
+
+from src.grid_system import GridSystem
+from src.json_stream import IncrementalJSONParser
+
+
+RESPONSE = {
+    "description": "An inbox with a {braced} \"quoted\" subject",
+    "found": True,
+    "cells": [
+        {"cell_number": 12, "coverage_percent": 70, "description": "center"},
+        {"cell_number": 13, "coverage_percent": 30, "description": "edge"}
+    ],
+    "primary_cell": 12,
+    "confidence": "high",
+    "reasoning": "The button is in cells 12 and 13"
+}
+
+
+def chunked(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class TestIncrementalJSONParser(unittest.TestCase):
+    """Tests for IncrementalJSONParser class"""
+
+    def test_fields_complete_in_order(self):
+        """Test that fields appear as soon as their values close"""
+        parser = IncrementalJSONParser()
+        completed = []
+        for chunk in chunked(json.dumps(RESPONSE, indent=2), 5):
+            completed.extend(parser.feed(chunk))
+
+        self.assertEqual(completed, list(RESPONSE))
+        self.assertEqual(parser.fields, RESPONSE)
+        self.assertTrue(parser.complete)
+
+    def test_cells_available_before_reasoning(self):
+        """Test that cells can be read while later fields are pending"""
+        text = json.dumps(RESPONSE)
+        cut = text.index('"primary_cell"')
+        parser = IncrementalJSONParser()
+        parser.feed(text[:cut])
+
+        self.assertTrue(parser.get("found"))
+        self.assertEqual(parser.get("cells"), RESPONSE["cells"])
+        self.assertNotIn("reasoning", parser)
+
+    def test_scalar_waits_for_delimiter(self):
+        """Test that a number is not recorded until it is terminated"""
+        parser = IncrementalJSONParser()
+        parser.feed('{"primary_cell": 1')
+        self.assertNotIn("primary_cell", parser)
+
+        parser.feed('27}')
+        self.assertEqual(parser.get("primary_cell"), 127)
+
+    def test_skips_prefix_text(self):
+        """Test that prose and code fences before the object are ignored"""
+        parser = IncrementalJSONParser()
+        parser.feed('Here you go:\n```json\n{"found": false, "reasoning": "none"}\n```')
+
+        self.assertEqual(parser.fields, {"found": False, "reasoning": "none"})
+
+
+class ClosableStream:
+    """Iterator over chunks that records how far it was consumed"""
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+        self.consumed = 0
+        self.closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.consumed >= len(self.chunks):
+            raise StopIteration
+        self.consumed += 1
+        return self.chunks[self.consumed - 1]
+
+    def close(self):
+        self.closed = True
+
+
+class TestParseVisionStream(unittest.TestCase):
+    """Tests for GridSystem.parse_vision_stream"""
+
+    def test_stops_before_the_reasoning(self):
+        """Test that the stream is closed before the reasoning is read"""
+        stream = ClosableStream(chunked(json.dumps(RESPONSE), 10))
+        parsed = GridSystem().parse_vision_stream(stream)
+
+        self.assertEqual(parsed["cells"], RESPONSE["cells"])
+        self.assertEqual(parsed["confidence"], "high")
+        self.assertTrue(stream.closed)
+        self.assertLess(stream.consumed, len(stream.chunks))
+
+    def test_lean_answer_keeps_its_confidence(self):
+        """Test that the confidence after the cells of a lean answer is read"""
+        text = json.dumps({
+            "found": True,
+            "cells": [{"cell_number": 3, "coverage_percent": 100}],
+            "confidence": "medium"
+        }, separators=(",", ":"))
+        parsed = GridSystem().parse_vision_stream(ClosableStream(chunked(text, 8)))
+
+        self.assertEqual(parsed["cells"][0]["cell_number"], 3)
+        self.assertEqual(parsed["confidence"], "medium")
+
+    def test_not_found_stops_early(self):
+        """Test that found=false ends the stream immediately"""
+        text = json.dumps({"found": False, "reasoning": "x" * 200})
+        stream = ClosableStream(chunked(text, 10))
+
+        self.assertIsNone(GridSystem().parse_vision_stream(stream))
+        self.assertLess(stream.consumed, len(stream.chunks))
+
+    def test_cells_before_found_wait_for_found(self):
+        """Test that cells arriving first don't decide before "found" does"""
+        stream = ClosableStream([
+            '{"cells":[{"cell_number":5,"coverage_percent":100}],',
+            '"found": true}'
+        ])
+        parsed = GridSystem().parse_vision_stream(stream)
+
+        self.assertIsNotNone(parsed)
+        self.assertTrue(parsed["found"])
+        self.assertEqual(parsed["cells"][0]["cell_number"], 5)
+
+    def test_non_json_falls_back(self):
+        """Test that plain text answers are scanned like before"""
+        stream = ClosableStream(["no element here"])
+
+        self.assertIsNone(GridSystem().parse_vision_stream(stream))
+
+
+if __name__ == "__main__":
+    unittest.main()
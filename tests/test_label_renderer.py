@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for label renderer module
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from src import label_renderer
+from src.config import config
+from src.label_renderer import GlyphAtlas, find_font_path, get_atlas, load_font
+
+
+class TestFontDiscovery(unittest.TestCase):
+    """Tests for font lookup and caching"""
+
+    def setUp(self):
+        find_font_path.cache_clear()
+        self.addCleanup(find_font_path.cache_clear)
+
+    def test_missing_configured_font_falls_through(self):
+        """Test that a bad configured path doesn't stop discovery"""
+        with mock.patch.object(config, "GRID_FONT_PATH", "/nonexistent/font.ttf"), \
+                mock.patch.object(label_renderer, "FONT_CANDIDATES", ()), \
+                mock.patch.object(label_renderer.shutil, "which", return_value=None):
+            self.assertIsNone(find_font_path())
+
+    def test_candidate_path_used(self):
+        """Test that the first existing candidate is returned"""
+        with mock.patch.object(label_renderer, "FONT_CANDIDATES", ("/a", "/b")), \
+                mock.patch.object(label_renderer.os.path, "exists", side_effect=lambda p: p == "/b"):
+            self.assertEqual(find_font_path(), "/b")
+
+    def test_font_loaded_once_per_size(self):
+        """Test that fonts are cached by size"""
+        self.assertIs(load_font(12), load_font(12))
+
+
+class TestGlyphAtlas(unittest.TestCase):
+    """Tests for GlyphAtlas class"""
+
+    def test_labels_share_height(self):
+        """Test that all labels have the same height"""
+        atlas = GlyphAtlas(load_font(14))
+        heights = {atlas.label(str(n)).height for n in (1, 47, 575)}
+
+        self.assertEqual(len(heights), 1)
+
+    def test_label_width_grows_with_digits(self):
+        """Test that label width is the sum of glyph advances plus padding"""
+        atlas = GlyphAtlas(load_font(14))
+        text_width, _ = atlas.text_size("575")
+
+        self.assertEqual(atlas.label("575").width, text_width + 2 * atlas.PADDING[0] + 1)
+        self.assertGreater(text_width, atlas.text_size("5")[0])
+
+    def test_label_has_dark_digits_on_white(self):
+        """Test that labels are opaque white boxes with dark text"""
+        pixels = np.asarray(GlyphAtlas(load_font(14)).label("8"))
+
+        self.assertTrue((pixels[..., 3] == 255).all())
+        self.assertEqual(tuple(pixels[0, 0, :3]), (255, 255, 255))
+        self.assertLess(pixels[..., :3].min(), 64)
+
+    def test_labels_memoized(self):
+        """Test that atlases and labels are reused"""
+        atlas = get_atlas(16)
+
+        self.assertIs(atlas, get_atlas(16))
+        self.assertIs(atlas.label("12"), atlas.label("12"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for location cache module
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from src.config import config
+from src.frame import Frame
+from src.location_cache import (
+    LocationCache,
+    hash_distance,
+    normalize_target,
+    perceptual_hash,
+    region_unchanged
+)
+
+
+def make_screen(seed=0, width=640, height=360):
+    """Builds a blocky screen (UI-like regions rather than noise)"""
+    rng = np.random.default_rng(seed)
+    blocks = rng.integers(0, 256, (height // 40, width // 40, 4), dtype=np.uint8)
+    pixels = np.kron(blocks, np.ones((40, 40, 1), dtype=np.uint8))
+    return Frame(np.ascontiguousarray(pixels))
+
+
+def with_patch(frame, left, top, width, height, value):
+    """Copy of a frame with a solid rectangle drawn on it"""
+    pixels = frame.pixels.copy()
+    pixels[top:top + height, left:left + width] = value
+    return Frame(pixels)
+
+
+BUTTON = (100, 100, 140, 120)
+
+
+class TestHashing(unittest.TestCase):
+    """Tests for perceptual hashing and target normalization"""
+
+    def test_small_changes_keep_hash_close(self):
+        """Test that a clock-sized change barely moves the hash"""
+        screen = make_screen()
+        clock = with_patch(screen, 580, 5, 50, 12, 255)
+
+        self.assertLessEqual(
+            hash_distance(perceptual_hash(screen), perceptual_hash(clock)),
+            config.LOCATION_CACHE_MAX_DISTANCE
+        )
+        self.assertGreater(
+            hash_distance(perceptual_hash(screen), perceptual_hash(make_screen(1))),
+            config.LOCATION_CACHE_MAX_DISTANCE
+        )
+
+    def test_normalize_target(self):
+        """Test that case, punctuation and spacing are ignored"""
+        self.assertEqual(
+            normalize_target('  The "Send"  button! '),
+            normalize_target("the send button")
+        )
+
+    def test_region_unchanged(self):
+        """Test that only the pixels around the element are compared"""
+        screen = make_screen()
+
+        elsewhere = with_patch(screen, 400, 200, 200, 120, 255)
+        self.assertTrue(region_unchanged(screen, elsewhere, BUTTON))
+
+        repainted = with_patch(screen, 100, 100, 40, 20, 0)
+        self.assertFalse(region_unchanged(screen, repainted, BUTTON))
+        self.assertFalse(region_unchanged(screen, make_screen(width=320), BUTTON))
+
+
+class TestLocationCache(unittest.TestCase):
+    """Tests for LocationCache"""
+
+    def setUp(self):
+        self.cache = LocationCache(":memory:", ttl=60, max_entries=10, verify=True)
+        self.screen = make_screen()
+
+    def tearDown(self):
+        self.cache.close()
+
+    def store(self, screen=None, target="Send button"):
+        self.cache.store(
+            screen or self.screen,
+            target,
+            (120, 110),
+            BUTTON,
+            [{"cell_number": 3, "coverage_percent": 100}],
+            "high"
+        )
+
+    def test_hit_tolerates_small_changes(self):
+        """Test that a hit survives a clock change and a reworded target"""
+        self.store()
+        clock = with_patch(self.screen, 580, 5, 50, 12, 255)
+
+        cached = self.cache.lookup(clock, "send  BUTTON")
+
+        self.assertIsNotNone(cached)
+        self.assertEqual(cached.coordinates, (120, 110))
+        self.assertEqual(cached.confidence, "high")
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_miss_on_other_target_or_screen(self):
+        """Test that other targets and screens miss"""
+        self.store()
+
+        self.assertIsNone(self.cache.lookup(self.screen, "Cancel button"))
+        self.assertIsNone(self.cache.lookup(make_screen(1), "Send button"))
+        self.assertEqual(self.cache.stats()["misses"], 2)
+        self.assertEqual(self.cache.hit_rate, 0.0)
+
+    def test_verification_rejects_moved_element(self):
+        """Test that a changed element region invalidates the entry"""
+        self.store()
+        changed = with_patch(self.screen, 100, 100, 40, 20, 0)
+
+        self.assertIsNone(self.cache.lookup(changed, "Send button"))
+        self.assertEqual(self.cache.stats()["rejected"], 1)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_ttl_expiry(self):
+        """Test that entries older than the TTL are ignored"""
+        self.store()
+
+        with mock.patch("src.location_cache.time.time", return_value=1e12):
+            self.assertIsNone(self.cache.lookup(self.screen, "Send button"))
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entries are evicted"""
+        for index in range(12):
+            self.store(target=f"button {index}")
+
+        stats = self.cache.stats()
+        self.assertEqual(stats["entries"], 10)
+        self.assertEqual(stats["evictions"], 2)
+        self.assertIsNone(self.cache.lookup(self.screen, "button 0"))
+        self.assertIsNotNone(self.cache.lookup(self.screen, "button 11"))
+
+    def test_persists_on_disk(self):
+        """Test that entries survive reopening the database"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache", "locations.sqlite3")
+            cache = LocationCache(path)
+            cache.store(self.screen, "Send button", (120, 110), BUTTON, [], "high")
+            cache.close()
+
+            reopened = LocationCache(path)
+            self.assertIsNotNone(reopened.lookup(self.screen, "Send button"))
+            reopened.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for metrics module
+"""
+
+import unittest
+
+from src.metrics import RequestStats
+
+
+class TestRequestStats(unittest.TestCase):
+    """Tests for RequestStats"""
+
+    def test_summary_per_label(self):
+        """Test that labels are aggregated separately"""
+        stats = RequestStats()
+        for latency, tokens in ((0.1, 20), (0.3, 40), (0.2, None)):
+            stats.record("locate:lean", latency, tokens)
+        stats.record("locate:verbose", 1.0, 300)
+
+        summary = stats.summary()
+
+        lean = summary["locate:lean"]
+        self.assertEqual(lean["requests"], 3)
+        self.assertAlmostEqual(lean["mean_ms"], 200.0)
+        self.assertAlmostEqual(lean["p50_ms"], 200.0)
+        self.assertAlmostEqual(lean["p95_ms"], 300.0)
+        self.assertEqual(lean["tokens_reported"], 2)
+        self.assertEqual(lean["mean_output_tokens"], 30)
+        self.assertEqual(summary["locate:verbose"]["mean_output_tokens"], 300)
+
+    def test_unreported_tokens(self):
+        """Test that labels without token counts report None"""
+        stats = RequestStats()
+        stats.record("stream", 0.05)
+
+        self.assertIsNone(stats.summary()["stream"]["mean_output_tokens"])
+
+    def test_samples_are_bounded(self):
+        """Test that only the most recent samples are kept"""
+        stats = RequestStats(max_samples=2)
+        for latency in (1.0, 2.0, 3.0):
+            stats.record("plan", latency)
+
+        self.assertEqual(len(stats), 2)
+        self.assertAlmostEqual(stats.summary()["plan"]["mean_ms"], 2500.0)
+
+        stats.reset()
+        self.assertEqual(stats.summary(), {})
+
+    def test_percentile_needs_samples(self):
+        """Test that percentiles are in seconds and need min_samples"""
+        stats = RequestStats()
+        for latency in (0.1, 0.2, 0.3, 0.4):
+            stats.record("plan", latency)
+
+        self.assertEqual(stats.percentile("plan", 0.5), 0.2)
+        self.assertEqual(stats.percentile("plan", 0.95), 0.4)
+        self.assertIsNone(stats.percentile("plan", 0.95, min_samples=5))
+        self.assertIsNone(stats.percentile("missing", 0.95))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for OpenAI client module
+"""
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from PIL import Image
+
+from src import openai_client as openai_client_module
+from src.background_loop import BackgroundLoop
+from src.openai_client import AsyncOpenAIClient, OpenAIClient, get_openai_client
+from src.rate_limiter import RateLimiter
+
+
+class FakeResponses:
+    """Responses API returning a fixed answer"""
+
+    def __init__(self, owner):
+        self.owner = owner
+
+    async def create(self, stream=False, **request):
+        self.owner.requests.append(request)
+        usage = SimpleNamespace(output_tokens=12, total_tokens=40)
+        if not stream:
+            return SimpleNamespace(output_text='{"found": false}', usage=usage)
+        return FakeStream([
+            SimpleNamespace(type="response.output_text.delta", delta='{"found"'),
+            SimpleNamespace(type="response.output_text.delta", delta=': false}'),
+            SimpleNamespace(
+                type="response.completed",
+                response=SimpleNamespace(usage=usage)
+            ),
+        ])
+
+
+class FakeStream:
+    """Async event stream"""
+
+    def __init__(self, events):
+        self.events = list(events)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.events:
+            raise StopAsyncIteration
+        return self.events.pop(0)
+
+    async def close(self):
+        pass
+
+
+class FakeCompletions:
+    """Chat Completions API returning a fixed plan"""
+
+    async def create(self, **request):
+        message = SimpleNamespace(content=' [{"action": "wait", "seconds": 1}] ')
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=message)],
+            usage=SimpleNamespace(completion_tokens=30)
+        )
+
+
+class FakeAsyncOpenAI:
+    """Stand-in for the async SDK client"""
+
+    instances = []
+
+    def __init__(self, api_key=None, http_client=None, **kwargs):
+        self.http_client = http_client
+        self.requests = []
+        self.loop = asyncio.get_running_loop()
+        self.responses = FakeResponses(self)
+        self.chat = SimpleNamespace(completions=FakeCompletions())
+        FakeAsyncOpenAI.instances.append(self)
+
+    async def close(self):
+        pass
+
+
+@mock.patch.object(openai_client_module, "AsyncOpenAI", FakeAsyncOpenAI)
+class TestOpenAIClient(unittest.TestCase):
+    """Tests for the async client and its blocking wrapper"""
+
+    def setUp(self):
+        FakeAsyncOpenAI.instances = []
+        self.loop = BackgroundLoop(name="test-openai-loop")
+        self.image = Image.new("RGB", (32, 32), "white")
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_sync_wrapper_runs_on_background_loop(self):
+        """Test that blocking calls share one SDK client on the background loop"""
+        client = OpenAIClient(api_key="test", loop=self.loop)
+
+        self.assertEqual(client.ask_with_image("find it", self.image), '{"found": false}')
+        self.assertEqual(
+            client.generate_plan("wait"),
+            '[{"action": "wait", "seconds": 1}]'
+        )
+
+        self.assertEqual(len(FakeAsyncOpenAI.instances), 1)
+        self.assertIs(FakeAsyncOpenAI.instances[0].loop, self.loop.loop)
+        summary = client.stats.summary()
+        self.assertEqual(summary["vision"]["mean_output_tokens"], 12)
+        self.assertEqual(summary["plan"]["mean_output_tokens"], 30)
+
+    def test_sync_stream(self):
+        """Test that the blocking stream yields deltas and records tokens"""
+        client = OpenAIClient(api_key="test", loop=self.loop)
+
+        chunks = list(client.stream_with_image("find it", self.image, label="locate"))
+
+        self.assertEqual("".join(chunks), '{"found": false}')
+        self.assertEqual(client.stats.summary()["locate"]["mean_output_tokens"], 12)
+
+    def test_stream_closed_early_still_counts_tokens(self):
+        """Test that a stream closed after its first delta reports its usage"""
+        client = OpenAIClient(api_key="test", loop=self.loop)
+
+        chunks = client.stream_with_image("find it", self.image, label="locate:lean")
+        self.assertEqual(next(chunks), '{"found"')
+        chunks.close()
+        client.drain(1.0)
+
+        numbers = client.stats.summary()["locate:lean"]
+        self.assertEqual(numbers["requests"], 1)
+        self.assertEqual(numbers["mean_output_tokens"], 12)
+
+    def test_stream_closed_early_settles_its_tokens(self):
+        """Test that a stream closed early corrects its rate limit estimate"""
+        limiter = RateLimiter(requests_per_minute=100, tokens_per_minute=100000)
+        client = OpenAIClient(api_key="test", loop=self.loop, rate_limiter=limiter)
+
+        chunks = client.stream_with_image("find it", self.image)
+        next(chunks)
+        chunks.close()
+        client.drain(1.0)
+
+        self.assertEqual(limiter.stats()["tokens"], 40)
+
+    def test_async_requests_run_concurrently(self):
+        """Test that async requests can be gathered on one loop"""
+        client = AsyncOpenAIClient(api_key="test")
+
+        async def ask_twice():
+            return await asyncio.gather(
+                client.ask_with_image("a", self.image),
+                client.ask_with_image("b", self.image, response_format={"type": "json_object"})
+            )
+
+        answers = asyncio.run(ask_twice())
+
+        self.assertEqual(answers, ['{"found": false}'] * 2)
+        requests = {
+            request["input"][0]["content"]: request
+            for request in FakeAsyncOpenAI.instances[0].requests
+        }
+        self.assertNotIn("text", requests["a"])
+        self.assertEqual(requests["b"]["text"], {"format": {"type": "json_object"}})
+
+    def test_one_sdk_client_per_loop(self):
+        """Test that each event loop gets its own SDK client"""
+        client = AsyncOpenAIClient(api_key="test")
+
+        for _ in range(2):
+            asyncio.run(client.ask_with_image("a", self.image))
+
+        self.assertEqual(len(FakeAsyncOpenAI.instances), 2)
+
+
+class TestSharedClient(unittest.TestCase):
+    """Tests for the process-wide client registry"""
+
+    def test_same_instance_per_key(self):
+        """Test that components get one shared client per API key"""
+        with mock.patch.dict(openai_client_module._shared_clients, clear=True):
+            first = get_openai_client("key-a")
+
+            self.assertIs(get_openai_client("key-a"), first)
+            self.assertIsNot(get_openai_client("key-b"), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for plan cache module
+"""
+
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.plan_cache import PlanCache, normalize_instruction
+from src.planner import Planner
+
+
+STEPS = [
+    {"action": "click", "target": "compose button"},
+    {"action": "type", "text": "Hi!"}
+]
+
+
+class TestNormalizeInstruction(unittest.TestCase):
+    """Tests for instruction normalization"""
+
+    def test_whitespace_only(self):
+        """Test that spacing is normalized but typed text is kept"""
+        self.assertEqual(
+            normalize_instruction("  send  an email\n saying 'Hi!' "),
+            "send an email saying 'Hi!'"
+        )
+        self.assertNotEqual(
+            normalize_instruction("type Hello"),
+            normalize_instruction("type hello")
+        )
+
+
+class TestPlanCache(unittest.TestCase):
+    """Tests for PlanCache"""
+
+    def setUp(self):
+        self.cache = PlanCache(":memory:", ttl=60, max_entries=3)
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_hit_requires_same_model_and_prompt(self):
+        """Test that plans are keyed by instruction, model and prompt version"""
+        self.cache.put("send  email", "model-a", "v1", STEPS)
+
+        self.assertEqual(self.cache.get("send email", "model-a", "v1"), STEPS)
+        self.assertIsNone(self.cache.get("send email", "model-b", "v1"))
+        self.assertIsNone(self.cache.get("send email", "model-a", "v2"))
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 2)
+
+    def test_ttl_skips_pinned_entries(self):
+        """Test that expired plans miss unless pinned"""
+        self.cache.put("a", "m", "v", STEPS)
+        self.cache.put("b", "m", "v", STEPS)
+        self.assertTrue(self.cache.pin("b", "m", "v"))
+
+        with mock.patch("src.plan_cache.time.time", return_value=1e12):
+            self.assertIsNone(self.cache.get("a", "m", "v"))
+            self.assertEqual(self.cache.get("b", "m", "v"), STEPS)
+
+    def test_lru_eviction_keeps_pinned(self):
+        """Test that the least recently used unpinned plans are evicted"""
+        self.cache.put("pinned", "m", "v", STEPS, pinned=True)
+        for name in ("a", "b", "c"):
+            self.cache.put(name, "m", "v", STEPS)
+        self.cache.get("a", "m", "v")
+        self.cache.put("d", "m", "v", STEPS)
+
+        self.assertIsNone(self.cache.get("b", "m", "v"))
+        for name in ("pinned", "a", "c", "d"):
+            self.assertIsNotNone(self.cache.get(name, "m", "v"))
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+
+    def test_invalidate(self):
+        """Test that invalidation removes every model and version by default"""
+        self.cache.put("a", "m1", "v", STEPS, pinned=True)
+        self.cache.put("a", "m2", "v", STEPS)
+
+        self.assertEqual(self.cache.invalidate("a", model="m2"), 1)
+        self.assertEqual(self.cache.invalidate("a"), 1)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_persists_on_disk(self):
+        """Test that plans survive reopening the database"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "plans.sqlite3")
+            cache = PlanCache(path)
+            cache.put("a", "m", "v", STEPS)
+            cache.close()
+
+            reopened = PlanCache(path)
+            self.assertEqual(reopened.get("a", "m", "v"), STEPS)
+            reopened.close()
+
+
+class TestPlannerCache(unittest.TestCase):
+    """Tests for the plan cache in front of plan generation"""
+
+    def test_identical_instruction_skips_planning(self):
+        """Test that a repeated instruction replays the cached plan"""
+        client = mock.Mock()
+        client.generate_plan = mock.AsyncMock(
+            return_value='[{"action": "wait", "seconds": 1}]'
+        )
+        planner = Planner(client, PlanCache(":memory:"))
+
+        first = asyncio.run(planner.generate_plan_async("wait a second"))
+        second = asyncio.run(planner.generate_plan_async("wait  a second"))
+
+        self.assertEqual(first.steps, second.steps)
+        client.generate_plan.assert_awaited_once()
+
+    def test_invalid_cached_plan_is_dropped(self):
+        """Test that a cached plan failing validation is replanned"""
+        client = mock.Mock()
+        client.generate_plan = mock.AsyncMock(
+            return_value='[{"action": "wait", "seconds": 1}]'
+        )
+        cache = PlanCache(":memory:")
+        planner = Planner(client, cache)
+        with mock.patch("src.planner.plan_prompt_version", return_value="v"):
+            cache.put("wait", "gpt-4o-mini", "v", [{"action": "fly"}])
+            with mock.patch("src.planner.config.MODEL", "gpt-4o-mini"):
+                plan = asyncio.run(planner.generate_plan_async("wait"))
+
+        self.assertEqual(plan.steps, [{"action": "wait", "seconds": 1}])
+        client.generate_plan.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for rate limiter module
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import httpx
+import openai
+
+from src.openai_client import AsyncOpenAIClient
+from src.rate_limiter import RateLimiter, TokenBucket, estimate_tokens, get_rate_limiter
+from src.request_policy import RequestPolicy
+
+
+def drained_limiter() -> RateLimiter:
+    """Limiter refilling 100 tokens per second with its burst used up"""
+    limiter = RateLimiter(requests_per_minute=6000, tokens_per_minute=6000)
+    limiter.reserve(6000)
+    return limiter
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Tests for the per-minute budget"""
+
+    def test_burst_then_wait(self):
+        """Test that the capacity is free and the rest is paid by the refill"""
+        bucket = TokenBucket(600)
+
+        self.assertEqual(bucket.reserve(600, now=bucket.updated), 0.0)
+        self.assertAlmostEqual(bucket.reserve(20, now=bucket.updated), 2.0)
+        self.assertAlmostEqual(bucket.reserve(20, now=bucket.updated), 4.0)
+
+    def test_refill_is_capped(self):
+        """Test that an idle bucket never holds more than its capacity"""
+        bucket = TokenBucket(60)
+        bucket.refund(0, now=bucket.updated + 3600)
+
+        self.assertEqual(bucket.level, 60)
+
+    def test_oversized_reservations_are_capped(self):
+        """Test that a reservation above the capacity still gets served"""
+        bucket = TokenBucket(60)
+
+        self.assertEqual(bucket.reserve(1000, now=bucket.updated), 0.0)
+        self.assertAlmostEqual(bucket.reserve(60, now=bucket.updated), 60.0)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Tests for queueing callers over budget"""
+
+    def test_within_budget_does_not_wait(self):
+        """Test that requests inside the budget pass at once"""
+        limiter = RateLimiter(requests_per_minute=10, tokens_per_minute=1000)
+
+        for _ in range(10):
+            self.assertEqual(limiter.acquire(50), 0.0)
+
+        numbers = limiter.stats()
+        self.assertEqual(numbers["requests"], 10)
+        self.assertEqual(numbers["tokens"], 500)
+        self.assertEqual(numbers["waited"], 0)
+
+    def test_threads_queue_in_order(self):
+        """Test that threads over budget wait their turn instead of failing"""
+        limiter = drained_limiter()
+        waits = []
+        lock = threading.Lock()
+
+        def worker():
+            waited = limiter.acquire(10)
+            with lock:
+                waits.append(waited)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        elapsed = time.perf_counter() - started
+        self.assertGreaterEqual(elapsed, 0.35)
+        self.assertLess(elapsed, 1.0)
+        for expected, waited in zip((0.1, 0.2, 0.3, 0.4), sorted(waits)):
+            self.assertAlmostEqual(waited, expected, delta=0.05)
+
+        numbers = limiter.stats()
+        self.assertEqual(numbers["waited"], 4)
+        self.assertEqual(numbers["queue_depth"], 0)
+        self.assertGreaterEqual(numbers["max_queue_depth"], 2)
+        self.assertAlmostEqual(numbers["max_wait_ms"], 400, delta=50)
+
+    def test_asyncio_and_threads_share_the_budget(self):
+        """Test that coroutines and threads queue on the same budget"""
+        limiter = drained_limiter()
+        thread = threading.Thread(target=limiter.acquire, args=(10,))
+
+        async def burst():
+            thread.start()
+            return await asyncio.gather(*(limiter.acquire_async(10) for _ in range(3)))
+
+        waits = asyncio.run(burst())
+        thread.join()
+
+        self.assertAlmostEqual(max(waits), 0.4, delta=0.1)
+        self.assertEqual(limiter.stats()["waited"], 4)
+        self.assertEqual(limiter.stats()["queue_depth"], 0)
+
+    def test_cancelled_waiter_returns_its_reservation(self):
+        """Test that a cancelled coroutine gives its tokens back"""
+        limiter = drained_limiter()
+
+        async def cancel_waiter():
+            task = asyncio.create_task(limiter.acquire_async(100))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel_waiter())
+
+        self.assertEqual(limiter.stats()["queue_depth"], 0)
+        self.assertLess(limiter.reserve(10), 0.2)
+
+    def test_settle_corrects_the_estimate(self):
+        """Test that reported usage refunds an overestimate"""
+        limiter = RateLimiter(requests_per_minute=100, tokens_per_minute=6000)
+        limiter.reserve(6000)
+        limiter.settle(6000, 1000)
+
+        self.assertEqual(limiter.reserve(4000), 0.0)
+        self.assertEqual(limiter.stats()["tokens"], 5000)
+
+        limiter.settle(10, None)
+        self.assertEqual(limiter.stats()["tokens"], 5000)
+
+    def test_estimate_tokens(self):
+        """Test the rough token estimate"""
+        with mock.patch("src.rate_limiter.config.RATE_LIMIT_IMAGE_TOKENS", 1000):
+            self.assertEqual(estimate_tokens("x" * 400), 100)
+            self.assertEqual(estimate_tokens("x" * 400, images=2, output_tokens=50), 2150)
+            self.assertEqual(estimate_tokens(""), 1)
+
+    def test_shared_limiter_per_key(self):
+        """Test that one limiter is shared per API key when enabled"""
+        with mock.patch("src.rate_limiter.config.RATE_LIMIT_ENABLED", False):
+            self.assertIsNone(get_rate_limiter("key-a"))
+
+        with mock.patch("src.rate_limiter.config.RATE_LIMIT_ENABLED", True):
+            first = get_rate_limiter("key-a")
+            self.assertIs(get_rate_limiter("key-a"), first)
+            self.assertIsNot(get_rate_limiter("key-b"), first)
+
+
+class TestClientRateLimit(unittest.TestCase):
+    """Tests for the limiter in front of the async client"""
+
+    def test_every_attempt_is_metered(self):
+        """Test that the first attempt and each retry take from the budget"""
+        limiter = RateLimiter(requests_per_minute=100, tokens_per_minute=10000)
+        policy = RequestPolicy(max_attempts=3, backoff_base=0.01, backoff_max=0.01)
+        client = AsyncOpenAIClient("test-key", policy=policy, rate_limiter=limiter)
+
+        request = httpx.Request("POST", "http://stand-in/v1/chat/completions")
+        outcomes = [openai.APIConnectionError(request=request), None]
+
+        async def create():
+            outcome = outcomes.pop(0)
+            if outcome is not None:
+                raise outcome
+            return SimpleNamespace(usage=SimpleNamespace(total_tokens=40))
+
+        response = asyncio.run(client._call(create, "plan", 100))
+        client._settle(100, response)
+
+        numbers = limiter.stats()
+        self.assertEqual(numbers["requests"], 2)
+        self.assertEqual(numbers["tokens"], 140)
+
+    def test_limiter_disabled_by_default(self):
+        """Test that clients run unmetered unless rate limiting is enabled"""
+        with mock.patch("src.rate_limiter.config.RATE_LIMIT_ENABLED", False):
+            self.assertIsNone(AsyncOpenAIClient("test-key").rate_limiter)
+
+
+if __name__ == "__main__":
+    unittest.main()
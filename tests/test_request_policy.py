@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for request policy module
+"""
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import httpx
+import openai
+from PIL import Image
+
+from src.background_loop import BackgroundLoop
+from src.exceptions import OpenAIClientError, RequestDeadlineError
+from src.openai_client import AsyncOpenAIClient, OpenAIClient
+from src.request_policy import RequestPolicy, is_retryable
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Stand-in for the OpenAI API that injects latency and errors
+
+    Each request takes the next (delay, status, headers) from the server's
+    script; once the script is used up every request succeeds at once.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        with self.server.lock:
+            behaviour = self.server.script.pop(0) if self.server.script else (0.0, 200, {})
+            self.server.received += 1
+        delay, status, headers = behaviour
+
+        time.sleep(delay)
+
+        if status != 200:
+            body = {"error": {"message": f"injected {status}", "type": "server_error"}}
+        elif self.path.endswith("/chat/completions"):
+            body = {
+                "id": "chatcmpl-1",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "stand-in",
+                "choices": [{
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": "[]"}
+                }],
+                "usage": {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12}
+            }
+        else:
+            body = {
+                "id": "resp-1",
+                "object": "response",
+                "created_at": 0,
+                "model": "stand-in",
+                "status": "completed",
+                "output": [{
+                    "id": "msg-1",
+                    "type": "message",
+                    "role": "assistant",
+                    "status": "completed",
+                    "content": [{"type": "output_text", "text": '{"found": false}', "annotations": []}]
+                }],
+                "parallel_tool_calls": False,
+                "tool_choice": "auto",
+                "tools": [],
+                "usage": {
+                    "input_tokens": 10,
+                    "input_tokens_details": {"cached_tokens": 0},
+                    "output_tokens": 5,
+                    "output_tokens_details": {"reasoning_tokens": 0},
+                    "total_tokens": 15
+                }
+            }
+
+        data = json.dumps(body).encode("utf-8")
+        try:
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client cancelled a hedged or timed out attempt
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+def status_error(status: int, headers: dict = None) -> openai.APIStatusError:
+    """SDK error for an HTTP status"""
+    request = httpx.Request("POST", "http://stand-in/v1/responses")
+    response = httpx.Response(status, headers=headers or {}, request=request)
+    return openai.APIStatusError(f"status {status}", response=response, body=None)
+
+
+class ScriptedCall:
+    """Async call that fails, stalls or answers per a script"""
+
+    def __init__(self, *steps):
+        self.steps = list(steps)
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        step = self.steps.pop(0) if self.steps else "ok"
+        if isinstance(step, BaseException):
+            raise step
+        if isinstance(step, float):
+            await asyncio.sleep(step)
+        return f"answer {self.calls}"
+
+
+class TestRequestPolicy(unittest.TestCase):
+    """Tests for deadlines, retries and hedging"""
+
+    def policy(self, **kwargs) -> RequestPolicy:
+        settings = dict(
+            deadline=5.0,
+            attempt_timeout=2.0,
+            max_attempts=3,
+            backoff_base=0.01,
+            backoff_max=0.05,
+            hedge=False,
+            hedge_delay=0.05
+        )
+        settings.update(kwargs)
+        return RequestPolicy(**settings)
+
+    def test_retries_server_errors(self):
+        """Test that a 5xx is retried and the next answer returned"""
+        policy = self.policy()
+        call = ScriptedCall(status_error(500), status_error(503))
+
+        self.assertEqual(asyncio.run(policy.run(call, label="plan")), "answer 3")
+        self.assertEqual([r.outcome for r in policy.records], ["error", "error", "ok"])
+        self.assertEqual(policy.stats()["plan"], {"attempt_error": 2, "attempt_ok": 1})
+
+    def test_client_errors_are_not_retried(self):
+        """Test that a 400 is raised after one attempt"""
+        policy = self.policy()
+        call = ScriptedCall(status_error(400))
+
+        with self.assertRaises(openai.APIStatusError):
+            asyncio.run(policy.run(call))
+        self.assertEqual(call.calls, 1)
+
+    def test_last_error_raised_when_attempts_run_out(self):
+        """Test that the last retryable error surfaces after max attempts"""
+        policy = self.policy(max_attempts=2)
+        call = ScriptedCall(status_error(502), status_error(500))
+
+        with self.assertRaises(openai.APIStatusError) as raised:
+            asyncio.run(policy.run(call))
+        self.assertEqual(raised.exception.status_code, 500)
+        self.assertEqual(call.calls, 2)
+
+    def test_slow_attempts_time_out_and_retry(self):
+        """Test that an attempt past its timeout is recorded and retried"""
+        policy = self.policy(attempt_timeout=0.05)
+        call = ScriptedCall(1.0)
+
+        self.assertEqual(asyncio.run(policy.run(call)), "answer 2")
+        self.assertEqual([r.outcome for r in policy.records], ["timeout", "ok"])
+
+    def test_deadline_bounds_the_request(self):
+        """Test that the deadline stops retries and lists the attempts"""
+        policy = self.policy(deadline=0.3, attempt_timeout=0.2, max_attempts=10)
+        call = ScriptedCall(1.0, 1.0, 1.0)
+
+        started = time.perf_counter()
+        with self.assertRaises(RequestDeadlineError) as raised:
+            asyncio.run(policy.run(call))
+
+        self.assertLess(time.perf_counter() - started, 0.6)
+        self.assertIsInstance(raised.exception, OpenAIClientError)
+        self.assertTrue(raised.exception.attempts)
+        self.assertEqual(raised.exception.attempts[0].outcome, "timeout")
+
+    def test_hedge_wins_over_a_slow_attempt(self):
+        """Test that a duplicate is sent after the hedge delay and wins"""
+        policy = self.policy(hedge=True, hedge_delay=0.05)
+        call = ScriptedCall(1.0, "ok")
+
+        started = time.perf_counter()
+        self.assertEqual(asyncio.run(policy.run(call, label="locate:lean")), "answer 2")
+
+        self.assertLess(time.perf_counter() - started, 0.5)
+        outcomes = {(r.hedge, r.outcome) for r in policy.records}
+        self.assertEqual(outcomes, {(False, "cancelled"), (True, "ok")})
+        self.assertEqual(
+            policy.stats()["locate:lean"],
+            {"attempt_cancelled": 1, "hedge_ok": 1}
+        )
+
+    def test_no_hedge_for_fast_attempts(self):
+        """Test that answers within the hedge delay send no duplicate"""
+        policy = self.policy(hedge=True, hedge_delay=0.5)
+        call = ScriptedCall("ok")
+
+        asyncio.run(policy.run(call))
+        self.assertEqual(call.calls, 1)
+
+    def test_hedge_can_be_disabled_per_call(self):
+        """Test that hedge=False overrides the policy"""
+        policy = self.policy(hedge=True, hedge_delay=0.01)
+        call = ScriptedCall(0.1)
+
+        asyncio.run(policy.run(call, hedge=False))
+        self.assertEqual(call.calls, 1)
+
+    def test_hedge_delay_follows_p95_latency(self):
+        """Test that the hedge delay is the label's p95 once enough samples exist"""
+        policy = self.policy(hedge_delay=3.0)
+
+        with mock.patch("src.request_policy.config.REQUEST_HEDGE_MIN_SAMPLES", 5):
+            self.assertEqual(policy._hedge_delay("plan"), 3.0)
+            for latency in (0.1, 0.2, 0.3, 0.4, 0.5):
+                policy.latencies.record("plan", latency)
+            self.assertEqual(policy._hedge_delay("plan"), 0.5)
+
+    def test_hedge_delay_ignores_retries_and_backoff(self):
+        """Test that only successful attempt durations feed the hedge delay"""
+        policy = self.policy(backoff_base=0.2, backoff_max=0.2)
+        call = ScriptedCall(status_error(503), 0.02)
+
+        with mock.patch("src.request_policy.random.uniform", return_value=0.2):
+            asyncio.run(policy.run(call, label="plan"))
+
+        with mock.patch("src.request_policy.config.REQUEST_HEDGE_MIN_SAMPLES", 1):
+            self.assertLess(policy._hedge_delay("plan"), 0.15)
+
+    def test_backoff_is_jittered_and_capped(self):
+        """Test backoff bounds and Retry-After"""
+        policy = self.policy(backoff_base=0.1, backoff_max=1.0)
+        error = status_error(500)
+
+        for number in range(1, 8):
+            delay = policy._backoff(number, error)
+            self.assertGreaterEqual(delay, 0.0)
+            self.assertLessEqual(delay, min(1.0, 0.1 * 2 ** (number - 1)))
+
+        self.assertEqual(policy._backoff(1, status_error(429, {"retry-after": "0.8"})), 0.8)
+        self.assertEqual(policy._backoff(1, status_error(429, {"retry-after": "60"})), 1.0)
+
+    def test_retryable_errors(self):
+        """Test which errors are retried"""
+        request = httpx.Request("POST", "http://stand-in/v1/responses")
+        self.assertTrue(is_retryable(status_error(429)))
+        self.assertTrue(is_retryable(status_error(408)))
+        self.assertTrue(is_retryable(status_error(500)))
+        self.assertTrue(is_retryable(openai.APIConnectionError(request=request)))
+        self.assertTrue(is_retryable(httpx.ConnectError("refused")))
+        self.assertTrue(is_retryable(TimeoutError()))
+        self.assertFalse(is_retryable(status_error(400)))
+        self.assertFalse(is_retryable(status_error(401)))
+        self.assertFalse(is_retryable(ValueError("bad")))
+
+
+class TestPolicyAgainstStandIn(unittest.TestCase):
+    """Tests of the client's policy against a local stand-in API"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        cls.server.daemon_threads = True
+        cls.server.lock = threading.Lock()
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}/v1"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.script = []
+        self.server.received = 0
+        self.loop = BackgroundLoop(name="test-policy-loop")
+
+    def tearDown(self):
+        self.loop.close()
+
+    def client(self, **kwargs) -> OpenAIClient:
+        settings = dict(
+            deadline=5.0,
+            attempt_timeout=2.0,
+            max_attempts=3,
+            backoff_base=0.01,
+            backoff_max=0.5,
+            hedge=False,
+            hedge_delay=0.2
+        )
+        settings.update(kwargs)
+        client = OpenAIClient(
+            "test-key",
+            loop=self.loop,
+            base_url=self.base_url,
+            policy=RequestPolicy(**settings)
+        )
+        self.addCleanup(client.close)
+        return client
+
+    def test_plan_retried_after_server_error(self):
+        """Test that a 500 from the API is retried transparently"""
+        self.server.script = [(0.0, 500, {})]
+        client = self.client()
+
+        self.assertEqual(client.generate_plan("open the browser"), "[]")
+        self.assertEqual(self.server.received, 2)
+        self.assertEqual(client.policy.stats()["plan"], {"attempt_error": 1, "attempt_ok": 1})
+        self.assertEqual(client.stats.summary()["plan"]["requests"], 1)
+
+    def test_rate_limit_honors_retry_after(self):
+        """Test that a 429 waits for Retry-After before the next attempt"""
+        self.server.script = [(0.0, 429, {"Retry-After": "0.3"})]
+        client = self.client()
+
+        started = time.perf_counter()
+        client.generate_plan("open the browser")
+
+        self.assertGreaterEqual(time.perf_counter() - started, 0.3)
+        self.assertEqual(self.server.received, 2)
+
+    def test_bad_request_not_retried(self):
+        """Test that a 400 fails at once as an OpenAIClientError"""
+        self.server.script = [(0.0, 400, {})]
+        client = self.client()
+
+        with self.assertRaises(OpenAIClientError):
+            client.generate_plan("open the browser")
+        self.assertEqual(self.server.received, 1)
+
+    def test_deadline_exceeded(self):
+        """Test that a stalled API fails within the deadline"""
+        self.server.script = [(2.0, 200, {})] * 3
+        client = self.client(deadline=0.5, attempt_timeout=0.3)
+
+        started = time.perf_counter()
+        with self.assertRaises(RequestDeadlineError):
+            client.generate_plan("open the browser")
+        self.assertLess(time.perf_counter() - started, 1.5)
+
+    def test_hedged_vision_request(self):
+        """Test that a slow vision request is hedged and the fast answer used"""
+        self.server.script = [(1.5, 200, {})]
+        client = self.client(hedge=True, hedge_delay=0.2)
+
+        started = time.perf_counter()
+        answer = client.ask_with_image(
+            "where is the button?",
+            Image.new("RGB", (32, 32), "white"),
+            label="locate:lean"
+        )
+
+        self.assertEqual(answer, '{"found": false}')
+        self.assertLess(time.perf_counter() - started, 1.2)
+        self.assertEqual(self.server.received, 2)
+        self.assertEqual(
+            client.policy.stats()["locate:lean"],
+            {"attempt_cancelled": 1, "hedge_ok": 1}
+        )
+
+
+class TestAsyncClientPolicy(unittest.TestCase):
+    """Tests for the policy defaults of the async client"""
+
+    def test_default_policy_keeps_its_own_latencies(self):
+        """Test that client stats (encoding and queueing included) don't drive hedging"""
+        client = AsyncOpenAIClient("test-key")
+        self.assertIsNot(client.policy.latencies, client.stats)
+
+
+if __name__ == "__main__":
+    unittest.main()
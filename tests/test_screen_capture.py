@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for screen capture module
+"""
+
+import unittest
+from unittest import mock
+
+from src.screen_capture import CaptureSession, ScreenCapture
+
+
+class TestCaptureSession(unittest.TestCase):
+    """Tests for CaptureSession class"""
+
+    def setUp(self):
+        patcher = mock.patch("src.screen_capture.mss.mss")
+        self.mss_factory = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.sct = self.mss_factory.return_value
+        self.sct.monitors = [
+            {"left": 0, "top": 0, "width": 3840, "height": 2160},
+            {"left": 0, "top": 0, "width": 3840, "height": 2160},
+        ]
+
+    def test_opens_lazily(self):
+        """Test that mss is not opened until first use"""
+        session = CaptureSession()
+        self.assertTrue(session.closed)
+        self.mss_factory.assert_not_called()
+
+    def test_reuses_handle_across_grabs(self):
+        """Test that repeated grabs share one mss handle"""
+        session = CaptureSession()
+        for _ in range(5):
+            session.grab()
+
+        self.mss_factory.assert_called_once()
+        self.assertEqual(self.sct.grab.call_count, 5)
+        self.assertEqual(session.grab_count, 5)
+
+    def test_grab_region(self):
+        """Test that an explicit region is passed through to mss"""
+        session = CaptureSession()
+        region = {"left": 10, "top": 20, "width": 100, "height": 50}
+        session.grab(region)
+
+        self.sct.grab.assert_called_once_with(region)
+
+    def test_close_and_reopen(self):
+        """Test that close releases the handle and the next grab reopens it"""
+        session = CaptureSession()
+        session.grab()
+        session.close()
+
+        self.assertTrue(session.closed)
+        self.sct.close.assert_called_once()
+
+        session.grab()
+        self.assertEqual(self.mss_factory.call_count, 2)
+
+    def test_context_manager_closes(self):
+        """Test that the session closes when used as a context manager"""
+        with CaptureSession() as session:
+            self.assertEqual(session.monitor["width"], 3840)
+
+        self.assertTrue(session.closed)
+
+
+class TestScreenCaptureRegion(unittest.TestCase):
+    """Tests for region capture"""
+
+    def setUp(self):
+        self.session = mock.Mock()
+        self.session.monitor = {
+            "left": 100, "top": 50, "width": 1920, "height": 1080
+        }
+
+        def grab(region):
+            shot = mock.Mock()
+            shot.size = (region["width"], region["height"])
+            shot.raw = bytearray(region["width"] * region["height"] * 4)
+            return shot
+
+        self.session.grab.side_effect = grab
+        self.capture = ScreenCapture(self.session)
+
+    def test_region_offset_by_monitor(self):
+        """Test that regions are relative to the captured monitor"""
+        img = self.capture.capture_region_to_memory(10, 20, 300, 200)
+
+        self.assertEqual(img.size, (300, 200))
+        self.session.grab.assert_called_once_with(
+            {"left": 110, "top": 70, "width": 300, "height": 200}
+        )
+
+    def test_region_clipped_to_monitor(self):
+        """Test that regions crossing the monitor edge are clipped"""
+        img = self.capture.capture_region_to_memory(-50, 1000, 300, 300)
+
+        self.assertEqual(img.size, (250, 80))
+
+
+if __name__ == "__main__":
+    unittest.main()
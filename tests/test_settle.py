@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for settle module
+"""
+
+import time
+import unittest
+
+import numpy as np
+
+from src.frame import Frame
+from src.settle import ScreenSettler
+
+
+class ScriptedScreenCapture:
+    """Returns frames whose brightness follows a script, then repeats the last"""
+
+    def __init__(self, values):
+        self.values = list(values)
+        self.grabs = 0
+        self.regions = []
+
+    def _frame(self):
+        index = min(self.grabs, len(self.values) - 1)
+        self.grabs += 1
+        return Frame(np.full((64, 64, 4), self.values[index], dtype=np.uint8))
+
+    def capture_frame(self):
+        return self._frame()
+
+    def capture_region(self, *region):
+        self.regions.append(region)
+        return self._frame()
+
+
+class DelayedChangeCapture:
+    """Static screen that changes once a delay has passed"""
+
+    def __init__(self, delay):
+        self.changes_at = time.monotonic() + delay
+
+    def capture_frame(self):
+        value = 200 if time.monotonic() >= self.changes_at else 40
+        return Frame(np.full((64, 64, 4), value, dtype=np.uint8))
+
+    def capture_region(self, *region):
+        return self.capture_frame()
+
+
+class TestScreenSettler(unittest.TestCase):
+    """Tests for ScreenSettler class"""
+
+    def make_settler(self, capture):
+        return ScreenSettler(
+            capture,
+            stable_samples=3,
+            poll_interval=0.001,
+            min_wait=0.0
+        )
+
+    def test_static_screen_settles_quickly(self):
+        """Test that a static screen settles after the stable samples"""
+        capture = ScriptedScreenCapture([40])
+        result = self.make_settler(capture).wait(timeout=1.0)
+
+        self.assertTrue(result)
+        self.assertEqual(result.samples, 4)
+        self.assertLess(result.elapsed, 0.5)
+
+    def test_waits_for_changes_to_stop(self):
+        """Test that stability is counted after the last change"""
+        capture = ScriptedScreenCapture([40, 120, 200, 40])
+        result = self.make_settler(capture).wait(timeout=1.0)
+
+        self.assertTrue(result)
+        self.assertEqual(result.samples, 7)
+
+    def test_timeout(self):
+        """Test that a constantly changing screen times out"""
+        capture = ScriptedScreenCapture([40, 200] * 1000)
+        result = self.make_settler(capture).wait(timeout=0.05)
+
+        self.assertFalse(result)
+        self.assertGreaterEqual(result.elapsed, 0.05)
+
+    def test_region(self):
+        """Test that a region is sampled instead of the full screen"""
+        capture = ScriptedScreenCapture([40])
+        result = self.make_settler(capture).wait(1.0, region=(1, 2, 30, 40))
+
+        self.assertTrue(result)
+        self.assertEqual(capture.regions[0], (1, 2, 30, 40))
+
+    def test_slow_reaction_is_not_taken_for_no_change(self):
+        """Test that a change 150ms after a click is waited for"""
+        settler = ScreenSettler(
+            DelayedChangeCapture(0.15),
+            stable_samples=3,
+            poll_interval=0.01,
+            min_wait=0.1
+        )
+        result = settler.wait(timeout=0.6, require_change=True)
+
+        self.assertTrue(result)
+        self.assertGreaterEqual(result.elapsed, 0.15)
+        self.assertEqual(result.frame.pixels[0, 0, 0], 200)
+
+    def test_required_change_that_never_comes_waits_full_timeout(self):
+        """Test that a static screen isn't declared settled after a click"""
+        capture = ScriptedScreenCapture([40])
+        result = self.make_settler(capture).wait(timeout=0.1, require_change=True)
+
+        self.assertFalse(result)
+        self.assertGreaterEqual(result.elapsed, 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()